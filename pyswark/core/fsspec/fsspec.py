@@ -39,6 +39,8 @@ from pyswark.core.fsspec import fix
 IMPLEMENTATIONS = {
     **fix.IMPLEMENTATIONS,
     "pyswark": "pyswark.core.fsspec.implementations.PyswarkFileSystem",
+    "cas": "pyswark.core.fsspec.implementations.CasFileSystem",
+    "mem": "pyswark.core.fsspec.implementations.MemFileSystem",
 }
 [ _fsspec.register_implementation( *i ) for i in IMPLEMENTATIONS.items() ]
 
@@ -1,8 +1,10 @@
 import functools
 import pydrive2.fs
 from fsspec.implementations.local import LocalFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
 
 from pyswark.core.fsspec import fix
+from pyswark.core.io.memory import LruStore
 
 
 def path(func):
@@ -68,3 +70,43 @@ class PyswarkFileSystem( Base, LocalFileSystem ):
     e.g. ``data/df.csv`` → ``<pyswark_root>/data/df.csv``.
     """
     protocol = 'pyswark'
+
+
+class CasFileSystem( LocalFileSystem ):
+    """Local filesystem over the content-addressed store of :mod:`pyswark.core.io.cas`.
+
+    ``cas://<digest>.<ext>`` resolves to the blob's location in the store,
+    e.g. ``<store_root>/3a/3a7b...4f1b.parquet``.
+    """
+    protocol = 'cas'
+
+    @classmethod
+    def _strip_protocol( cls, path ):
+        path = str( path )
+        if path.startswith( 'cas:' ):
+            from pyswark.core.io.cas import STORE
+            return STORE.path( path[ len( 'cas:' ): ].lstrip( '/' ))
+        return super()._strip_protocol( path )
+
+
+class MemFileSystem( MemoryFileSystem ):
+    """In-memory filesystem registered under the ``mem`` protocol.
+
+    Its store is separate from fsspec's ``memory://`` and bounded, evicting
+    the least recently used files; objects stored by reference through
+    :mod:`pyswark.core.io.memory` are reported by ``info`` and ``exists``.
+    """
+    protocol    = 'mem'
+    store       = LruStore()
+    pseudo_dirs = [ '' ]
+
+    @classmethod
+    def _strip_protocol( cls, path ):
+        return super()._strip_protocol( str( path ).removeprefix( 'mem://' ))
+
+    def info( self, path, **kw ):
+        from pyswark.core.io.memory import OBJECTS
+        key = self._strip_protocol( path )
+        if key in OBJECTS:
+            return { 'name': key, 'size': OBJECTS.sizeOf( key ), 'type': 'object' }
+        return super().info( path, **kw )
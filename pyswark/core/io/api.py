@@ -11,6 +11,9 @@ Supported URI Schemes
 - ``file:`` - Local filesystem (e.g., ``file:./data.csv``)
 - ``python:`` - Python objects by import path (e.g., ``python://mymodule.MyClass``)
 - ``http:``/``https:`` - Remote URLs
+- ``cas:`` - Content-addressed blobs (e.g., ``cas://<sha256>.parquet``)
+- ``mem:`` - In-process data; objects by reference, or serialized by extension (e.g., ``mem://step1/prices.csv``)
+- ``sqlite:`` and other SQLAlchemy urls - Tables (e.g., ``sqlite:///prices.db?table=ohlc``)
 
 Example
 -------
@@ -32,8 +35,11 @@ Example
 >>> # Verbosity automatically restored
 """
 
+from pathlib import Path
+
 from pyswark.core.io.iohandler import IoHandler
 from pyswark.core.io import guess as _guess
+from pyswark.core.io import filesystems as _filesystems
 from pyswark.util.log import (
     set_verbosity as _set_verbosity,
     get_verbosity as _get_verbosity,
@@ -57,12 +63,15 @@ def read( uri, datahandler=None, **kw ):
         - ``file:./path/to/file.csv`` - Local file
         - ``python://module.Class`` - Python object
         - ``https://example.com/data.json`` - Remote URL
+        - ``file:./prices/date=*/part-*.parquet`` - Partitioned dataset (glob or directory)
         
     datahandler : str, optional
         Override the automatic datahandler selection.
     **kw
         Additional keyword arguments passed to the underlying reader
-        (e.g., ``index_col=0`` for pandas).
+        (e.g., ``index_col=0`` for pandas, or ``filters=[('date', '>=', '2024-01-01')]``
+        for a partitioned dataset). Text and url handlers accept ``start`` and
+        ``end`` to read only that byte range.
 
     Returns
     -------
@@ -72,6 +81,7 @@ def read( uri, datahandler=None, **kw ):
     Example
     -------
     >>> config = read('file:./config.yaml')
+    >>> header = read('file:./large.txt', end=1024)
     """
     contents = IoHandler( uri=uri, datahandler=datahandler, kw=kw )
     return contents.read()
@@ -86,11 +96,13 @@ def write( data, uri, datahandler=None, **kw ):
     data : Any
         The data to write.
     uri : str
-        The destination URI. Supports ``file:`` scheme for local files.
+        The destination URI. Supports ``file:`` scheme for local files; a
+        directory URI (``file:./out/``) writes a partitioned dataset.
     datahandler : str, optional
         Override the automatic datahandler selection.
     **kw
-        Additional keyword arguments passed to the underlying writer.
+        Additional keyword arguments passed to the underlying writer
+        (e.g., ``partition_by=['date'], max_workers=4`` for a dataset).
 
     Returns
     -------
@@ -101,11 +113,98 @@ def write( data, uri, datahandler=None, **kw ):
     -------
     >>> write(df, 'file:./output.csv', index=False)
     >>> write(config, 'file:./config.yaml')
+    >>> write(df, 'file:./out/', partition_by=['date'])
     """
     contents = IoHandler( uri=uri, datahandler=datahandler, kw=kw )
     return contents.write( data )
 
 
+def readMany( uris, datahandler=None, max_workers=None, **kw ):
+    """
+    Read many URIs concurrently.
+
+    Remote urls share the keep-alive sessions of
+    :mod:`pyswark.core.io.pool`, bounded per host.
+
+    Parameters
+    ----------
+    uris : list[str]
+        The URIs to read from.
+    datahandler : str, optional
+        Override the automatic datahandler selection.
+    max_workers : int, optional
+        Number of threads used to read concurrently.
+    **kw
+        Additional keyword arguments passed to each reader.
+
+    Returns
+    -------
+    list
+        The loaded data, in the order of ``uris``.
+
+    Example
+    -------
+    >>> pages = readMany(['https://example.com/a', 'https://example.com/b'])
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    uris = list( uris )
+    if not uris:
+        return []
+
+    max_workers = max_workers or min( 32, len( uris ) )
+    with ThreadPoolExecutor( max_workers=max_workers ) as executor:
+        return list( executor.map( lambda uri: read( uri, datahandler=datahandler, **kw ), uris ))
+
+
+def readTail( uri, nbytes, datahandler=None, **kw ):
+    """
+    Read the last ``nbytes`` of a URI, i.e. the tail of a growing log.
+
+    Equivalent to ``read( uri, start=-nbytes )``; honoured by handlers
+    that support byte ranges (text files and urls).
+
+    Parameters
+    ----------
+    uri : str
+        The URI to read from.
+    nbytes : int
+        The number of bytes to read from the end of the file.
+    datahandler : str, optional
+        Override the automatic datahandler selection.
+
+    Example
+    -------
+    >>> lines = readTail('file:./service.log', 4096).splitlines()
+    """
+    return read( uri, datahandler=datahandler, start=-nbytes, **kw )
+
+
+def readBytes( uri, start=None, end=None, datahandler=None ):
+    """
+    Read the raw bytes of a URI, or only the range [start, end).
+
+    Remote backends issue an HTTP Range request instead of downloading
+    the whole file.
+
+    Parameters
+    ----------
+    uri : str
+        The URI to read from.
+    start : int, optional
+        First byte; negative values count back from the end.
+    end : int, optional
+        Byte to stop before; negative values count back from the end.
+    datahandler : str, optional
+        Override the automatic datahandler selection.
+
+    Example
+    -------
+    >>> header = readBytes('file:./large.csv', end=1024)
+    """
+    return acquire( uri, datahandler=datahandler ).readBytes( start, end )
+
+
 def acquire( uri, datahandler=None ):
     """
     Acquire a file handle or connection for a URI without reading.
@@ -129,6 +228,87 @@ def acquire( uri, datahandler=None ):
     return contents.acquire()
 
 
+def exists( uris, max_workers=None ):
+    """
+    Check whether one or many URIs exist.
+
+    Handlers share one filesystem per protocol and username, and uris in
+    the same directory are answered from a single (cached) listing, so
+    catalog-wide health checks cost few remote round trips.
+
+    Parameters
+    ----------
+    uris : str or list[str]
+        The URI, or URIs, to check.
+    max_workers : int, optional
+        Number of threads used for uris that cannot be batched.
+
+    Returns
+    -------
+    bool or list[bool]
+        One result per uri, or a single bool for a single uri.
+
+    Example
+    -------
+    >>> exists(['file:./a.csv', 'file:./b.csv'])
+    [True, False]
+    """
+    if isinstance( uris, ( str, Path )):
+        return _filesystems.exists([ str( uris ) ], max_workers=max_workers )[0]
+    return _filesystems.exists( list( uris ), max_workers=max_workers )
+
+
+def stat( uris, max_workers=None ):
+    """
+    File metadata of one or many URIs.
+
+    Parameters
+    ----------
+    uris : str or list[str]
+        The URI, or URIs, to stat.
+    max_workers : int, optional
+        Number of threads used for uris that cannot be batched.
+
+    Returns
+    -------
+    dict or list[dict]
+        The fsspec info dict (``name``, ``size``, ``type``, ...) of each
+        uri, or None where it does not exist.
+
+    Example
+    -------
+    >>> stat('file:./data.csv')['size']
+    1024
+    """
+    if isinstance( uris, ( str, Path )):
+        return _filesystems.stat([ str( uris ) ], max_workers=max_workers )[0]
+    return _filesystems.stat( list( uris ), max_workers=max_workers )
+
+
+def ls( uri, detail=False ):
+    """
+    List the contents of a directory URI.
+
+    Parameters
+    ----------
+    uri : str
+        The directory URI.
+    detail : bool, optional
+        Return the fsspec info dicts instead of uris.
+
+    Returns
+    -------
+    list
+        The uris (or info dicts) directly inside the directory.
+
+    Example
+    -------
+    >>> ls('file:./data/')
+    ['file:///abs/path/data/a.csv', 'file:///abs/path/data/b.csv']
+    """
+    return _filesystems.ls( str( uri ), detail=detail )
+
+
 def isUri( uri ):
     """
     Check if a string is a valid pyswark URI.
@@ -150,11 +330,30 @@ def isUri( uri ):
     >>> isUri('/plain/path/data.csv')
     False
     """
-    try:
-        guess( uri )
-        return True
-    except ValueError:
-        return False
+    return _guess.tryGet( uri ) is not None
+
+
+def isUriMany( uris ):
+    """
+    Check many strings at once; each distinct string is parsed once.
+
+    Parameters
+    ----------
+    uris : list[str]
+        The strings to validate.
+
+    Returns
+    -------
+    list[bool]
+        True for each string that is a recognized URI.
+
+    Example
+    -------
+    >>> isUriMany(['file:./data.csv', '{"a": 1}'])
+    [True, False]
+    """
+    return [ g.valid for g in _guess.many( uris ) ]
+
 
 def guess( uri ):
     return _guess.api( uri )
@@ -1,6 +1,7 @@
-from pyswark.core import fsspec
+from fsspec.core import OpenFile
+
 from pyswark.core.models.uri.base import UriModel
-from pyswark.core.io import decorate
+from pyswark.core.io import decorate, filesystems
 
 
 class Log(decorate.Log):
@@ -17,17 +18,33 @@ class AbstractDataHandler:
     MODE_W = 'w'
 
     def __init__( self, uri ):
-        self.uri = UriModel( uri )
+        self.uri       = UriModel( uri )
+        self._resolved = None
 
     @property
     def path(self):
         return self.uri.path
 
     def exists(self):
-        return self.fs.exists( self.path )
-
-    def open( self, *args, **kwargs ):
-        return fsspec.open( self.uri.fsspec, *args, **kwargs )
+        fs, path = self.resolve()
+        return fs.exists( path )
+
+    def stat(self):
+        fs, path = self.resolve()
+        return fs.info( path )
+
+    def resolve(self):
+        """ the shared filesystem of the uri, and the path within it """
+        if self._resolved is None:
+            self._resolved = filesystems.resolve( self.uri )
+        return self._resolved
+
+    def open( self, mode='rb', compression=None, encoding=None, errors=None, newline=None, **kwargs ):
+        # storage options have their own shared filesystem
+        fs, path = filesystems.resolve( self.uri, **kwargs ) if kwargs else self.resolve()
+        if 'r' not in mode:
+            fs.makedirs( fs._parent( path ), exist_ok=True )
+        return OpenFile( fs, path, mode, compression=compression, encoding=encoding, errors=errors, newline=newline )
 
     @Log.decorate('r')
     def read( self, **kwargs ):
@@ -60,12 +77,67 @@ class AbstractDataHandler:
 
     @Log.decorate('rm')
     def rm(self):
-        return self.fs.rm( self.path )
+        fs, path = self.resolve()
+        return fs.rm( path )
 
     @property
     def fs(self):
-        return self.open().fs
+        return self.resolve()[0]
+
+    def readBytes( self, start=None, end=None, **kw ):
+        """
+        Raw bytes of the uri, or of the range [start, end).
+
+        Negative offsets count back from the end of the file, like python
+        slices; remote filesystems issue a range request instead of a full
+        download.
+        """
+        fs, path = self.resolve()
+        return fs.cat_file( path, start=start, end=end, **kw )
+
+
+class MixinRange:
+    """ honours read( start=..., end=... ) by reading only that byte range """
+    ENCODING = 'utf-8'
+
+    def _readWithContext( self, start=None, end=None, **kwargs ):
+        if start is None and end is None:
+            return super()._readWithContext( **kwargs )
+
+        data = self.readBytes( start, end, **kwargs )
+        if 'b' in self.MODE_R:
+            return data
+
+        # a range may split a multi-byte character at either edge
+        return data.decode( self.ENCODING, errors='replace' )
 
 
 class CannotOverwrite( Exception ):
-    pass
\ No newline at end of file
+    pass
+
+
+# fsspec info fields that change with the contents of a source
+SIGNATURE = (
+    'size',
+    'mtime',
+    'LastModified',
+    'last_modified',
+    'ETag',
+    'etag',
+    'Content-MD5',
+    'Digest',
+)
+
+
+def signature( handler ):
+    """ the fields of the source's info that change with its contents, or None if it cannot be stat'ed """
+    try:
+        info = handler.stat()
+    except Exception:
+        return None
+
+    if not isinstance( info, dict ):
+        return None
+
+    sig = tuple( info.get( field ) for field in SIGNATURE )
+    return sig if any( field is not None for field in sig ) else None
\ No newline at end of file
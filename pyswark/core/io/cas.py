@@ -0,0 +1,166 @@
+"""
+Content-Addressed Store
+=======================
+
+Blobs stored once under the sha256 digest of their serialized bytes, in a
+local store (``$PYSWARK_CAS``, by default ``~/.cache/pyswark/cas``).
+
+Writing to ``cas:`` serializes the data with the handler of the given
+extension, hashes it, and keeps it only if the digest is new; the digest
+uri is returned. Identical outputs therefore cost no extra disk. Reading
+a digest uri verifies the bytes before parsing them.
+
+Example
+-------
+>>> from pyswark.core.io import api
+>>> uri = api.write( df, 'cas:', ext='parquet' )
+>>> uri
+'cas://3a7bd3e2360a3d29eea436fcfb7e44c735d117c42d1c1835420b6b9942dd4f1b.parquet'
+>>> df = api.read( uri )
+"""
+import os
+import uuid
+import hashlib
+
+from pyswark.core.io import base
+
+
+CHUNK = 1 << 20
+
+
+class Store:
+    """
+    A local directory of blobs, i.e. ``root/3a/3a7b...4f1b.parquet``.
+
+    Parameters
+    ----------
+    root : str, optional
+        The store directory; defaults to ``$PYSWARK_CAS`` or ``~/.cache/pyswark/cas``.
+    """
+
+    def __init__( self, root=None ):
+        self.root = root or os.environ.get( 'PYSWARK_CAS' ) or os.path.join( os.path.expanduser( '~' ), '.cache', 'pyswark', 'cas' )
+
+    def configure( self, root ):
+        self.root = root
+
+    def path( self, name ):
+        """ the location of the blob named <digest>.<ext> """
+        digest = name.partition( '.' )[0]
+        return os.path.join( self.root, digest[:2], name )
+
+    def tempPath( self, ext='' ):
+        os.makedirs( os.path.join( self.root, 'tmp' ), exist_ok=True )
+        name = f'{ uuid.uuid4().hex }.{ ext }' if ext else uuid.uuid4().hex
+        return os.path.join( self.root, 'tmp', name )
+
+    def put( self, path, ext='' ):
+        """ moves the file at path into the store, unless its digest is already there """
+        digest = hashFile( path )
+        name   = f'{ digest }.{ ext }' if ext else digest
+        dst    = self.path( name )
+
+        if os.path.exists( dst ):
+            os.remove( path )
+        else:
+            os.makedirs( os.path.dirname( dst ), exist_ok=True )
+            os.replace( path, dst )
+
+        return name
+
+
+def hashFile( path ):
+    """ the sha256 hex digest of a file, read in chunks """
+    h = hashlib.sha256()
+    with open( path, 'rb' ) as f:
+        for chunk in iter( lambda: f.read( CHUNK ), b'' ):
+            h.update( chunk )
+    return h.hexdigest()
+
+
+class Cas( base.AbstractDataHandler ):
+    """ cas://<digest>.<ext>, with the payload read by the handler of <ext> """
+
+    @property
+    def name(self):
+        return self.uri.Path.name if self.uri.Path else ''
+
+    @property
+    def digest(self):
+        return self.name.partition( '.' )[0]
+
+    @property
+    def ext(self):
+        return self.name.partition( '.' )[2]
+
+    @base.Log.decorate('r')
+    def read( self, verify=True, datahandler=None, **kw ):
+        """
+        Parameters
+        ----------
+        verify : bool, optional
+            Check the blob against its digest before parsing it.
+        datahandler : str, optional
+            Handler of the payload, instead of guessing from the extension.
+        **kw
+            Passed to the handler of the payload.
+        """
+        _, path = self.resolve()
+        if not self.digest or not os.path.exists( path ):
+            raise FileNotFoundError( self.uri.inputs.uri )
+
+        if verify and hashFile( path ) != self.digest:
+            raise CorruptBlob( self.uri.inputs.uri )
+
+        from pyswark.core.io.iohandler import IoHandler
+        return IoHandler( uri=path, datahandler=datahandler, kw=kw ).read()
+
+    @base.Log.decorate('w')
+    def write( self, data, overwrite=False, ext=None, datahandler=None, **kw ):
+        """
+        Store the data and return its digest uri.
+
+        Parameters
+        ----------
+        data : Any
+            The data to store.
+        overwrite : bool, optional
+            Ignored; a digest always names the same bytes.
+        ext : str, optional
+            Extension selecting the serializer, i.e. ``'parquet'``; defaults
+            to the extension of the uri, i.e. ``cas://.parquet``.
+        datahandler : str, optional
+            Handler of the payload, instead of guessing from ``ext``.
+        **kw
+            Passed to the handler of the payload.
+
+        Returns
+        -------
+        str
+            The digest uri, i.e. ``cas://<sha256>.parquet``.
+        """
+        ext = ext or self.ext
+        if not ( ext or datahandler ):
+            raise ValueError( f"an ext or a datahandler is needed to serialize to { self.uri.inputs.uri= }" )
+
+        from pyswark.core.io.iohandler import IoHandler
+        path = STORE.tempPath( ext )
+        try:
+            IoHandler( uri=path, datahandler=datahandler, kw=kw ).write( data, overwrite=True )
+            name = STORE.put( path, ext )
+        finally:
+            if os.path.exists( path ):
+                os.remove( path )
+
+        return f'{ self.uri.scheme }://{ name }'
+
+
+class CorruptBlob( Exception ):
+    pass
+
+
+STORE = Store()
+
+
+def configure( root ):
+    return STORE.configure( root )
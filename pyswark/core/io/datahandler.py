@@ -1,7 +1,6 @@
-import pydoc
-from pyswark.lib.aenum import AliasEnum, Alias
+from pyswark.lib.aenum import AliasEnum, Alias, AliasEnumError
 from pyswark.core import io
-from pyswark.core.io import base
+from pyswark.core.io import base, registry
 
 
 class DataHandler( AliasEnum ):
@@ -10,6 +9,8 @@ class DataHandler( AliasEnum ):
     DF_CSV      = f'{ _ROOT }.df.Csv', Alias("df.csv")
     DF_CSV_GZ   = f'{ _ROOT }.df.CsvGzip', Alias("df.csv.gz")
     DF_PARQUET  = f'{ _ROOT }.df.Parquet', Alias("df.parquet")
+    NPY         = f'{ _ROOT }.numpy.Npy', Alias("npy")
+    NPZ         = f'{ _ROOT }.numpy.Npz', Alias("npz")
     JSON        = f'{ _ROOT }.json.Json', Alias("json")
     PJSON       = f'{ _ROOT }.json.Pjson', Alias("pjson")
     YAML_DOC    = f'{ _ROOT }.yaml.YamlDoc', Alias([ "yaml", "doc.yaml" ])
@@ -19,17 +20,26 @@ class DataHandler( AliasEnum ):
     TEXT        = f'{ _ROOT }.text.Text', Alias("file.text")
     GLUEDB      = f'{ _ROOT }.json.Pjson', Alias("gluedb")
     STRING      = f'{ _ROOT }.string.String', Alias("string")
+    DATASET     = f'{ _ROOT }.dataset.Dataset', Alias("dataset")
+    CAS         = f'{ _ROOT }.cas.Cas', Alias("cas")
+    SQL         = f'{ _ROOT }.sql.Sql', Alias("sql")
+    MEM         = f'{ _ROOT }.memory.Mem', Alias("mem")
 
     @classmethod
     def get( cls, name ):
-        klass = super().get( name ).klass
+        try:
+            klass = super().get( name ).klass
+        except AliasEnumError:
+            klass = registry.get( name )
+            if klass is None:
+                raise
         if not ( klass and issubclass( klass, base.AbstractDataHandler ) ):
             raise ValueError( f"Invalid handler for entry = '{ name }' : '{ klass }'" )
         return klass
 
     @property
     def klass(self):
-        return pydoc.locate( self.path )
+        return registry.locate( self.path )
 
     @property
     def path(self):
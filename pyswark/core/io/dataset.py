@@ -0,0 +1,292 @@
+"""
+Partitioned Datasets
+====================
+
+Reads many files behind a single glob or directory URI as one DataFrame,
+e.g. ``file:./prices/date=*/part-*.parquet`` or ``file:./shards/``.
+
+Matching files are expanded through the fsspec filesystem, read in
+parallel with the handler guessed from each file's extension, and
+concatenated. Hive-style ``key=value`` directories become columns, and
+``filters`` prune files by those partition values before they are opened;
+filters on any other column are applied to the rows of each file read.
+
+Writing to a directory URI splits the frame by ``partition_by`` into the
+same ``key=value`` layout, one group at a time.
+
+Example
+-------
+>>> from pyswark.core.io import api
+>>> df = api.read( 'file:./prices/date=*/part-*.parquet' )
+>>> df = api.read( 'file:./prices/', filters=[ ('date', '>=', '2024-01-01') ] )
+>>> api.write( df, 'file:./prices/', partition_by=['date'], max_workers=4 )
+"""
+import os
+import operator
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import pandas
+
+from pyswark.core.io import base
+
+
+OPERATORS = {
+    '=='     : operator.eq,
+    '='      : operator.eq,
+    '!='     : operator.ne,
+    '<'      : operator.lt,
+    '<='     : operator.le,
+    '>'      : operator.gt,
+    '>='     : operator.ge,
+    'in'     : lambda value, values: value in values,
+    'not in' : lambda value, values: value not in values,
+}
+
+DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+def hasMagic( path ):
+    """ True if the path contains glob characters """
+    return any( c in path for c in '*?[' )
+
+
+def isDataset( uri ):
+    """ True if the parsed uri points to a glob or a directory """
+    return bool( hasMagic( uri.path or '' ) or uri.uri.endswith(( '/', os.sep )) )
+
+
+class Dataset( base.AbstractDataHandler ):
+    """ i.e. /path/to/dir/, /path/to/key=*/part-*.parquet """
+
+    @property
+    def root(self):
+        """ the static prefix of the uri, before any glob characters """
+        parts = []
+        for part in self.uri.fsspec.rstrip( '/' ).split( '/' ):
+            if hasMagic( part ):
+                break
+            parts.append( part )
+        return '/'.join( parts ) or '/'
+
+    @property
+    def fs(self):
+        """ the shared filesystem of the dataset """
+        return self.resolve()[0]
+
+    def exists(self):
+        return bool( self.ls() )
+
+    def ls(self):
+        """ lists the data files of the dataset """
+        fs      = self.fs
+        root    = fs._strip_protocol( self.root )
+        pattern = self.uri.fsspec
+
+        if hasMagic( pattern ):
+            paths = fs.glob( fs._strip_protocol( pattern ))
+        else:
+            paths = fs.find( root )
+
+        return sorted( p for p in paths if not _isHidden( p, root ))
+
+    @base.Log.decorate('r')
+    def read( self, filters=None, max_workers=None, datahandler=None, **kw ):
+        """
+        Read all matching files into one DataFrame.
+
+        Parameters
+        ----------
+        filters : list[tuple], optional
+            Filters, i.e. ``[ ('date', '>=', '2024-01-01') ]``; every filter
+            must hold. Those on partition keys skip whole files, the others
+            are applied to the rows of the files read.
+        max_workers : int, optional
+            Number of threads used to read files concurrently.
+        datahandler : str, optional
+            Handler for every file, instead of guessing from its extension.
+        **kw
+            Passed to the handler of each file.
+        """
+        paths = self.ls()
+        if not paths:
+            raise FileNotFoundError( self.uri.inputs.uri )
+
+        root    = self.fs._strip_protocol( self.root )
+        parts   = [ ( path, partitions( path, root )) for path in paths ]
+        keys    = set().union( *( p for _, p in parts ))
+        filters = filters or []
+        onRows  = [ f for f in filters if f[0] not in keys ]
+
+        parts = [ ( path, p ) for path, p in parts if _keep( p, filters ) ]
+        if not parts:
+            return pandas.DataFrame()
+
+        def readOne( args ):
+            path, p = args
+            return _filterRows( _assign( self._readFile( path, datahandler, **kw ), p ), onRows )
+
+        with ThreadPoolExecutor( max_workers=max_workers ) as executor:
+            frames = list( executor.map( readOne, parts ))
+
+        return pandas.concat( frames )
+
+    def _readFile( self, path, datahandler=None, **kw ):
+        from pyswark.core.io.iohandler import IoHandler
+        uri = self.fs.unstrip_protocol( path )
+        return IoHandler( uri=uri, datahandler=datahandler, kw=kw ).read()
+
+    @base.Log.decorate('w')
+    def write( self, data, overwrite=False, partition_by=None, max_workers=None, ext='parquet', datahandler=None, **kw ):
+        """
+        Write a DataFrame as a partitioned dataset.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The frame to write.
+        overwrite : bool, optional
+            Remove the existing files of the dataset first.
+        partition_by : list[str], optional
+            Columns to partition by, i.e. ``root/date=2024-01-01/part-0.parquet``.
+        max_workers : int, optional
+            Number of partitions written concurrently; also bounds how many
+            partitions are held in memory at once.
+        ext : str, optional
+            Extension of the part files, which selects their handler.
+        datahandler : str, optional
+            Handler for every part file, instead of guessing from ``ext``.
+        **kw
+            Passed to the handler of each part file.
+
+        Returns
+        -------
+        list[str]
+            The uris of the written part files.
+        """
+        if self.exists():
+            if not overwrite:
+                raise base.CannotOverwrite( self.uri.inputs.uri )
+            self.rm()
+
+        partition_by = [ partition_by ] if isinstance( partition_by, str ) else list( partition_by or [] )
+        root         = self.fs._strip_protocol( self.root )
+        max_workers  = max_workers or min( 32, ( os.cpu_count() or 1 ) + 4 )
+
+        def writeOne( args ):
+            keys, group = args
+            path = '/'.join([ root, *partitionDirs( partition_by, keys ), f'part-0.{ ext }' ])
+            uri  = self.fs.unstrip_protocol( path )
+            self._writeFile( group.drop( columns=partition_by ), uri, datahandler, **kw )
+            return uri
+
+        written, pending = [], set()
+        with ThreadPoolExecutor( max_workers=max_workers ) as executor:
+            for args in _groups( data, partition_by ):
+                if len( pending ) >= max_workers:
+                    done, pending = wait( pending, return_when=FIRST_COMPLETED )
+                    written += [ f.result() for f in done ]
+                pending.add( executor.submit( writeOne, args ))
+            written += [ f.result() for f in pending ]
+
+        return sorted( written )
+
+    def _writeFile( self, data, uri, datahandler=None, **kw ):
+        from pyswark.core.io.iohandler import IoHandler
+        return IoHandler( uri=uri, datahandler=datahandler, kw=kw ).write( data )
+
+    @base.Log.decorate('rm')
+    def rm(self):
+        return self.fs.rm( self.ls() )
+
+
+def partitions( path, root='' ):
+    """ i.e. root/date=2024-01-01/region=us/part-0.parquet -> { 'date': '2024-01-01', 'region': 'us' } """
+    if root and path.startswith( root ):
+        path = path[ len( root ): ]
+
+    *dirs, _ = path.strip( '/' ).split( '/' )
+    return dict( d.split( '=', 1 ) for d in dirs if '=' in d )
+
+
+def partitionDirs( partition_by, keys ):
+    """ i.e. ['date'], ('2024-01-01',) -> ['date=2024-01-01'] """
+    keys = keys if isinstance( keys, tuple ) else ( keys, )
+    return [ f'{ k }={ _format( v ) }' for k, v in zip( partition_by, keys ) ]
+
+
+def _groups( data, partition_by ):
+    """ yields one group at a time, so partitions are not all built up front """
+    if not partition_by:
+        yield (), data
+        return
+    yield from data.groupby( partition_by, sort=False, dropna=False )
+
+
+def _format( value ):
+    if pandas.isna( value ):
+        return DEFAULT_PARTITION
+    if isinstance( value, pandas.Timestamp ) and value == value.normalize():
+        return value.strftime( '%Y-%m-%d' )
+    return str( value )
+
+
+def _keep( partition, filters ):
+    for key, op, value in filters:
+        if key not in partition:
+            continue
+        if not OPERATORS[ op ]( _cast( partition[ key ], value ), value ):
+            return False
+    return True
+
+
+def _filterRows( df, filters ):
+    """ applies the filters on columns that are not partition keys to the rows of df """
+    for key, op, value in filters:
+        if key not in df.columns:
+            raise ValueError( f"cannot filter on '{ key }', neither a partition key nor a column" )
+
+        column = df[ key ]
+        if op in ( 'in', 'not in' ):
+            mask = column.isin( list( value ))
+            mask = mask if op == 'in' else ~mask
+        else:
+            mask = OPERATORS[ op ]( column, value )
+        df = df[ mask ]
+    return df
+
+
+def _cast( string, value ):
+    """ casts the partition string to the type of the filter value """
+    if isinstance( value, ( list, tuple, set )):
+        value = next( iter( value ), string )
+    if isinstance( value, ( bool, str )) or value is None:
+        return string
+    try:
+        return type( value )( string )
+    except ( TypeError, ValueError ):
+        return string
+
+
+def _assign( df, partition ):
+    for key, value in partition.items():
+        if key not in df.columns:
+            df[ key ] = _infer( value )
+    return df
+
+
+def _infer( string ):
+    if string == DEFAULT_PARTITION:
+        return None
+    for cast in ( int, float ):
+        try:
+            return cast( string )
+        except ValueError:
+            continue
+    return string
+
+
+def _isHidden( path, root='' ):
+    """ i.e. _SUCCESS, .part-0.crc, _temporary/part-0.parquet """
+    if root and path.startswith( root ):
+        path = path[ len( root ): ]
+    return any( part.startswith(( '.', '_' )) for part in path.strip( '/' ).split( '/' ))
@@ -16,6 +16,7 @@ class AbstractDecorator:
 
 
 class Kwargs( AbstractDecorator ):
+    OPTIONS = () # handler options, passed alongside the payload rather than replacing it
 
     def __init__( self, name, mode ):
         super().__init__( mode )
@@ -33,10 +34,11 @@ class Kwargs( AbstractDecorator ):
 
             @functools.wraps(func)
             def wrapper( slf, *a, **kw ):
-                name = slf.__class__.__name__
-                o    = cls( name, mode )
-                kw   = kw or o.payload
-                return func( slf, *a, **kw )
+                name    = slf.__class__.__name__
+                o       = cls( name, mode )
+                options = { k: kw.pop( k ) for k in cls.OPTIONS if k in kw }
+                kw      = kw or o.payload
+                return func( slf, *a, **kw, **options )
 
             return wrapper
         return decorator
@@ -1,9 +1,12 @@
+import json
+
 import pandas
 
-from pyswark.core.io import decorate, base
+from pyswark.core.io import decorate, base, memory
 
 
 class Kwargs(decorate.Kwargs):
+    OPTIONS = ( 'engine', 'schema' )
 
     _CSV = {
         'r': { 'index_col': 0, },
@@ -21,38 +24,185 @@ class Kwargs(decorate.Kwargs):
     }
 
 
-class Csv( base.AbstractDataHandler ):
+class Schema:
+    """
+    Cache of the dtypes inferred on the first read of a csv uri.
+
+    Later reads pass them explicitly, skipping inference and keeping the
+    dtypes stable across files and chunks. With ``persist=True`` the
+    schema is also kept beside the file, i.e. ``dir/.data.csv.schema.json``.
+
+    A schema holds the signature (size, mtime, ETag, ...) of the file it
+    was inferred from, and is inferred again once the file changes; a
+    write through the handler drops it.
+    """
+    SUFFIX = '.schema.json'
+
+    _CACHE = memory.LruStore( max_items=1024 ) # uri -> Schema
+
+    def __init__( self, dtype, parse_dates, stamp=None ):
+        self.dtype       = dtype
+        self.parse_dates = parse_dates
+        self.stamp       = stamp
+
+    @classmethod
+    def infer( cls, df, stamp=None ):
+        dtypes = dict( df.dtypes.items() )
+        for name in df.index.names:
+            if name is not None:
+                dtypes[ name ] = df.index.get_level_values( name ).dtype
+
+        dtype, parse_dates = {}, []
+        for name, d in dtypes.items():
+            if pandas.api.types.is_datetime64_any_dtype( d ):
+                parse_dates.append( name )
+            else:
+                dtype[ name ] = str( d )
+        return cls( dtype, parse_dates, stamp=stamp )
+
+    @staticmethod
+    def stampOf( handler ):
+        """ the signature of the file of handler, as json-able strings, or None """
+        sig = base.signature( handler )
+        return None if sig is None else [ str( field ) for field in sig ]
+
+    def asKwargs( self, usecols=None ):
+        """ the read_csv kwargs, limited to usecols (column names or a callable) """
+        if usecols is None:
+            return { 'dtype': self.dtype, 'parse_dates': self.parse_dates }
+
+        keep = usecols if callable( usecols ) else set( usecols ).__contains__
+        return {
+            'dtype'       : { name: d for name, d in self.dtype.items() if keep( name ) },
+            'parse_dates' : [ name for name in self.parse_dates if keep( name ) ],
+        }
+
+    @classmethod
+    def get( cls, handler, stamp, persist=False ):
+        """ the schema of the file of handler, if inferred from the file as it is at stamp """
+        key    = handler.uri.fsspec
+        schema = cls._CACHE.get( key )
+
+        if schema is None and persist:
+            fs, path = cls._sidecar( handler )
+            if fs.exists( path ):
+                with fs.open( path, 'r' ) as f:
+                    schema = cls( **json.load( f ) )
+
+        if schema is None or schema.stamp != stamp:
+            cls._CACHE.pop( key, None )
+            return None
+
+        cls._CACHE[ key ] = schema
+        return schema
+
+    @classmethod
+    def put( cls, handler, df, stamp, persist=False ):
+        schema = cls.infer( df, stamp=stamp )
+        cls._CACHE[ handler.uri.fsspec ] = schema
+
+        if persist:
+            fs, path = cls._sidecar( handler )
+            with fs.open( path, 'w' ) as f:
+                json.dump({ **schema.asKwargs(), 'stamp': stamp }, f, indent=2 )
+
+        return schema
+
+    @classmethod
+    def invalidate( cls, handler ):
+        """ drops the schema of the file of handler, and its sidecar """
+        cls._CACHE.pop( handler.uri.fsspec, None )
+
+        fs, path = cls._sidecar( handler )
+        if fs.exists( path ):
+            fs.rm( path )
+
+    @classmethod
+    def _sidecar( cls, handler ):
+        """ i.e. dir/data.csv -> dir/.data.csv.schema.json, hidden from datasets """
+        fs, path = handler.resolve()
+        root, _, name = path.rpartition( '/' )
+        return fs, f'{ root }/.{ name }{ cls.SUFFIX }'
+
+    @classmethod
+    def clear( cls ):
+        cls._CACHE.clear()
+
+
+class MixinCsv:
+    """ csv reads with an engine option and a cached schema """
+
+    def _readCsv( self, fp, schema=False, **kw ):
+        """
+        Parameters
+        ----------
+        schema : bool or str, optional
+            ``True`` caches the inferred dtypes per uri and passes them on
+            later reads; ``'persist'`` also keeps them beside the file.
+        **kw
+            Passed to ``pandas.read_csv``, i.e. ``engine='pyarrow'`` for the
+            multithreaded pyarrow parser.
+        """
+        if not schema:
+            return pandas.read_csv( fp, **kw )
+
+        persist = schema == 'persist'
+        stamp   = Schema.stampOf( self )
+        cached  = Schema.get( self, stamp, persist=persist )
+        usecols = kw.get( 'usecols' )
+        full    = usecols is None and kw.get( 'names' ) is None
+
+        # the schema is by header name; positions and renamed columns can't be matched
+        byName = kw.get( 'names' ) is None and (
+            usecols is None or callable( usecols ) or all( isinstance( c, str ) for c in usecols )
+        )
+        if cached and byName:
+            kw = { **cached.asKwargs( usecols ), **kw }
+
+        df = pandas.read_csv( fp, **kw )
+
+        if cached is None and full and isinstance( df, pandas.DataFrame ):
+            Schema.put( self, df, stamp, persist=persist )
+
+        return df
+
+    def _writeCsv( self, data, fp, **kw ):
+        Schema.invalidate( self )
+        data.to_csv( fp, **kw )
+
+
+class Csv( MixinCsv, base.AbstractDataHandler ):
 
     @Kwargs.decorate('r')
     def _read( self, fp, **kw ):
-        return pandas.read_csv( fp, **kw )
+        return self._readCsv( fp, **kw )
 
     @Kwargs.decorate('w')
     def _write( self, data, fp, **kw ):
-        data.to_csv( fp, **kw )
+        self._writeCsv( data, fp, **kw )
 
 
-class CsvGzip( base.AbstractDataHandler ):
+class CsvGzip( MixinCsv, base.AbstractDataHandler ):
     """ csv gzip """
     MODE_R = 'rt'
     MODE_W = 'wt'
 
     @Kwargs.decorate('r')
     def _readWithContext( self, compression=None, **kwargs ):
-        with self.open( self.MODE_R, compression=compression, **kwargs ) as fp:
+        with self.open( self.MODE_R, compression=compression ) as fp:
             result = self._read( fp, **kwargs )
         return result
 
     @Kwargs.decorate('w')
     def _writeWithContext( self, data, compression=None, **kwargs ):
-        with self.open( self.MODE_W, compression=compression, **kwargs ) as fp:
+        with self.open( self.MODE_W, compression=compression ) as fp:
             self._write( data, fp, **kwargs )
 
     def _read( self, fp, **kw ):
-        return pandas.read_csv( fp, **kw )
+        return self._readCsv( fp, **kw )
 
     def _write( self, data, fp, **kw ):
-        data.to_csv( fp, **kw )
+        self._writeCsv( data, fp, **kw )
 
 
 class Parquet(base.AbstractDataHandler):
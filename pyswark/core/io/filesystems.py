@@ -0,0 +1,161 @@
+"""
+Shared Filesystems
+==================
+
+Resolves the fsspec filesystem of a uri once per protocol, username and
+storage options, and reuses it for every handler, instead of building an
+``OpenFile`` (and looking up credentials) on each ``exists``, ``rm`` or
+``open`` call.
+
+The username stands in for the storage options of its sekret, and the
+options passed by the caller are keyed in full. ``clear( protocol )``
+forgets the filesystems of a protocol, i.e. after its sekrets change.
+
+Batched metadata operations group uris by filesystem and parent directory,
+listing each directory once through fsspec's listing cache.
+
+Example
+-------
+>>> from pyswark.core.io import filesystems
+>>> fs, path = filesystems.resolve( 'file:./data.csv' )
+>>> filesystems.exists([ 'file:./a.csv', 'file:./b.csv' ])
+[True, False]
+"""
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from fsspec.core import split_protocol
+
+from pyswark.core import fsspec
+from pyswark.core.models.uri.base import UriModel
+
+
+_FILESYSTEMS = {}
+_LOCK        = threading.Lock()
+
+
+def resolve( uri, **storage_options ):
+    """
+    The (filesystem, path) of a uri.
+
+    Parameters
+    ----------
+    uri : str or UriModel
+        The uri to resolve.
+    **storage_options
+        Passed to the filesystem, along with those of the uri's sekret.
+
+    Returns
+    -------
+    tuple
+        The shared filesystem instance and the path within it.
+    """
+    uri   = uri if isinstance( uri, UriModel ) else UriModel( uri )
+    url   = uri.fsspec
+    key   = ( split_protocol( url )[0] or 'file', uri.username, _normalize_options( storage_options ))
+    entry = _FILESYSTEMS.get( key )
+
+    if entry is None:
+        fp = fsspec.open( url, **storage_options )
+        with _LOCK:
+            # schemes with a credential/path fix (i.e. pyswark:, gdrive2:) re-map
+            # each path, so only the filesystem is reused for them
+            entry = _FILESYSTEMS.setdefault( key, ( fp.fs, fp.fs._strip_protocol( url ) == fp.path ))
+        return entry[0], fp.path
+
+    fs, standard = entry
+    path = fs._strip_protocol( url ) if standard else fsspec.open( url, **storage_options ).path
+    return fs, path
+
+
+def clear( protocol=None ):
+    """ forgets the resolved filesystems, or only those of protocol """
+    with _LOCK:
+        if protocol is None:
+            _FILESYSTEMS.clear()
+        else:
+            for key in [ key for key in _FILESYSTEMS if key[0] == protocol ]:
+                del _FILESYSTEMS[ key ]
+
+
+def _normalize_options( options ):
+    """ storage options as a hashable key, the same whatever their order """
+    return json.dumps( options, sort_keys=True, default=repr ) if options else ''
+
+
+def stat( uris, max_workers=None ):
+    """
+    The info dicts of many uris, with None for the missing ones.
+
+    Uris sharing a parent directory are answered from one listing of it;
+    the rest are looked up concurrently.
+    """
+    resolved = [ resolve( uri ) for uri in uris ]
+    infos    = [ None ] * len( resolved )
+
+    groups = {}
+    for i, ( fs, path ) in enumerate( resolved ):
+        groups.setdefault(( id( fs ), fs._parent( path )), [] ).append( i )
+
+    pending = []
+    for ( _, parent ), indices in groups.items():
+        fs      = resolved[ indices[0] ][0]
+        listing = _listing( fs, parent ) if len( indices ) > 1 else None
+
+        for i in indices:
+            if listing is None:
+                pending.append( i )
+            else:
+                infos[ i ] = listing.get( _normalize( fs, resolved[ i ][1] ))
+
+    def info( i ):
+        fs, path = resolved[ i ]
+        try:
+            return fs.info( path )
+        except ( FileNotFoundError, OSError ):
+            return None
+
+    if pending:
+        max_workers = max_workers or min( 32, len( pending ))
+        with ThreadPoolExecutor( max_workers=max_workers ) as executor:
+            for i, result in zip( pending, executor.map( info, pending )):
+                infos[ i ] = result
+
+    return infos
+
+
+def exists( uris, max_workers=None ):
+    """ whether each of many uris exists """
+    return [ info is not None for info in stat( uris, max_workers=max_workers ) ]
+
+
+def ls( uri, detail=False ):
+    """ the uris (or info dicts) directly inside a directory uri """
+    fs, path = resolve( uri )
+    entries  = fs.ls( path, detail=True )
+    if detail:
+        return entries
+    return sorted( fs.unstrip_protocol( entry['name'] ) for entry in entries )
+
+
+def _listing( fs, parent ):
+    """ the entries of parent by path, or None when it cannot be listed """
+    if 'http' in _protocols( fs ):
+        return None # a page's links are not its directory listing
+    try:
+        entries = fs.ls( parent, detail=True )
+    except ( FileNotFoundError, NotADirectoryError ):
+        return {}
+    except OSError:
+        return None
+    return { _normalize( fs, entry['name'] ): entry for entry in entries }
+
+
+def _normalize( fs, path ):
+    return fs._strip_protocol( path ).rstrip( '/' )
+
+
+def _protocols( fs ):
+    protocol = fs.protocol
+    return ( protocol, ) if isinstance( protocol, str ) else protocol
@@ -1,21 +1,14 @@
+from typing import NamedTuple, Optional
+
 from pyswark.lib.aenum import AliasEnum, Alias
+from pyswark.core.io import registry, dataset
 from pyswark.core.io.datahandler import DataHandler
 from pyswark.core.models.uri.base import UriModel
 
 
 def api( uri ):
     """  api for guesses based on uri """
-    model  = UriModel( uri )
-    ext    = model.Ext
-    scheme = model.scheme
-
-    klass = None
-
-    if klass is None:
-        klass = Ext.tryGet( ext.full, klass )
-
-    if klass is None:
-        klass = Scheme.tryGet( scheme, klass )
+    klass = tryGet( uri )
 
     if klass is None:
         raise ValueError( f"Handler not found for {uri=}" )
@@ -23,6 +16,71 @@ def api( uri ):
     return klass
 
 
+def tryGet( uri ):
+    """ the handler class of uri, or None if there is none """
+    parsed = UriModel.tryParse( uri )
+    return None if parsed is None else _guess( parsed )
+
+
+class Guess( NamedTuple ):
+    uri    : str
+    parsed : Optional[ object ]
+    klass  : Optional[ type ]
+
+    @property
+    def valid(self):
+        return self.klass is not None
+
+
+def many( uris ):
+    """
+    Classifies many uris in one pass, each distinct uri parsed and guessed
+    once; invalid uris get ``klass=None`` rather than raising.
+    """
+    uris    = list( uris )
+    parsed  = UriModel.parseMany( uris ) # by position, so unhashable inputs are fine
+    klasses = {}
+    for p in parsed:
+        if p is not None and p not in klasses:
+            klasses[ p ] = _guess( p )
+    return [ Guess( uri, p, None if p is None else klasses[ p ] ) for uri, p in zip( uris, parsed ) ]
+
+
+def _guess( parsed ):
+    scheme = parsed.scheme
+    ext    = parsed.Ext.full if parsed.Ext else ''
+    byScheme = _SCHEMES.get( scheme )
+
+    if byScheme is None and _isDataset( parsed, ext ):
+        return DataHandler.DATASET.klass
+
+    path = _EXTS.get( ext )
+    if path is not None:
+        return registry.locate( path )
+
+    klass = registry.getByExt( ext )
+    if klass is not None:
+        return klass
+
+    if byScheme is not None:
+        return registry.locate( byScheme )
+
+    return registry.getByScheme( scheme )
+
+
+def _isDataset( parsed, ext ):
+    """
+    a directory, or a glob that is plainly a path: with a file scheme, or
+    with a separator and an extension a handler reads, so text such as
+    ``'a*b'`` or ``'[1, 2]'`` is not taken for one
+    """
+    if not dataset.isDataset( parsed ):
+        return False
+    if not dataset.hasMagic( parsed.path or '' ) or parsed.uri.startswith( 'file:' ):
+        return True
+    return '/' in parsed.path and ( ext in _EXTS or registry.getByExt( ext ) is not None )
+
+
 # == guesses based on criteria embedded in the uri ==
 
 class _AliasEnum( AliasEnum ):
@@ -45,6 +103,8 @@ class Ext( _AliasEnum ):
     CSV       = DataHandler.DF_CSV, Alias('csv')
     CSV_GZ    = DataHandler.DF_CSV_GZ, Alias('csv.gz')
     PARQUET   = DataHandler.DF_PARQUET, Alias('parquet')
+    NPY       = DataHandler.NPY, Alias('npy')
+    NPZ       = DataHandler.NPZ, Alias('npz')
     JSON      = DataHandler.JSON, Alias('json')
     PJSON     = DataHandler.PJSON, Alias('pjson')
     GLUEDB    = DataHandler.GLUEDB, Alias('gluedb')
@@ -56,3 +116,11 @@ class Ext( _AliasEnum ):
 class Scheme( _AliasEnum ):
     HTTP   = DataHandler.URL, Alias(['http', 'https'])
     PYTHON = DataHandler.PYTHON, Alias('python')
+    CAS    = DataHandler.CAS, Alias('cas')
+    MEM    = DataHandler.MEM, Alias('mem')
+    SQL    = DataHandler.SQL, Alias(['sqlite', 'postgresql', 'mysql', 'mssql', 'oracle'])
+
+
+# alias -> handler path, so lookups are a dict access
+_EXTS    = Ext.toMapping( 'path' )
+_SCHEMES = Scheme.toMapping( 'path' )
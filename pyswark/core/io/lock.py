@@ -0,0 +1,181 @@
+"""
+Locks
+=====
+
+Locks for sharing data between threads and between processes.
+
+- ``RWLock`` - many readers or one writer, within a process.
+- ``FileLock`` - an advisory lock on a local file, shared by readers and
+  exclusive to a writer, held on a ``<path>.lock`` file next to it.
+  Processes that do not take the lock are not kept out. Files on other
+  filesystems, and platforms without ``fcntl``, are not locked.
+
+Example
+-------
+>>> from pyswark.core.io import api, lock
+>>> with lock.FileLock( 'file:./catalog.gluedb' ):
+...     db = api.read( 'file:./catalog.gluedb' )
+...     db.post( 'file:./prices.csv', name='prices' )
+...     api.write( db, 'file:./catalog.gluedb', overwrite=True )
+"""
+import os
+import time
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError: # windows
+    fcntl = None
+
+
+class RWLock:
+    """
+    Many readers or one writer. The writer may take the lock again, and
+    read, without blocking itself; a reader may not upgrade to a writer.
+    Once a writer is waiting, new readers wait behind it, so a steady
+    stream of reads cannot starve it; a thread already reading may read
+    again.
+    """
+
+    def __init__( self ):
+        self._cond    = threading.Condition()
+        self._readers = {} # thread -> depth
+        self._writer  = None
+        self._depth   = 0
+        self._waiting = 0
+
+    @contextmanager
+    def read( self ):
+        me = threading.get_ident()
+        if self._writer == me:
+            yield
+            return
+
+        with self._cond:
+            if me not in self._readers:
+                while self._writer is not None or self._waiting:
+                    self._cond.wait()
+            self._readers[ me ] = self._readers.get( me, 0 ) + 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers[ me ] -= 1
+                if not self._readers[ me ]:
+                    del self._readers[ me ]
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write( self ):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me:
+                self._waiting += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._waiting -= 1
+                    self._cond.notify_all()
+                self._writer = me
+            self._depth += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._depth -= 1
+                if not self._depth:
+                    self._writer = None
+                    self._cond.notify_all()
+
+    def __deepcopy__( self, memo ):
+        return RWLock()
+
+    def __reduce__( self ):
+        return RWLock, ()
+
+
+class FileLock:
+    """
+    An advisory lock on the local file of a uri.
+
+    Parameters
+    ----------
+    uri : str
+        The file to lock; it need not exist.
+    shared : bool, optional
+        Take a shared (read) lock instead of an exclusive (write) one.
+    timeout : float, optional
+        Seconds to wait for the lock before raising ``TimeoutError``;
+        None waits for as long as it takes.
+    """
+    POLL = 0.01
+
+    def __init__( self, uri, shared=False, timeout=None ):
+        self.uri     = uri
+        self.shared  = shared
+        self.timeout = timeout
+        self._fd     = None
+
+    @property
+    def path(self):
+        """ the lock file, or None if the uri is not a local file """
+        path = localPath( self.uri )
+        return None if path is None else f'{ path }.lock'
+
+    def acquire( self ):
+        path = self.path
+        if path is None or fcntl is None:
+            return self
+
+        os.makedirs( os.path.dirname( path ) or '.', exist_ok=True )
+        fd   = os.open( path, os.O_RDWR | os.O_CREAT, 0o644 )
+        mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        try:
+            self._flock( fd, mode )
+        except BaseException:
+            os.close( fd )
+            raise
+
+        self._fd = fd
+        return self
+
+    def _flock( self, fd, mode ):
+        if self.timeout is None:
+            return fcntl.flock( fd, mode )
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                return fcntl.flock( fd, mode | fcntl.LOCK_NB )
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError( f"could not lock { self.uri= } within { self.timeout= }s" )
+                time.sleep( self.POLL )
+
+    def release( self ):
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            fcntl.flock( fd, fcntl.LOCK_UN )
+            os.close( fd )
+
+    def __enter__( self ):
+        return self.acquire()
+
+    def __exit__( self, exc_type, exc_val, exc_tb ):
+        self.release()
+        return False
+
+
+def localPath( uri ):
+    """ the local path of uri, or None if it is not a local file """
+    from pyswark.core.io import api
+    try:
+        fs, path = api.acquire( uri ).resolve()
+    except Exception:
+        return None
+
+    protocol = fs.protocol if isinstance( fs.protocol, ( tuple, list )) else ( fs.protocol, )
+    return path if 'file' in protocol else None
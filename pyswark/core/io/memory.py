@@ -0,0 +1,197 @@
+"""
+In-Memory Data
+==============
+
+``mem://`` uris exchange data within a process, without touching disk.
+
+- ``mem://step1/prices.csv`` - with an extension, the data is serialized
+  by the handler of that extension into fsspec's memory filesystem.
+- ``mem://step1/prices`` - without one (or with ``datahandler='mem'``),
+  the object itself is stored by reference and returned as-is.
+
+Both stores are bounded by item count and bytes, evicting the least
+recently used entries first whenever an entry is stored.
+
+Example
+-------
+>>> from pyswark.core.io import api, memory
+>>> memory.configure( max_bytes=2**30 )   # max_items is left as it is
+>>> memory.configure( max_bytes=None )    # unbounded again
+>>> api.write( df, 'mem://step1/prices' )
+>>> api.read( 'mem://step1/prices' ) is df
+True
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+from pyswark.core.io import base
+
+
+UNCHANGED = object() # a bound configure leaves as it is
+
+
+class LruStore( OrderedDict ):
+    """
+    A dict bounded by item count and total bytes, evicting the least
+    recently used entries.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        Maximum number of entries.
+    max_bytes : int, optional
+        Maximum total size of the entries, as measured by ``sizeof``.
+    """
+
+    def __init__( self, max_items=None, max_bytes=None ):
+        super().__init__()
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._nbytes   = 0
+        self._sizes    = {}
+        self._lock     = threading.RLock()
+
+    def __getitem__( self, key ):
+        with self._lock:
+            value = super().__getitem__( key )
+            self.move_to_end( key )
+            return value
+
+    def get( self, key, default=None ):
+        with self._lock:
+            try:
+                return self[ key ]
+            except KeyError:
+                return default
+
+    def __setitem__( self, key, value ):
+        with self._lock:
+            if key in self:
+                self.__delitem__( key )
+            super().__setitem__( key, value )
+            self._sizes[ key ] = size = sizeof( value )
+            self._nbytes      += size
+            self._evict( keep=key )
+
+    def __delitem__( self, key ):
+        with self._lock:
+            super().__delitem__( key )
+            self._nbytes -= self._sizes.pop( key, 0 )
+
+    def pop( self, key, *default ):
+        with self._lock:
+            if key not in self:
+                if default:
+                    return default[0]
+                raise KeyError( key )
+            value = super().__getitem__( key )
+            self.__delitem__( key )
+            return value
+
+    def clear( self ):
+        with self._lock:
+            super().clear()
+            self._sizes.clear()
+            self._nbytes = 0
+
+    @property
+    def nbytes(self):
+        with self._lock:
+            self._measure()
+            return self._nbytes
+
+    def sizeOf( self, key ):
+        return self._sizes[ key ]
+
+    def _measure( self ):
+        """ re-measures file-like entries, which grow after they are stored """
+        for key, value in list( super().items() ):
+            if hasattr( value, 'getbuffer' ):
+                size = sizeof( value )
+                self._nbytes      += size - self._sizes[ key ]
+                self._sizes[ key ] = size
+
+    def configure( self, max_items=UNCHANGED, max_bytes=UNCHANGED ):
+        """ sets the bounds given, None for unbounded, and evicts down to them """
+        with self._lock:
+            if max_items is not UNCHANGED:
+                self.max_items = max_items
+            if max_bytes is not UNCHANGED:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def _evict( self, keep=None ):
+        """ drops the oldest entries until within bounds; the newest entry is always kept """
+        if self.max_bytes is not None:
+            self._measure()
+        while len( self ) > 1 and self._full():
+            key = next( iter( self ))
+            if key == keep:
+                break
+            self.__delitem__( key )
+            self.evictions += 1
+
+    def _full( self ):
+        tooMany  = self.max_items is not None and len( self ) > self.max_items
+        tooLarge = self.max_bytes is not None and self._nbytes > self.max_bytes
+        return tooMany or tooLarge
+
+
+def sizeof( obj ):
+    """ the approximate size of obj in bytes """
+    if hasattr( obj, 'memory_usage' ): # pandas
+        usage = obj.memory_usage( deep=True )
+        return int( getattr( usage, 'sum', lambda: usage )() )
+    if hasattr( obj, 'nbytes' ): # numpy
+        return int( obj.nbytes )
+    if hasattr( obj, 'getbuffer' ): # fsspec MemoryFile
+        return obj.getbuffer().nbytes
+    return sys.getsizeof( obj )
+
+
+OBJECTS = LruStore()
+
+
+class Mem( base.AbstractDataHandler ):
+    """ mem://path/to/name, python objects stored by reference """
+
+    @property
+    def key(self):
+        return self.resolve()[1]
+
+    def exists(self):
+        return self.key in OBJECTS
+
+    @base.Log.decorate('r')
+    def read( self, **kw ):
+        try:
+            return OBJECTS[ self.key ]
+        except KeyError:
+            raise FileNotFoundError( self.uri.inputs.uri )
+
+    @base.Log.decorate('w')
+    def write( self, data, overwrite=False, **kw ):
+        if not overwrite and self.exists():
+            raise base.CannotOverwrite( self.uri.inputs.uri )
+        OBJECTS[ self.key ] = data
+
+    @base.Log.decorate('rm')
+    def rm(self):
+        OBJECTS.pop( self.key, None )
+
+
+def configure( max_items=UNCHANGED, max_bytes=UNCHANGED ):
+    """ bounds both the object store and the in-memory filesystem; None removes a bound """
+    from pyswark.core.fsspec.implementations import MemFileSystem
+    OBJECTS.configure( max_items=max_items, max_bytes=max_bytes )
+    MemFileSystem.store.configure( max_items=max_items, max_bytes=max_bytes )
+
+
+def clear():
+    """ empties both the object store and the in-memory filesystem """
+    from pyswark.core.fsspec.implementations import MemFileSystem
+    OBJECTS.clear()
+    MemFileSystem.store.clear()
+    MemFileSystem.pseudo_dirs[:] = [ '' ]
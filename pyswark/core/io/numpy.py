@@ -0,0 +1,43 @@
+import numpy
+from fsspec.implementations.local import LocalFileSystem
+
+from pyswark.core.io import base
+
+
+class Npy( base.AbstractDataHandler ):
+    """ i.e. /path/to/array.npy; mmap_mode='r' memory-maps local files """
+    MODE_R = 'rb'
+    MODE_W = 'wb'
+
+    def _readWithContext( self, mmap_mode=None, **kw ):
+        path = self._localPath() if mmap_mode else None
+        if path:
+            return numpy.load( path, mmap_mode=mmap_mode, **kw )
+        return super()._readWithContext( **kw )
+
+    def _localPath( self ):
+        """ the local path, or None when the file cannot be memory-mapped """
+        fp = self.open( self.MODE_R )
+        if isinstance( fp.fs, LocalFileSystem ) and not fp.compression:
+            return fp.path
+
+    def _read( self, fp, **kw ):
+        return numpy.load( fp, **kw )
+
+    def _write( self, data, fp, allow_pickle=False, **kw ):
+        numpy.save( fp, numpy.asarray( data ), allow_pickle=allow_pickle, **kw )
+
+
+class Npz( base.AbstractDataHandler ):
+    """ i.e. /path/to/arrays.npz, read as a dict of arrays """
+    MODE_R = 'rb'
+    MODE_W = 'wb'
+
+    def _read( self, fp, **kw ):
+        with numpy.load( fp, **kw ) as npz:
+            return dict( npz )
+
+    def _write( self, data, fp, compressed=False, **kw ):
+        arrays = { k: numpy.asarray( v ) for k, v in data.items() }
+        save   = numpy.savez_compressed if compressed else numpy.savez
+        save( fp, **arrays, **kw )
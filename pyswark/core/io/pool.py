@@ -0,0 +1,179 @@
+"""
+HTTP Session Pool
+=================
+
+Shared, keep-alive HTTP sessions for the ``Url`` datahandler.
+
+One ``requests.Session`` is kept per host, so repeated and concurrent
+fetches reuse TCP/TLS connections instead of paying the handshake per
+url. Concurrency per host is bounded, and timeouts and retries are
+configurable at runtime.
+
+Example
+-------
+>>> from pyswark.core.io import pool
+>>> pool.configure( timeout=10, max_per_host=4 )
+>>> pages = pool.fetchAll([ 'https://example.com/a', 'https://example.com/b' ])
+"""
+import threading
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool:
+    """
+    Per-host ``requests.Session`` objects with bounded concurrency.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Seconds to wait for a connection and for each read.
+    max_per_host : int, optional
+        Maximum concurrent requests (and pooled connections) per host.
+    retries : int, optional
+        Retries on connection errors, passed to ``HTTPAdapter``.
+    """
+
+    def __init__( self, timeout=30, max_per_host=8, retries=0 ):
+        self.timeout      = timeout
+        self.max_per_host = max_per_host
+        self.retries      = retries
+        self._lock        = threading.Lock()
+        self._sessions    = {}
+        self._semaphores  = {}
+
+    def configure( self, timeout=None, max_per_host=None, retries=None ):
+        """ updates the settings; open sessions are closed and rebuilt on next use """
+        with self._lock:
+            if timeout is not None:
+                self.timeout = timeout
+            if max_per_host is not None:
+                self.max_per_host = max_per_host
+            if retries is not None:
+                self.retries = retries
+            self._close()
+
+    def session( self, url ):
+        """ the shared session for the host of url """
+        host = _host( url )
+        with self._lock:
+            if host not in self._sessions:
+                self._sessions[ host ]   = self._newSession()
+                self._semaphores[ host ] = threading.BoundedSemaphore( self.max_per_host )
+            return self._sessions[ host ], self._semaphores[ host ]
+
+    def _newSession( self ):
+        adapter = HTTPAdapter(
+            pool_connections = 1,
+            pool_maxsize     = self.max_per_host,
+            max_retries      = self.retries,
+        )
+        session = requests.Session()
+        session.mount( 'http://', adapter )
+        session.mount( 'https://', adapter )
+        return session
+
+    def request( self, method, url, **kw ):
+        """
+        Sends a request through the host's session, within its concurrency
+        bound. A 404 raises FileNotFoundError and a 401 or 403
+        PermissionError, as fsspec does; other errors raise HTTPError.
+        """
+        session, semaphore = self.session( url )
+        kw.setdefault( 'timeout', self.timeout )
+        with semaphore:
+            response = session.request( method, url, **kw )
+
+        if response.status_code == 404:
+            raise FileNotFoundError( url )
+        if response.status_code in ( 401, 403 ):
+            raise PermissionError( f"{ response.status_code } { response.reason }: { url }" )
+        response.raise_for_status()
+        return response
+
+    def fetch( self, url, start=None, end=None, headers=None, **kw ):
+        """
+        The body of url as bytes, or only the range [start, end).
+
+        Ranges are sent as an http Range header; servers that ignore it
+        are handled by slicing the full body.
+        """
+        if start is not None and start == end:
+            return b''
+
+        headers = dict( headers or {} )
+        rng     = _range( start, end )
+        if rng:
+            headers[ 'Range' ] = rng
+
+        response = self.request( 'GET', url, headers=headers, **kw )
+        content  = response.content
+
+        if ( start is not None or end is not None ) and response.status_code != 206:
+            content = content[ start:end ]
+
+        return content
+
+    def fetchAll( self, urls, max_workers=None, **kw ):
+        """ fetches many urls concurrently, returning their bodies in order """
+        urls = list( urls )
+        if not urls:
+            return []
+
+        max_workers = max_workers or min( 32, len( urls ) )
+        with ThreadPoolExecutor( max_workers=max_workers ) as executor:
+            return list( executor.map( lambda url: self.fetch( url, **kw ), urls ))
+
+    def close( self ):
+        """ closes every pooled session """
+        with self._lock:
+            self._close()
+
+    def _close( self ):
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+        self._semaphores.clear()
+
+
+def _host( url ):
+    parts = urlsplit( url )
+    return f'{ parts.scheme }://{ parts.netloc }'.lower()
+
+
+def _range( start, end ):
+    """ i.e. (10, 15) -> 'bytes=10-14', (-3, None) -> 'bytes=-3'; None if it needs the size """
+    if start is None and end is None:
+        return None
+
+    if start is not None and start < 0:
+        return f'bytes={ start }' if end is None else None
+
+    start = start or 0
+    if end is None:
+        return f'bytes={ start }-'
+    if end < 0:
+        return None
+    return f'bytes={ start }-{ end - 1 }'
+
+
+POOL = SessionPool()
+
+
+def configure( timeout=None, max_per_host=None, retries=None ):
+    return POOL.configure( timeout=timeout, max_per_host=max_per_host, retries=retries )
+
+
+def fetch( url, start=None, end=None, **kw ):
+    return POOL.fetch( url, start=start, end=end, **kw )
+
+
+def fetchAll( urls, max_workers=None, **kw ):
+    return POOL.fetchAll( urls, max_workers=max_workers, **kw )
+
+
+def close():
+    return POOL.close()
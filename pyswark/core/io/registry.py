@@ -0,0 +1,212 @@
+"""
+Datahandler Registry
+====================
+
+Open registry of datahandlers, populated by pyswark itself and by
+third-party packages through ``importlib.metadata`` entry points.
+
+Handlers are registered by import path and are only imported on first
+use; the resolved class is cached afterwards.
+
+An extension or scheme maps to one handler. Registering a second handler
+for it raises ``ValueError``; an entry point that conflicts with an
+earlier binding is ignored with a ``RuntimeWarning``.
+
+Entry Point Groups
+------------------
+- ``pyswark.datahandlers`` - handler name -> ``module:Class``
+- ``pyswark.datahandlers.ext`` - file extension -> ``module:Class``
+- ``pyswark.datahandlers.scheme`` - uri scheme -> ``module:Class``
+
+Example
+-------
+In the ``pyproject.toml`` of a plugin package::
+
+    [project.entry-points."pyswark.datahandlers"]
+    "myformat" = "mypackage.io:MyFormat"
+
+    [project.entry-points."pyswark.datahandlers.ext"]
+    "myf" = "mypackage.io:MyFormat"
+
+or, at runtime:
+
+>>> from pyswark.core.io import registry
+>>> registry.register( 'myformat', 'mypackage.io.MyFormat', ext='myf' )
+>>> registry.get( 'myformat' )
+<class 'mypackage.io.MyFormat'>
+"""
+import pydoc
+import warnings
+import threading
+from importlib import metadata
+
+
+GROUP        = 'pyswark.datahandlers'
+GROUP_EXT    = f'{ GROUP }.ext'
+GROUP_SCHEME = f'{ GROUP }.scheme'
+
+
+class Registry:
+    """
+    Maps handler names, extensions and schemes to lazily imported classes.
+
+    Targets are either dotted import paths (``'pkg.module.Class'``) or
+    entry points; neither is imported until the handler is requested.
+    """
+
+    def __init__( self ):
+        self._handlers   = {}
+        self._exts       = {}
+        self._schemes    = {}
+        self._klasses    = {}
+        self._discovered = False
+        self._fromEps    = [] # ( mapping, key ) bound by discover
+        self._lock       = threading.RLock()
+
+    def register( self, name, target, ext=None, scheme=None ):
+        """
+        Register a handler by name, with optional extensions and schemes.
+
+        Parameters
+        ----------
+        name : str
+            The datahandler name, i.e. ``api.read( uri, datahandler=name )``.
+        target : str or EntryPoint or type
+            Import path, entry point or class of the handler.
+        ext : str or list[str], optional
+            File extension(s) resolved to this handler.
+        scheme : str or list[str], optional
+            Uri scheme(s) resolved to this handler.
+        """
+        with self._lock:
+            if name in self._handlers:
+                raise ValueError( f'{ name= } already registered' )
+
+            for mapping, keys in [( self._exts, ext ), ( self._schemes, scheme )]:
+                for key in _keys( keys ):
+                    if _conflicts( mapping.get( key ), target ):
+                        raise ValueError( f'{ key= } already bound to { _path( mapping[ key ] ) }' )
+
+            self._handlers[ name ] = target
+            self._bind( self._exts, ext, target )
+            self._bind( self._schemes, scheme, target )
+
+    def _bind( self, mapping, keys, target, fromEp=False ):
+        """ binds each key to target; a key bound to another target keeps it, with a warning """
+        for key in _keys( keys ):
+            bound = mapping.get( key )
+            if bound is None:
+                mapping[ key ] = target
+                if fromEp:
+                    self._fromEps.append(( mapping, key ))
+            elif _conflicts( bound, target ):
+                warnings.warn( f'{ key= } is bound to { _path( bound ) }; ignoring { _path( target ) }', RuntimeWarning, stacklevel=3 )
+
+    def get( self, name, default=None ):
+        """ returns the handler class registered under name """
+        return self._get( self._handlers, name, default )
+
+    def getByExt( self, ext, default=None ):
+        """ returns the handler class registered for the extension """
+        return self._get( self._exts, ext, default )
+
+    def getByScheme( self, scheme, default=None ):
+        """ returns the handler class registered for the scheme """
+        return self._get( self._schemes, scheme, default )
+
+    def names( self ):
+        self.discover()
+        return list( self._handlers.keys() )
+
+    def _get( self, mapping, key, default ):
+        self.discover()
+        target = mapping.get( key )
+        if target is None:
+            return default
+        return self.locate( target )
+
+    def locate( self, target ):
+        """ imports the target once and caches the class """
+        if isinstance( target, type ):
+            return target
+
+        key   = getattr( target, 'value', target )
+        klass = self._klasses.get( key )
+
+        if klass is None:
+            with self._lock:
+                klass = self._klasses.get( key )
+                if klass is None:
+                    klass = target.load() if isinstance( target, metadata.EntryPoint ) else pydoc.locate( target )
+                    if klass is not None:
+                        self._klasses[ key ] = klass
+        return klass
+
+    def discover( self ):
+        """ collects the entry points of installed plugins, without importing them """
+        if self._discovered:
+            return
+
+        with self._lock:
+            if self._discovered:
+                return
+
+            for group, mapping in [( GROUP, self._handlers ), ( GROUP_EXT, self._exts ), ( GROUP_SCHEME, self._schemes )]:
+                for ep in _entryPoints( group ):
+                    self._bind( mapping, ep.name, ep, fromEp=True )
+
+            self._discovered = True
+
+    def clear( self ):
+        """ forgets cached classes and entry points, which are re-discovered on next use """
+        with self._lock:
+            for mapping, key in self._fromEps:
+                mapping.pop( key, None )
+            self._fromEps.clear()
+            self._klasses.clear()
+            self._discovered = False
+
+
+def _keys( keys ):
+    return [ keys ] if isinstance( keys, str ) else list( keys or [] )
+
+
+def _path( target ):
+    """ the dotted import path of a target """
+    if isinstance( target, type ):
+        return f'{ target.__module__ }.{ target.__qualname__ }'
+    return getattr( target, 'value', target ).replace( ':', '.' )
+
+
+def _conflicts( bound, target ):
+    return bound is not None and _path( bound ) != _path( target )
+
+
+def _entryPoints( group ):
+    eps = metadata.entry_points()
+    if hasattr( eps, 'select' ):
+        return eps.select( group=group )
+    return eps.get( group, [] ) # python < 3.10
+
+
+REGISTRY = Registry()
+
+
+def register( name, target, ext=None, scheme=None ):
+    return REGISTRY.register( name, target, ext=ext, scheme=scheme )
+
+
+def get( name, default=None ):
+    return REGISTRY.get( name, default )
+
+
+def getByExt( ext, default=None ):
+    return REGISTRY.getByExt( ext, default )
+
+
+def getByScheme( scheme, default=None ):
+    return REGISTRY.getByScheme( scheme, default )
+
+
+def locate( target ):
+    return REGISTRY.locate( target )
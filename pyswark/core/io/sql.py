@@ -0,0 +1,190 @@
+"""
+SQL Tables
+==========
+
+Reads tables and queries of any SQLAlchemy database into DataFrames, and
+bulk-inserts DataFrames into tables.
+
+The table is named in the uri query, i.e. ``sqlite:///prices.db?table=ohlc``;
+the rest of the uri is the SQLAlchemy url. Column projections and
+``where`` predicates are compiled into the SELECT, so only matching rows
+and columns leave the database, and ``chunksize`` streams the result.
+
+Example
+-------
+>>> from pyswark.core.io import api
+>>> df = api.read( 'sqlite:///prices.db?table=ohlc', columns=['date', 'close'], where=[ ('date', '>=', '2024-01-01') ] )
+>>> for chunk in api.read( 'sqlite:///prices.db?table=ohlc', chunksize=100_000 ):
+...     ...
+>>> api.write( df, 'sqlite:///prices.db?table=ohlc', append=True )
+"""
+import threading
+
+import pandas
+import sqlalchemy as sa
+
+from pyswark.core.io import base
+
+
+OPERATORS = {
+    '=='     : lambda column, value: column == value,
+    '='      : lambda column, value: column == value,
+    '!='     : lambda column, value: column != value,
+    '<'      : lambda column, value: column < value,
+    '<='     : lambda column, value: column <= value,
+    '>'      : lambda column, value: column > value,
+    '>='     : lambda column, value: column >= value,
+    'in'     : lambda column, values: column.in_( list( values )),
+    'not in' : lambda column, values: column.not_in( list( values )),
+}
+
+_ENGINES = {}
+_LOCK    = threading.Lock()
+
+
+def engine( url ):
+    """ one engine, and so one connection pool, per database url """
+    e = _ENGINES.get( url )
+    if e is None:
+        with _LOCK:
+            e = _ENGINES.get( url )
+            if e is None:
+                e = _ENGINES[ url ] = sa.create_engine( url )
+    return e
+
+
+def dispose():
+    """ closes the pooled connections of every engine """
+    with _LOCK:
+        for e in _ENGINES.values():
+            e.dispose()
+        _ENGINES.clear()
+
+
+class Sql( base.AbstractDataHandler ):
+    """ i.e. sqlite:///prices.db?table=ohlc, postgresql://host/db?table=ohlc """
+
+    @property
+    def url(self):
+        """ the SQLAlchemy url, without the table """
+        url = sa.engine.make_url( self.uri.inputs.uri )
+        return url.difference_update_query([ 'table' ]).render_as_string( hide_password=False )
+
+    @property
+    def table(self):
+        return sa.engine.make_url( self.uri.inputs.uri ).query.get( 'table' )
+
+    def _table(self):
+        """ the table of the uri, or ValueError if it has none """
+        if not self.table:
+            raise ValueError( f"no table in { self.uri.inputs.uri= }, i.e. ?table=name" )
+        return self.table
+
+    @property
+    def engine(self):
+        return engine( self.url )
+
+    def exists(self):
+        return bool( self.table ) and sa.inspect( self.engine ).has_table( self.table )
+
+    @base.Log.decorate('r')
+    def read( self, columns=None, where=None, params=None, order_by=None, limit=None, chunksize=None, sql=None, **kw ):
+        """
+        Read a table, or a query, into a DataFrame.
+
+        Parameters
+        ----------
+        columns : list[str], optional
+            Columns to select.
+        where : str or list[tuple], optional
+            A SQL predicate, i.e. ``"date >= :start"``, or filters like
+            ``[ ('date', '>=', '2024-01-01') ]``; every filter must hold.
+        params : dict, optional
+            Bound parameters of a SQL ``where`` or ``sql``.
+        order_by : str or list[str], optional
+            Columns to sort by.
+        limit : int, optional
+            Maximum number of rows.
+        chunksize : int, optional
+            Stream the result as an iterator of DataFrames of this many rows.
+        sql : str, optional
+            A full query, instead of the table of the uri.
+        **kw
+            Passed to ``pandas.read_sql``, i.e. ``index_col``, ``parse_dates``.
+        """
+        if sql is not None:
+            stmt = sa.text( sql ).bindparams( **( params or {} ))
+        else:
+            stmt = self._select( columns, where, params, order_by, limit )
+
+        if chunksize:
+            return self._stream( stmt, chunksize, **kw )
+
+        with self.engine.connect() as con:
+            return pandas.read_sql( stmt, con, **kw )
+
+    def _select( self, columns, where, params, order_by, limit ):
+        table = sa.Table( self._table(), sa.MetaData(), autoload_with=self.engine )
+        stmt  = sa.select( *( table.c[ c ] for c in columns )) if columns else sa.select( table )
+
+        if isinstance( where, str ):
+            stmt = stmt.where( sa.text( where ).bindparams( **( params or {} )))
+        else:
+            for key, op, value in where or []:
+                stmt = stmt.where( OPERATORS[ op ]( table.c[ key ], value ))
+
+        if order_by:
+            order_by = [ order_by ] if isinstance( order_by, str ) else order_by
+            stmt     = stmt.order_by( *( table.c[ c ] for c in order_by ))
+
+        if limit is not None:
+            stmt = stmt.limit( limit )
+
+        return stmt
+
+    def _stream( self, stmt, chunksize, **kw ):
+        """ yields chunks, holding a server-side cursor until exhausted """
+        with self.engine.connect().execution_options( stream_results=True ) as con:
+            yield from pandas.read_sql( stmt, con, chunksize=chunksize, **kw )
+
+    @base.Log.decorate('w')
+    def write( self, data, overwrite=False, append=False, index=None, chunksize=10_000, **kw ):
+        """
+        Bulk-insert a DataFrame into the table of the uri.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The rows to insert.
+        overwrite : bool, optional
+            Replace an existing table.
+        append : bool, optional
+            Insert into an existing table.
+        index : bool, optional
+            Write the index as a column; by default only a named or
+            non-range index is written.
+        chunksize : int, optional
+            Rows per batched insert, all within one transaction.
+        **kw
+            Passed to ``DataFrame.to_sql``, i.e. ``dtype``, ``method``.
+        """
+        table = self._table()
+        if self.exists() and not ( overwrite or append ):
+            raise base.CannotOverwrite( self.uri.inputs.uri )
+
+        if index is None:
+            index = not ( isinstance( data.index, pandas.RangeIndex ) and data.index.name is None )
+
+        if_exists = 'append' if append else 'replace'
+        with self.engine.begin() as con:
+            return data.to_sql( table, con, if_exists=if_exists, index=index, chunksize=chunksize, **kw )
+
+    @base.Log.decorate('rm')
+    def rm(self):
+        table = sa.Table( self._table(), sa.MetaData() )
+        with self.engine.begin() as con:
+            table.drop( con, checkfirst=True )
+
+    def readBytes( self, start=None, end=None, **kw ):
+        """ sql tables have no byte representation; read them as DataFrames """
+        raise TypeError( 'sql tables have no byte representation' )
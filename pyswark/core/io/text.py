@@ -1,7 +1,7 @@
 from pyswark.core.io import base
 
 
-class Text(base.AbstractDataHandler):
+class Text( base.MixinRange, base.AbstractDataHandler ):
     """ i.e. /path/to/file.text, /file.txt, /file.anything """
 
     def _read( self, fp, **kw ):
@@ -1,7 +1,30 @@
-from pyswark.core.io import base
+from pyswark.core.io import base, pool
 
 
-class Url( base.AbstractDataHandler ):
+class Url( base.MixinRange, base.AbstractDataHandler ):
+    """ http(s) urls, fetched through the shared keep-alive session pool """
 
-    def _read( self, fp, **kw ):
-        return fp.read( **kw )
+    def _readWithContext( self, start=None, end=None, **kw ):
+        if start is None and end is None:
+            return self.readBytes( **kw ).decode( self.ENCODING )
+        return super()._readWithContext( start=start, end=end, **kw )
+
+    def readBytes( self, start=None, end=None, headers=None, **kw ):
+        options = self._requestKw()
+        headers = { **options.pop( 'headers', {} ), **( headers or {} ) }
+        return pool.fetch( self.uri.fsspec, start=start, end=end, headers=headers, **{ **options, **kw } )
+
+    def _requestKw( self ):
+        """ the headers and auth of the uri's storage options, as requests kwargs """
+        options = self.fs.storage_options
+        client  = options.get( 'client_kwargs' ) or {}
+        headers = { **( client.get( 'headers' ) or {} ), **( options.get( 'headers' ) or {} ) }
+        auth    = options.get( 'auth' ) or client.get( 'auth' )
+
+        if hasattr( auth, 'login' ): # aiohttp.BasicAuth
+            auth = ( auth.login, auth.password )
+
+        kw = { 'headers': headers }
+        if auth is not None:
+            kw[ 'auth' ] = auth
+        return kw
@@ -3,10 +3,11 @@ from functools import singledispatchmethod
 
 from sqlmodel import SQLModel, create_engine, Session, select
 from sqlalchemy.orm import selectinload
-from typing import ClassVar, Union
-from pydantic import Field
+from typing import ClassVar, Literal, Optional, Union
+from pydantic import Field, PrivateAttr
 from pyswark.lib.pydantic import base
 from pyswark.lib import enum
+from pyswark.core.io import lock
 
 from pyswark.core.models import mixin, record, body, info
 
@@ -30,13 +31,22 @@ class MixinDb( base.BaseModel, MixinName ):
     datahandler : str                   = Field( default='pjson', description="Datahandler to use for loading and persisting" )
     engine_url  : str                   = Field( default='sqlite:///:memory:', description="SQLModel engine URL" )
     persist     : bool                  = Field( default=False, description="Persist to .file on context exit" )
+    version     : int                   = Field( default=0, description="Bumped on every persist, to detect concurrent writers" )
+
+    _enum       : Optional[ tuple ] = PrivateAttr( default=None ) # ( names, Enum ) of the last enum built
+    _rwlock     : lock.RWLock       = PrivateAttr( default_factory=lock.RWLock )
+    _base       : tuple             = PrivateAttr( default=() ) # records as of the last load or persist
+    _onConflict : str               = PrivateAttr( default='fail' )
 
     @classmethod
-    def connect( cls, url, datahandler='', persist=False ):
+    def connect( cls, url, datahandler='', persist=False, onConflict='fail' ):
         """
         Connect to a .gluedb (load if exists), use engine_url for SQLModel,
         and optionally persist to the .gluedb file on context exit.
 
+        The file is read under a shared lock, and persisted under an
+        exclusive one, so many processes may share it (see ``persistToFile``).
+
         Parameters
         ----------
         url : str
@@ -46,6 +56,10 @@ class MixinDb( base.BaseModel, MixinName ):
         persist : bool, optional
             If True and url is set, write self to url on successful
             context exit. Default False.
+        onConflict : str, optional
+            On persisting over a file another writer changed since it was
+            read: ``'fail'`` raises ``Conflict``; ``'merge'`` applies the
+            changes made here onto the other writer's records.
 
         Returns
         -------
@@ -66,12 +80,15 @@ class MixinDb( base.BaseModel, MixinName ):
 
         o = cls( url=url, datahandler=datahandler, persist=persist )
 
-        loaded = api.read( o.url, datahandler=o.datahandler )
+        with lock.FileLock( o.url, shared=True ):
+            loaded = api.read( o.url, datahandler=o.datahandler )
 
         if isinstance( loaded, cls ):
             loaded.url         = o.url
             loaded.datahandler = o.datahandler
             loaded.persist     = o.persist
+            loaded._base       = tuple( loaded.records )
+            loaded._onConflict = onConflict
 
             o = loaded
 
@@ -89,11 +106,62 @@ class MixinDb( base.BaseModel, MixinName ):
 
         return False
 
-    def persistToFile( self ):
-        if self.persist and self.url:
+    def persistToFile( self, onConflict=None ):
+        """
+        Write self to url, if persisting, under an exclusive file lock.
+
+        The version of the file is checked first: if another writer
+        persisted since it was read, ``onConflict`` (by default the one
+        given to ``connect``) either raises ``Conflict`` or merges.
+
+        Raises
+        ------
+        Conflict
+            If the file changed since it was read and onConflict is
+            ``'fail'``, or a record was changed both here and there.
+        """
+        if not ( self.persist and self.url ):
+            return
+
+        from pyswark.core.io import api
+        with self._rwlock.write(), lock.FileLock( self.url ):
+            current = api.read( self.url, datahandler=self.datahandler ) if api.exists( self.url ) else None
+
+            if current is not None and not isinstance( current, type( self )):
+                raise Conflict( f"{self.url=} holds type={ type( current ) }, not { type( self ) }" )
+
+            if current is not None and current.version != self.version:
+                if ( onConflict or self._onConflict ) != 'merge':
+                    raise Conflict( f"{self.url=} is at version={ current.version }, not {self.version=}" )
+                self._mergeFrom( current )
+                self.version = current.version
 
-            from pyswark.core.io import api
+            self.version += 1
             api.write( self, self.url, datahandler=self.datahandler, overwrite=True )
+            self._base = tuple( self.records )
+
+    def _mergeFrom( self, current ):
+        """ applies the changes made since the last load or persist onto the records of current """
+        base    = { rec.info.name: rec for rec in self._base }
+        ours    = { rec.info.name: rec for rec in self.records }
+        merged  = { rec.info.name: rec for rec in current.records }
+        clashes = []
+
+        for name in [ *base, *( name for name in ours if name not in base ) ]:
+            mine = ours.get( name )
+            if _same( base.get( name ), mine ):
+                continue
+            if not ( _same( base.get( name ), merged.get( name )) or _same( mine, merged.get( name ))):
+                clashes.append( name )
+            elif mine is None:
+                merged.pop( name, None )
+            else:
+                merged[ name ] = mine
+
+        if clashes:
+            raise Conflict( f"records changed by another writer of {self.url=}: { clashes }" )
+
+        self.records = [ rec if rec.id == i else rec.model_copy( update={ 'id': i }) for i, rec in enumerate( merged.values(), 1 ) ]
 
     @classmethod
     def _post( cls, obj, name=None, **infoKw ):
@@ -105,26 +173,33 @@ class MixinDb( base.BaseModel, MixinName ):
 
     @property
     def enum(self):
-        return enum.Enum.createDynamically({ n: n for n in self.getNames() })
+        """ an Enum of the record names, rebuilt only when the names change """
+        names  = tuple( self.getNames() )
+        cached = self._enum
+        if cached is None or cached[0] != names:
+            cached = self._enum = ( names, enum.Enum.createDynamically({ n: n for n in names }) )
+        return cached[1]
 
     def postAll( self, objs ):
-        sqlModel = self.asSQLModel()
-        try:
-            sqlModel.postAll( objs )
-            self.records = sqlModel.asModel().records
-            return self
-        finally:
-            sqlModel.dispose()
+        with self._rwlock.write():
+            sqlModel = self.asSQLModel()
+            try:
+                sqlModel.postAll( objs )
+                self.records = sqlModel.asModel().records
+                return self
+            finally:
+                sqlModel.dispose()
 
     def post( self, obj, name=None, **infoKw ):
         name  = self._processName( name )
-        dbModel = self.asSQLModel()
-        try:
-            model = dbModel.post( obj, name=name )
-            self.records.append( model )
-            return model
-        finally:
-            dbModel.dispose()
+        with self._rwlock.write():
+            dbModel = self.asSQLModel()
+            try:
+                model = dbModel.post( obj, name=name )
+                self.records.append( model )
+                return model
+            finally:
+                dbModel.dispose()
 
     def getByName( self, name ):
         name = self._processName( name )
@@ -134,24 +209,35 @@ class MixinDb( base.BaseModel, MixinName ):
         finally:
             sqlModel.dispose()
 
-    def deleteByName( self, name ):
-        name = self._processName( name )
+    def getManyByName( self, names ):
+        """ the records of names, by name, from one query; missing names are left out """
+        names = [ self._processName( name ) for name in names ]
         sqlModel = self.asSQLModel()
         try:
-            success = sqlModel.deleteByName( name )
-            self.records = sqlModel.asModel().records
-            return success
+            return sqlModel.getManyByName( names )
         finally:
             sqlModel.dispose()
 
+    def deleteByName( self, name ):
+        name = self._processName( name )
+        with self._rwlock.write():
+            sqlModel = self.asSQLModel()
+            try:
+                success = sqlModel.deleteByName( name )
+                self.records = sqlModel.asModel().records
+                return success
+            finally:
+                sqlModel.dispose()
+
     def put( self, obj, name=None ):
-        dbModel = self.asSQLModel()
-        try:
-            model = dbModel.put( obj, name=name )
-            self.records = dbModel.asModel().records
-            return model
-        finally:
-            dbModel.dispose()
+        with self._rwlock.write():
+            dbModel = self.asSQLModel()
+            try:
+                model = dbModel.put( obj, name=name )
+                self.records = dbModel.asModel().records
+                return model
+            finally:
+                dbModel.dispose()
 
     def __contains__( self, name ):
         name = self._processName( name )
@@ -162,12 +248,25 @@ class MixinDb( base.BaseModel, MixinName ):
             sqlModel.dispose()
 
     def asSQLModel( self, url=None, **kw ):
+        """ a SQL view of the records; readers build theirs concurrently, writers one at a time """
         url = url or self.engine_url
         dbModel = DbSQLModel( url=url, **kw, dbType=type(self) )
-        dbModel.postAll( self.records )
+        with self._rwlock.read():
+            dbModel.postAll( self.records )
         return dbModel
 
 
+def _same( rec, other ):
+    """ whether two versions of a record, either of which may be missing, are the same but for their id """
+    if rec is None or other is None:
+        return rec is other
+    return rec.model_dump( exclude={ 'id' }) == other.model_dump( exclude={ 'id' })
+
+
+class Conflict( Exception ):
+    pass
+
+
 class MixinPost( mixin.TypeCheck ):
 
     @classmethod
@@ -418,6 +517,19 @@ class DbSQLModel( MixinConnect, MixinName ):
         query = self._makeNameQuery( name )
         return self._get( query )
 
+    def getManyByName( self, names ):
+        names = [ self._processName( name ) for name in names ]
+        query = self._makeQuery(
+            select( self.RECORD )
+            .join( self.RECORD.info )
+            .where( self.INFO.name.in_( names ) )
+        )
+
+        def op( session ):
+            return { r.info.name: r.asModel() for r in session.exec( query ).all() }
+
+        return self._with_session( op, commit=False )
+
     def getById( self, id ):
         query = self._makeIdQuery( id )
         return self._get( query )
@@ -1,19 +1,48 @@
-from functools import lru_cache
 from typing import ClassVar
 from pydantic import Field
 
-from pyswark.core.models.uri import interface, file, http, pyswark, python, guess
+from pyswark.core.models.uri import interface, file, http, pyswark, python, cas, mem, guess, parsed
 
 
 class UriModel( interface.Model ):
-    inputs  : interface.Inputs
-    outputs : interface.Outputs = Field( default=None, description="" )
-    _MODELS : ClassVar = {}
+    inputs   : interface.Inputs
+    outputs  : interface.Outputs = Field( default=None, description="" )
+    _MODELS  : ClassVar = {}
+    INTERNED : ClassVar = parsed.Cache( maxsize=4096 )
+    MODELS   : ClassVar = parsed.Cache( maxsize=1024, key=lambda uri: normalize( uri ))
 
     @classmethod
     def function( cls, inputs ):
-        model = cls._getModel( inputs.uri )
-        return model.outputs
+        return cls.parse( inputs.uri ).outputs
+
+    @classmethod
+    def parse( cls, uri ):
+        """ the parsed uri, computed once and interned """
+        return cls.INTERNED.get( uri, lambda: parsed.Uri.fromModel( uri, cls._getModel( uri )))
+
+    @classmethod
+    def tryParse( cls, uri ):
+        """ the parsed uri, or None if it is not a parsable string """
+        if not isinstance( uri, str ) or not _maybeUri( uri ):
+            return None
+        try:
+            return cls.parse( uri )
+        except ( ValueError, TypeError ):
+            return None
+
+    @classmethod
+    def parseMany( cls, uris ):
+        """ the parsed uris in order, with None for the unparsable; each distinct uri is parsed once """
+        parsed = {}
+        for uri in uris:
+            key = uri if isinstance( uri, str ) else id( uri )
+            if key not in parsed:
+                parsed[ key ] = cls.tryParse( uri )
+        return [ parsed[ uri if isinstance( uri, str ) else id( uri ) ] for uri in uris ]
+
+    @property
+    def parsed(self):
+        return self.parse( self.inputs.uri )
 
     @classmethod
     def register( cls, Model ):
@@ -24,16 +53,72 @@ class UriModel( interface.Model ):
         cls._MODELS[ scheme ] = Model
 
     @classmethod
-    @lru_cache()
     def _getModel( cls, uri ):
-        for Model in cls._MODELS.values():
-            if uri.startswith( f'{ Model.SCHEME }:' ):
-                return Model( uri )
-        return guess.Model( uri )
+        return cls.MODELS.get( uri, lambda: cls._resolve( uri )) # normalized only as the key
+
+    @classmethod
+    def _resolve( cls, uri ):
+        """ the model registered for the scheme prefix of uri, else a guess """
+        scheme, sep, _ = uri.partition( ':' )
+        Model = cls._MODELS.get( scheme ) if sep else None
+        if Model is not None:
+            return Model( uri )
+        return guess.resolve( uri )
+
+    @classmethod
+    def cacheInfo( cls ):
+        """ hit/miss statistics of the resolved models and of the parsed uris """
+        return { 'models': cls.MODELS.info(), 'parsed': cls.INTERNED.info() }
+
+    @classmethod
+    def cacheClear( cls ):
+        cls.MODELS.clear()
+        cls.INTERNED.clear()
+
+    @classmethod
+    def cacheConfigure( cls, models=None, parsed=None ):
+        """ sets the maximum number of resolved models and of parsed uris kept """
+        if models is not None:
+            cls.MODELS.configure( models )
+        if parsed is not None:
+            cls.INTERNED.configure( parsed )
+
+    def getModel(self):
+        return self._getModel( self.inputs.uri )
 
     def _getProperty( self, name ):
-        model = self.getModel()
-        return getattr( model, name )
+        return getattr( self.parsed, name )
+
+    @property
+    def Path(self):
+        return self.parsed.Path
+
+    @property
+    def path(self):
+        return self.parsed.path
+
+
+def normalize( uri ):
+    """
+    a cheap canonical form, so equivalent uris share a cache entry, i.e.
+    file:./a, file:a, ./a -> file:a; a uri it cannot shorten to a relative
+    path, i.e. .//a, is kept as it is
+    """
+    path = uri[ len( 'file:' ): ] if uri.startswith( 'file:./' ) else uri
+    if not path.startswith( './' ):
+        return uri
+
+    while path.startswith( './' ):
+        path = path[2:]
+
+    if not path or path.startswith( '/' ):
+        return uri
+    return f'file:{ path }'
+
+
+def _maybeUri( uri ):
+    """ rules out, without parsing, strings that cannot be uris, i.e. inline json or yaml documents """
+    return bool( uri ) and '\n' not in uri and uri[0] not in '{"['
 
 
 _Models = [
@@ -44,5 +129,7 @@ _Models = [
     http.ModelHttp,
     http.ModelHttps,
     pyswark.Model,
+    cas.Model,
+    mem.Model,
 ]
 [ UriModel.register( model ) for model in _Models ]
\ No newline at end of file
@@ -0,0 +1,26 @@
+from typing import ClassVar
+from pydantic import Field
+
+from pyswark.core.models.uri import interface, ext
+
+
+class Inputs( interface.InputsWithUriPatch ):
+    uri    : str
+    SCHEME : ClassVar = 'cas'
+
+
+class Model( interface.Model ):
+    """ cas://<sha256>.<ext>, a blob in the content-addressed store """
+    inputs  : Inputs
+    outputs : interface.Outputs = Field( default=None, description="" )
+    SCHEME  : ClassVar = Inputs.SCHEME
+
+    @property
+    def fsspec(self):
+        name = self.Path.name if self.Path else ''
+        return f'{ self.scheme }://{ name }'
+
+    @property
+    def Ext(self):
+        # the blob's own extension selects the handler of its payload, not of the uri
+        return ext.Ext( '' )
@@ -1,4 +1,4 @@
-from pydantic import Field, ValidationError
+from pydantic import Field
 
 from pyswark.core.models.uri import interface, generic, file, http
 
@@ -8,20 +8,29 @@ class Model( interface.Model ):
     outputs : interface.Outputs = Field( default=None, description="" )
 
     def __new__( cls, uri ):
-        try:
-            model = generic.Model( uri )
-            if model.host:
-                if '.' not in model.host and model.host != 'localhost':
-                    if model.username:
-                        return model
-                    return file.ModelGuess( f'file:{ uri }' )
-                if not model.path and not model.Ext:
-                    return _guess( uri )
-                model = http.ModelGuess( uri )
-            return model
-
-        except ValidationError:
+        return resolve( uri )
+
+
+def resolve( uri ):
+    """
+    the model of a uri without a registered scheme, decided from one match
+    of the uri pattern rather than by validating a generic model
+    """
+    match = interface.Model.PATTERN.match( uri )
+    if not match:
+        return file.ModelGuess( f'file:{ uri }' )
+
+    host = match[ 'host' ]
+    if host:
+        if '.' not in host and host != 'localhost':
+            if match[ 'username' ] or match[ '_target' ]:
+                return generic.Model( uri )
             return file.ModelGuess( f'file:{ uri }' )
+        if not match[ 'path' ]:
+            return _guess( uri )
+        return http.ModelGuess( uri )
+
+    return generic.Model( uri )
 
 
 def _guess( uri ):
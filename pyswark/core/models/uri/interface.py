@@ -99,11 +99,8 @@ class Model( function.FunctionModel ):
         return getattr( model.outputs, name )
 
     def getModel(self):
-        return self._getModel( self.inputs.uri )
-
-    @classmethod
-    def _getModel( cls, uri ):
-        return cls( uri )
+        """ the model resolving this uri; a concrete model resolves itself """
+        return self
 
     @property
     def Ext(self):
@@ -131,7 +128,7 @@ class InputsWithUriPatch( Inputs ):
     def patch( uri, scheme ):
         prefix = f'{ scheme }:'
         if uri.startswith( prefix ):
-            path    = pathlib.Path( f'{ os.sep }{ uri[ len(prefix): ]}' )
+            path    = pathlib.Path( f'{ os.sep }{ uri[ len(prefix): ].lstrip( "/" + os.sep ) }' ) # posix keeps a leading //
             slashes = '/'*2 if os.sep == '/' else '/'*3
             uri     = f'{ prefix }{ slashes }{ path }'
         return uri
\ No newline at end of file
@@ -0,0 +1,24 @@
+from typing import ClassVar
+from pydantic import Field
+
+from pyswark.core.models.uri import interface, ext
+
+
+class Inputs( interface.InputsWithUriPatch ):
+    uri    : str
+    SCHEME : ClassVar = 'mem'
+
+
+class Model( interface.Model ):
+    """ mem://path/to/name, data held in the memory of this process """
+    inputs  : Inputs
+    outputs : interface.Outputs = Field( default=None, description="" )
+    SCHEME  : ClassVar = Inputs.SCHEME
+
+    @property
+    def fsspec(self):
+        return f'{ self.scheme }://{ self.path }'
+
+    @property
+    def Ext(self):
+        return ext.Ext( name=self.Path.name if self.Path else '' )
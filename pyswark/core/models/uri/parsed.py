@@ -0,0 +1,130 @@
+import pathlib
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+
+class Uri:
+    """
+    A parsed uri: its components computed once, immutable and hashable.
+
+    Built from the resolved uri model by ``UriModel.parse``, which interns
+    one instance per uri string.
+    """
+    __slots__ = (
+        'uri',
+        'scheme',
+        'username',
+        'password',
+        'host',
+        'port',
+        'Path',
+        'path',
+        'query',
+        'fragment',
+        'Ext',
+        'fsspec',
+        'outputs',
+    )
+
+    def __init__( self, **components ):
+        for name in self.__slots__:
+            object.__setattr__( self, name, components.get( name ))
+
+    @classmethod
+    def fromModel( cls, uri, model ):
+        """ reads every component of the resolved model, once """
+        components = { name: getattr( model, name ) for name in cls.__slots__[1:-1] if name not in ( 'Path', 'path' ) }
+        Path       = pathlib.Path( model.path ) if model.path else None
+        return cls( uri=uri, outputs=model.outputs, Path=Path, path=str( Path ) if Path else None, **components )
+
+    def __setattr__( self, name, value ):
+        raise AttributeError( f'{ type( self ).__name__ } is immutable' )
+
+    def __delattr__( self, name ):
+        raise AttributeError( f'{ type( self ).__name__ } is immutable' )
+
+    def __eq__( self, other ):
+        return isinstance( other, Uri ) and other.uri == self.uri
+
+    def __hash__( self ):
+        return hash(( Uri, self.uri ))
+
+    def __repr__( self ):
+        return f'{ type( self ).__name__ }({ repr( self.uri ) })'
+
+    def __reduce__( self ):
+        return _unpickle, ( self.uri, )
+
+
+def _unpickle( uri ):
+    from pyswark.core.models.uri.base import UriModel
+    return UriModel.parse( uri )
+
+
+class CacheInfo( NamedTuple ):
+    hits    : int
+    misses  : int
+    maxsize : Optional[ int ]
+    currsize: int
+
+
+class Cache:
+    """
+    A bounded, thread-safe map dropping the least recently used entries,
+    with hit/miss statistics.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of entries; None is unbounded.
+    key : callable, optional
+        Maps a lookup key to the key it is stored under, so that
+        equivalent keys share one entry.
+    """
+
+    def __init__( self, maxsize=4096, key=None ):
+        self.maxsize = maxsize
+        self.key     = key
+        self.hits    = 0
+        self.misses  = 0
+        self._items  = OrderedDict()
+        self._lock   = threading.Lock()
+
+    def get( self, key, factory ):
+        """ the entry of key, built by factory on a miss """
+        key = self.key( key ) if self.key else key
+
+        with self._lock:
+            value = self._items.get( key )
+            if value is not None:
+                self._items.move_to_end( key )
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = factory()
+        with self._lock:
+            value = self._items.setdefault( key, value )
+            self._trim()
+        return value
+
+    def configure( self, maxsize ):
+        with self._lock:
+            self.maxsize = maxsize
+            self._trim()
+
+    def _trim( self ):
+        while self.maxsize is not None and len( self._items ) > self.maxsize:
+            self._items.popitem( last=False )
+
+    def info( self ):
+        return CacheInfo( self.hits, self.misses, self.maxsize, len( self._items ))
+
+    def clear( self ):
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def __len__( self ):
+        return len( self._items )
@@ -0,0 +1,221 @@
+"""
+Extract Cache
+=============
+
+An opt-in cache of extracted record data for a GlueDb, so dashboards and
+notebooks that extract the same records over and over read each source
+once.
+
+An entry is dropped when its record is posted, put or deleted, and is
+re-read when its source changes, as seen from the fsspec info of the
+source (``size``, ``mtime``, ``ETag``, ...). A value is cached under the
+``version`` of its name taken before its record was looked up, so a read
+that finishes after the record changed is not cached. Only records whose source
+reports such info are cached; ``python:`` objects, SQL tables and the
+like are always re-extracted. Entries are bounded by count and by bytes,
+evicting the least recently used first.
+
+Cached values are shared, not copied: mutating an extracted object
+mutates the cached one.
+
+Example
+-------
+>>> db.enableCache( max_bytes=2**30 )
+>>> db.extract( 'JPM' ) # reads the source
+>>> db.extract( 'JPM' ) # stats the source, returns the cached DataFrame
+>>> db.cacheInfo()
+CacheInfo(hits=1, misses=1, invalidations=0, evictions=0, currsize=1, nbytes=52304)
+"""
+import threading
+from typing import NamedTuple
+
+from pyswark.core.io import memory
+from pyswark.core.io.base import SIGNATURE, signature
+
+
+MISSING = object()
+SKIPPED = object()
+
+
+class CacheInfo( NamedTuple ):
+    hits          : int
+    misses        : int
+    invalidations : int
+    evictions     : int
+    currsize      : int
+    nbytes        : int
+
+
+class ExtractCache:
+    """
+    Extracted values by record name, with the handler and signature of
+    each value's source.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        Maximum number of cached values.
+    max_bytes : int, optional
+        Maximum total size of the cached values, as measured by ``memory.sizeof``.
+    """
+
+    def __init__( self, max_items=None, max_bytes=2**30 ):
+        self.values        = memory.LruStore( max_items=max_items, max_bytes=max_bytes )
+        self.sources       = {}
+        self.hits          = 0
+        self.misses        = 0
+        self.invalidations = 0
+        self._reserved     = 0  # values being read, to be put
+        self._versions     = {} # name -> times invalidated
+        self._cleared      = 0
+        self._lock         = threading.Lock()
+
+    def get( self, name ):
+        """ the cached value of name, or MISSING if absent or its source changed """
+        source = self.sources.get( name )
+        value  = MISSING if source is None else self.values.get( name, MISSING )
+
+        if value is MISSING and source is not None: # evicted
+            self.sources.pop( name, None )
+
+        elif value is not MISSING and signature( source[0] ) != source[1]:
+            self.invalidate( name )
+            with self._lock:
+                self.invalidations += 1
+            value = MISSING
+
+        with self._lock:
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def version( self, name ):
+        """ the version of name, changed by every invalidation of it """
+        with self._lock:
+            return self._version( name )
+
+    def _version( self, name ):
+        return ( self._cleared, self._versions.get( name, 0 ))
+
+    def put( self, name, value, handler, sig, version=None, reserved=False ):
+        """
+        caches value, read from the source of handler when it had signature
+        sig, unless name was invalidated since its version was taken;
+        reserved gives back the room claimed for it by ``reserve``
+        """
+        with self._lock:
+            if reserved:
+                self._reserved -= 1
+            if sig is None or not ( version is None or version == self._version( name )):
+                return
+            self.sources[ name ] = ( handler, sig )
+            self.values[ name ]  = value
+
+    def reserve( self ):
+        """ claims room for a value being read; False if the cache is full """
+        with self._lock:
+            if self.full( reserved=self._reserved ):
+                return False
+            self._reserved += 1
+            return True
+
+    def release( self ):
+        """ gives back the room claimed for a value that was not read """
+        with self._lock:
+            self._reserved -= 1
+
+    def full( self, reserved=0 ):
+        """ whether the values, and reserved entries to come, are at their item or byte bound """
+        values = self.values
+        if values.max_items is not None and len( values ) + reserved >= values.max_items:
+            return True
+        return values.max_bytes is not None and values.nbytes >= values.max_bytes
+
+    def invalidate( self, name ):
+        with self._lock:
+            self._versions[ name ] = self._versions.get( name, 0 ) + 1
+            self.values.pop( name, None )
+            self.sources.pop( name, None )
+
+    def clear( self ):
+        with self._lock:
+            self._cleared += 1
+            self._versions.clear()
+            self.values.clear()
+            self.sources.clear()
+
+    def info( self ):
+        return CacheInfo( self.hits, self.misses, self.invalidations, self.values.evictions, len( self.values ), self.values.nbytes )
+
+
+class Prefetch:
+    """
+    A handle on a background warm-up of an extract cache; poll it, wait on
+    it, or await it.
+
+    Attributes
+    ----------
+    names : list[str]
+        The records being warmed.
+    loaded : list[str]
+        The records read (or found already cached).
+    failed : dict
+        The exception of each record that could not be read.
+    skipped : list[str]
+        The records not read because the cache was full.
+    """
+
+    def __init__( self, names ):
+        self.names   = list( names )
+        self.loaded  = []
+        self.failed  = {}
+        self.skipped = []
+        self._done   = threading.Event()
+        self._lock   = threading.Lock()
+
+    def finish( self, name, value ):
+        with self._lock:
+            if value is SKIPPED:
+                self.skipped.append( name )
+            elif isinstance( value, Exception ):
+                self.failed[ name ] = value
+            else:
+                self.loaded.append( name )
+
+    def abort( self, error ):
+        """ fails every record not yet finished """
+        with self._lock:
+            finished = set( self.loaded ) | set( self.failed ) | set( self.skipped )
+            for name in self.names:
+                if name not in finished:
+                    self.failed[ name ] = error
+
+    def close( self ):
+        self._done.set()
+
+    @property
+    def finished(self):
+        return len( self.loaded ) + len( self.failed ) + len( self.skipped )
+
+    @property
+    def progress(self):
+        """ the fraction of records finished """
+        return self.finished / len( self.names ) if self.names else 1.0
+
+    def done( self ):
+        return self._done.is_set()
+
+    def wait( self, timeout=None ):
+        """ blocks until the warm-up finishes; False if it timed out """
+        return self._done.wait( timeout )
+
+    def __await__( self ):
+        import asyncio
+        yield from asyncio.get_running_loop().run_in_executor( None, self.wait ).__await__()
+        return self
+
+    def __repr__( self ):
+        return f'{ type( self ).__name__ }(loaded={ len( self.loaded ) }, failed={ len( self.failed ) }, skipped={ len( self.skipped ) }, total={ len( self.names ) })'
+
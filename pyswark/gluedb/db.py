@@ -1,11 +1,15 @@
+import threading
 from pathlib import Path
-from typing import ClassVar
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import ClassVar, Optional
+from pydantic import PrivateAttr
 from pyswark.lib.pydantic import base
 
 from pyswark.core import extractor
 from pyswark.core.io import api
 from pyswark.core.models import db
 
+from pyswark.gluedb import cache
 from pyswark.gluedb.models import iomodel
 
 
@@ -74,13 +78,59 @@ class Base( db.Db ):
         -------
         >>> db1.merge(db2)  # Adds all records from db2 to db1
         """
-        if not isinstance( other, db.Db ):
-            raise TypeError( f"can only merge type Db, got type={type(other)}" )
-        
-        self.records.extend( other.records )
-        tmp = Db().postAll( self.records )
-        self.records = tmp.records
-        
+        return self.mergeAll([ other ])
+
+    def mergeAll( self, others ):
+        """
+        Merge records from many databases into this one, in one pass.
+
+        Names are checked against a hash index of the records seen so far,
+        and each distinct model type of the merged records is type-checked
+        once; the records themselves are not re-validated.
+
+        Parameters
+        ----------
+        others : list[Db]
+            GlueDb instances to merge from, in order.
+
+        Raises
+        ------
+        ValueError
+            If a name occurs more than once; this database is then unchanged.
+        """
+        others = list( others )
+        for other in others:
+            if not isinstance( other, db.Db ):
+                raise TypeError( f"can only merge type Db, got type={type(other)}" )
+
+        with self._rwlock.write():
+            return self._mergeAll( others )
+
+    def _mergeAll( self, others ):
+        names      = { rec.info.name for rec in self.records }
+        duplicates = []
+        checked    = set()
+        merged     = list( self.records )
+
+        for other in others:
+            for rec in other.records:
+                name = rec.info.name
+                if name in names:
+                    duplicates.append( name )
+                    continue
+                names.add( name )
+
+                if rec.body.model not in checked:
+                    self._checkModel( rec.body.model )
+                    checked.add( rec.body.model )
+                merged.append( rec )
+
+        if duplicates:
+            raise ValueError( f"cannot merge duplicate names={ duplicates }" )
+
+        # ids number the records in order, as a rebuilt database would
+        self.records = [ rec if rec.id == i else rec.model_copy( update={ 'id': i }) for i, rec in enumerate( merged, 1 ) ]
+        return self
 
 
 class Db( Base ):
@@ -118,6 +168,8 @@ class Db( Base ):
     IOMODEL: ClassVar = iomodel.IoModel
     AllowedInstances = [ IOMODEL, base.BaseModel ]
 
+    _extracts : Optional[ cache.ExtractCache ] = PrivateAttr( default=None )
+
     @classmethod
     def _post_fallback( cls, obj, name=None ):
         _, obj, name = cls._post_fallback_ioModel( obj, name=name )
@@ -178,6 +230,9 @@ class Db( Base ):
         >>> db.post('prices', 'file:./prices.csv')
         >>> prices_df = db.extract('prices')
         """
+        if self._extracts is not None:
+            return self._extractCached( self._processName( name ))
+
         record = self.get( name )
         model = self._handle( record, self.IOMODEL.extract )
 
@@ -186,6 +241,283 @@ class Db( Base ):
 
         return model
 
+    def _extractCached( self, name ):
+        value = self._extracts.get( name )
+        if value is not cache.MISSING:
+            return value
+
+        version = self._extracts.version( name ) # before the record, so a change since is seen
+        model   = self.get( name ).acquire()
+        if not isinstance( model, self.IOMODEL ):
+            return self._extractInline( model )
+
+        return self._read( name, *model._bindExtract(), version )
+
+    @staticmethod
+    def _extractInline( model ):
+        return model.extract() if isinstance( model, extractor.Extractor ) else model
+
+    def _read( self, name, reader, handler, version=None, reserved=False ):
+        """
+        reads the source of a record, through the extract cache when
+        enabled, as of the cache version of name before the record was
+        looked up; reserved if room was claimed for it with ``reserve``
+        """
+        if self._extracts is None:
+            return handler.read( **reader.kw )
+
+        sig = cache.signature( handler ) # before reading, so a concurrent write shows as a change
+        try:
+            value = handler.read( **reader.kw )
+        except BaseException:
+            if reserved:
+                self._extracts.release()
+            raise
+        self._extracts.put( name, value, handler, sig, version=version, reserved=reserved )
+        return value
+
+    def extractMany( self, names, max_workers=None ):
+        """
+        Extract many records at once.
+
+        The records are fetched in one query. Inline data and in-process
+        sources (``python:``, ``mem:``) are extracted in turn; every other
+        source is read concurrently.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the records to extract.
+        max_workers : int, optional
+            Number of threads reading sources concurrently.
+
+        Returns
+        -------
+        dict
+            The extracted data by name, in the order of ``names``. A record
+            that is missing or fails to extract maps to its exception,
+            i.e. ``KeyError`` for an unknown name.
+
+        Example
+        -------
+        >>> data = db.extractMany(['JPM', 'BAC'])
+        >>> failed = { name: e for name, e in data.items() if isinstance( e, Exception ) }
+        """
+        names = list( dict.fromkeys( self._processName( name ) for name in names ))
+        results, serial, concurrent = self._plan( names )
+
+        for job in serial:
+            results[ job[0] ] = self._tryRead( job )
+
+        if concurrent:
+            max_workers = max_workers or min( 32, len( concurrent ))
+            with ThreadPoolExecutor( max_workers=max_workers ) as executor:
+                for job, value in zip( concurrent, executor.map( self._tryRead, concurrent )):
+                    results[ job[0] ] = value
+
+        return { name: results[ name ] for name in names }
+
+    def _plan( self, names ):
+        """
+        The results already known by name (cached, inline, or failed), and
+        the ( name, reader, handler, version ) reads left: in-process and
+        concurrent.
+        """
+        results, versions = {}, {}
+
+        if self._extracts is not None:
+            for name in names:
+                value = self._extracts.get( name )
+                if value is not cache.MISSING:
+                    results[ name ] = value
+                else:
+                    versions[ name ] = self._extracts.version( name )
+
+        pending = [ name for name in names if name not in results ]
+        records = self.getManyByName( pending ) if pending else {}
+        inProcess = _inProcessHandlers()
+
+        serial, concurrent = [], []
+        for name in pending:
+            try:
+                model = records[ name ].acquire()
+                if not isinstance( model, self.IOMODEL ):
+                    results[ name ] = self._extractInline( model )
+                    continue
+                reader, handler = model._bindExtract()
+            except Exception as e:
+                results[ name ] = e
+                continue
+
+            jobs = serial if isinstance( handler, inProcess ) else concurrent
+            jobs.append(( name, reader, handler, versions.get( name )))
+
+        return results, serial, concurrent
+
+    def _tryRead( self, job, reserved=False ):
+        try:
+            return self._read( *job, reserved=reserved )
+        except Exception as e:
+            return e
+
+    def prefetch( self, names=None, max_workers=None ):
+        """
+        Warm the extract cache in the background.
+
+        Records are read as by ``extractMany``, into the extract cache
+        (enabled with its defaults if needed), so that later ``extract``
+        calls hit them. Once the cache is full, the remaining records are
+        skipped rather than evicting the ones just read.
+
+        Parameters
+        ----------
+        names : list[str] or callable, optional
+            The records to warm, or a predicate on each record, i.e.
+            ``lambda rec: rec.info.name.startswith('px.')``; all by default.
+        max_workers : int, optional
+            Number of threads reading sources concurrently.
+
+        Returns
+        -------
+        cache.Prefetch
+            A handle to poll (``done()``, ``progress``), wait on
+            (``wait(timeout)``) or ``await``, reporting the ``loaded``,
+            ``failed`` and ``skipped`` names.
+
+        Example
+        -------
+        >>> warmup = db.prefetch(['JPM', 'BAC'], max_workers=8)
+        >>> warmup.wait()
+        >>> warmup.failed
+        {}
+        """
+        if names is None:
+            names = self.getNames()
+        elif callable( names ):
+            names = [ rec.info.name for rec in self.records if names( rec ) ]
+
+        if self._extracts is None:
+            self.enableCache()
+
+        handle = cache.Prefetch([ self._processName( name ) for name in names ])
+        threading.Thread( target=self._prefetch, args=( handle, max_workers ), daemon=True ).start()
+        return handle
+
+    def _prefetch( self, handle, max_workers ):
+        try:
+            results, serial, concurrent = self._plan( handle.names )
+            for name, value in results.items():
+                handle.finish( name, value )
+
+            def read( job ):
+                if not self._extracts.reserve(): # reads in flight count against the item bound
+                    return cache.SKIPPED
+                return self._tryRead( job, reserved=True )
+
+            for job in serial:
+                handle.finish( job[0], read( job ))
+
+            if concurrent:
+                max_workers = max_workers or min( 32, len( concurrent ))
+                with ThreadPoolExecutor( max_workers=max_workers ) as executor:
+                    futures = { executor.submit( read, job ): job[0] for job in concurrent }
+                    for future in as_completed( futures ):
+                        handle.finish( futures[ future ], future.result() )
+
+        except Exception as e:
+            handle.abort( e )
+
+        finally:
+            handle.close()
+
+    def enableCache( self, max_items=None, max_bytes=2**30 ):
+        """
+        Cache extracted data, re-reading a record only when it is posted,
+        put or deleted, or when its source changes.
+
+        The cache itself is thread-safe, but enabling or disabling it is
+        not: do so before sharing the Db with other threads.
+
+        Parameters
+        ----------
+        max_items : int, optional
+            Maximum number of cached records.
+        max_bytes : int, optional
+            Maximum total size of the cached data. Default 1 GiB.
+
+        Returns
+        -------
+        Db
+            self, i.e. ``db = api.read( uri ).enableCache()``.
+        """
+        self._extracts = cache.ExtractCache( max_items=max_items, max_bytes=max_bytes )
+        return self
+
+    def disableCache( self ):
+        """ drops the extract cache; not thread-safe, as ``enableCache`` """
+        self._extracts = None
+        return self
+
+    def cacheInfo( self ):
+        """ hits, misses, invalidations, evictions, currsize and nbytes of the extract cache, or None when disabled """
+        return None if self._extracts is None else self._extracts.info()
+
+    def cacheClear( self ):
+        if self._extracts is not None:
+            self._extracts.clear()
+
+    def _invalidate( self, name=None ):
+        """ drops the cached extract of name, or of every record """
+        if self._extracts is None:
+            return
+        if name is None:
+            self._extracts.clear()
+        else:
+            self._extracts.invalidate( self._processName( name ))
+
+    # a change and the invalidation it calls for happen under one write lock,
+    # so readers never see the new records alongside stale cached extracts
+
+    def post( self, obj, name=None, **infoKw ):
+        with self._rwlock.write():
+            model = super().post( obj, name=name, **infoKw )
+            self._invalidate( model.info.name )
+            return model
+
+    def postAll( self, objs ):
+        objs = self._classifyUris( objs )
+        with self._rwlock.write():
+            self._invalidate()
+            return super().postAll( objs )
+
+    @classmethod
+    def _classifyUris( cls, objs ):
+        """ uri strings, checked in one pass, as IoModel kwargs, so posting does not check them one by one """
+        objs    = [ str( obj ) if isinstance( obj, Path ) else obj for obj in objs ]
+        strings = [ obj for obj in objs if isinstance( obj, str ) ]
+        isUri   = dict( zip( strings, api.isUriMany( strings )))
+        return [ { 'uri': obj } if isinstance( obj, str ) and isUri[ obj ] else obj for obj in objs ]
+
+    def put( self, obj, name=None ):
+        with self._rwlock.write():
+            model = super().put( obj, name=name )
+            self._invalidate( model.info.name )
+            return model
+
+    def deleteByName( self, name ):
+        with self._rwlock.write():
+            self._invalidate( name )
+            return super().deleteByName( name )
+
+    def mergeAll( self, others ):
+        with self._rwlock.write():
+            self._invalidate()
+            return super().mergeAll( others )
+
+    def _mergeFrom( self, current ):
+        self._invalidate()
+        return super()._mergeFrom( current )
+
     def load( self, data, name ):
         record = self.get( name )
         return self._handle( record, self.IOMODEL.load, data )
@@ -205,3 +537,9 @@ class Db( Base ):
             return method( model, *args, **kwargs )
 
         return model
+
+
+def _inProcessHandlers():
+    """ handlers reading from the interpreter itself, which gain nothing from threads """
+    from pyswark.core.io.datahandler import DataHandler
+    return ( DataHandler.PYTHON.klass, DataHandler.MEM.klass )
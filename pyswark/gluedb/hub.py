@@ -20,7 +20,13 @@ Example
 >>> # Consolidate all databases into one
 >>> consolidated = hub.toDb()
 """
-from pyswark.gluedb import db
+from contextlib import contextmanager
+from pydantic import PrivateAttr
+
+from pyswark.core.io import api, lock
+from pyswark.core.io.base import CannotOverwrite
+
+from pyswark.gluedb import db, cache
 from pyswark.gluedb.models import iomodel
 
 
@@ -46,6 +52,9 @@ class Hub(db.Db):
     >>> consolidated = hub.toDb()
     """
     AllowedInstances = [ iomodel.IoModel, db.Base ]
+
+    # member dbs resolved by _get_db_and_contents: dbName -> (contents, db, handler, signature)
+    _members : dict = PrivateAttr( default_factory=dict )
     
     def extract(self, name):
         """
@@ -62,6 +71,17 @@ class Hub(db.Db):
         
         return gluedb
 
+    def extractMany( self, names, max_workers=None ):
+        """
+        Extract many databases from the hub at once; an entry that is not
+        a database maps to a TypeError.
+        """
+        results = super().extractMany( names, max_workers=max_workers )
+        for name, gluedb in results.items():
+            if not isinstance( gluedb, ( db.Base, Exception )):
+                results[ name ] = TypeError( f"Expected type={ db.Base }, got type={ type(gluedb) }" )
+        return results
+
     def load(self, data, name):
         """
         Load a database into the hub by name.
@@ -117,9 +137,11 @@ class Hub(db.Db):
             entry_name = obj.get( 'name' )
         if entry_name is None:
             raise ValueError( "postToDb requires name= or obj with .name / obj['name']" )
-        target_db.post( obj, name=entry_name )
-        if hasattr( contents, 'load' ):
-            contents.load( target_db, overwrite=overwrite )
+        try:
+            target_db.post( obj, name=entry_name )
+            self._writeBack( contents, target_db, overwrite )
+        finally:
+            self.refresh( dbName )
         return target_db.get( entry_name )
 
     def putToDb( self, obj, dbName, name=None, overwrite=True ):
@@ -140,9 +162,11 @@ class Hub(db.Db):
         if entry_name is None:
             raise ValueError( "putToDb requires name= or obj with .name / obj['name']" )
 
-        target_db.put( obj, name=entry_name )
-        if hasattr( contents, 'load' ):
-            contents.load( target_db, overwrite=overwrite )
+        try:
+            target_db.put( obj, name=entry_name )
+            self._writeBack( contents, target_db, overwrite )
+        finally:
+            self.refresh( dbName )
         return target_db.get( entry_name )
 
     def mergeToDb( self, otherDb, dbName, overwrite=True ):
@@ -168,19 +192,66 @@ class Hub(db.Db):
             raise TypeError( f"mergeToDb expects otherDb to be a GlueDb, got {type(otherDb)}" )
 
         contents, target_db = self._get_db_and_contents( dbName )
-        target_db.merge( otherDb )
-        if hasattr( contents, 'load' ):
-            contents.load( target_db, overwrite=overwrite )
+        try:
+            target_db.merge( otherDb )
+            self._writeBack( contents, target_db, overwrite )
+        finally:
+            self.refresh( dbName )
         return target_db
 
+    @contextmanager
+    def batch( self, dbName, overwrite=True ):
+        """
+        Apply many mutations to a database in the hub, persisting it once.
+
+        Yields the SQL view of the database (``DbSQLModel``), entered as a
+        context manager: ``post``, ``postAll``, ``put`` and ``deleteByName``
+        run in one session. On exit the session commits and the database
+        is written back once, to the URI it points to, or to the hub entry
+        for an inline database. On an exception the session rolls back and
+        nothing is written.
+
+        Parameters
+        ----------
+        dbName : str
+            Name of the database in the hub.
+        overwrite : bool, optional
+            If True (default), allow overwriting the target URI when persisting.
+
+        Example
+        -------
+        >>> with hub.batch('db_1') as db:
+        ...     for name, obj in records.items():
+        ...         db.post(obj, name=name)
+        """
+        contents, target_db = self._get_db_and_contents( dbName )
+        try:
+            sqlModel = target_db.asSQLModel()
+            try:
+                with sqlModel:
+                    yield sqlModel
+                    updated = target_db.model_copy( update={ 'records': sqlModel.getAll() })
+            finally:
+                sqlModel.dispose()
+
+            if isinstance( contents, db.Base ):
+                self.put( updated, name=dbName )
+            else:
+                self._writeBack( contents, updated, overwrite )
+        finally:
+            self.refresh( dbName )
+
     def deleteFromDb( self, dbName, name, overwrite=True ):
         """
         Delete an entry from the underlying GlueDb and persist the change.
         """
         contents, target_db = self._get_db_and_contents( dbName )
-        success = target_db.delete( name )
-        if success and hasattr( contents, 'load' ):
-            contents.load( target_db, overwrite=overwrite )
+        try:
+            success = target_db.delete( name )
+            if success:
+                self._writeBack( contents, target_db, overwrite )
+        finally:
+            self.refresh( dbName )
         return success
 
     def extractFromDb( self, dbName, name ):
@@ -190,6 +261,13 @@ class Hub(db.Db):
         _, target_db = self._get_db_and_contents( dbName )
         return target_db.extract( name )
 
+    def extractManyFromDb( self, dbName, names, max_workers=None ):
+        """
+        Extract many records from the underlying GlueDb at once; see Db.extractMany.
+        """
+        _, target_db = self._get_db_and_contents( dbName )
+        return target_db.extractMany( names, max_workers=max_workers )
+
     def acquireFromDb( self, dbName, name ):
         """
         Acquire the low-level handler for a record in the underlying GlueDb.
@@ -201,19 +279,79 @@ class Hub(db.Db):
         """
         Internal helper to resolve a hub entry to its underlying GlueDb
         instance and the original contents object (IoModel or Db).
+
+        Resolved dbs are kept until the hub entry changes, the hub writes
+        through to it, or the file backing it changes (size/mtime). A db is
+        resolved under the read lock, so a concurrent ``refresh`` cannot be
+        undone by storing what was read before it.
         """
+        dbName = self._processName( dbName )
+        with self._rwlock.read():
+            return self._resolveMember( dbName )
+
+    def _resolveMember( self, dbName ):
+        member = self._members.get( dbName )
+        if member is not None:
+            contents, target_db, handler, sig = member
+            if handler is None or cache.signature( handler ) == sig:
+                return contents, target_db
+
         contents = self.acquire( dbName )
+        handler  = sig = None
 
         if isinstance( contents, db.Base ):
             target_db = contents
         else:
-            target_db = contents.extract()
+            reader, handler = contents._bindExtract()
+            with lock.FileLock( contents.uri, shared=True ):
+                sig       = cache.signature( handler )
+                target_db = handler.read( **reader.kw )
 
         if not isinstance( target_db, db.Base ):
             raise TypeError( f"Expected Db from hub entry {dbName!r}, got {type(target_db)}" )
 
+        if handler is not None:
+            target_db._base = tuple( target_db.records ) # as read, for persistToFile to merge from
+
+        if handler is None or sig is not None:
+            self._members[ dbName ] = ( contents, target_db, handler, sig )
+
         return contents, target_db
 
+    def _writeBack( self, contents, target_db, overwrite ):
+        """
+        Writes a changed member db back to the uri of its IoModel, as
+        ``persistToFile`` does: under the file lock, checked against the
+        version of the file, and merged or raising ``Conflict`` as the
+        hub's onConflict says. An inline member needs no write.
+        """
+        if isinstance( contents, db.Base ):
+            return
+
+        uri = contents.uriWrite or contents.uri
+        if not overwrite and api.exists( uri ):
+            raise CannotOverwrite( uri )
+
+        target_db.url         = uri
+        target_db.datahandler = contents.datahandlerWrite or contents.datahandler
+        target_db.persist     = True
+        target_db.persistToFile( onConflict=self._onConflict )
+
+    def refresh( self, dbName=None ):
+        """
+        Forget the resolved member db of dbName, or of every entry, so it
+        is read again on next use.
+        """
+        with self._rwlock.write():
+            if dbName is None:
+                self._members.clear()
+            else:
+                self._members.pop( self._processName( dbName ), None )
+
+    def _invalidate( self, name=None ):
+        super()._invalidate( name )
+        self.refresh( name )
+
     def toDb(self):
         """
         Consolidate all databases in the hub into a single GlueDb.
@@ -232,9 +370,9 @@ class Hub(db.Db):
         >>> print(consolidated.getNames())  # All names from all databases
         """
         
-        new = db.Db()
-        for name in self.getNames():
-            other = self.extract( name )
-            new.merge( other )
-        
-        return new
+        dbs = self.extractMany( self.getNames() ) # member dbs load concurrently
+        for gluedb in dbs.values():
+            if isinstance( gluedb, Exception ):
+                raise gluedb
+
+        return db.Db().mergeAll( dbs.values() )
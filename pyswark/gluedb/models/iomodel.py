@@ -1,5 +1,5 @@
 from typing import Optional
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from pyswark.core.io import iohandler
 
@@ -23,29 +23,50 @@ class IoModel( iohandler.IoHandler ):
     datahandlerWrite : Optional[ str ] = ""
     kwWrite          : Optional[ dict ] = Field( default_factory=lambda: {} )
 
+    # ( fields, IoModel, handler ) per direction, rebuilt when the fields change
+    _bindings : dict = PrivateAttr( default_factory=dict )
+
     @classmethod
     def fromArgs( cls, uri, datahandler="", kw=None, uriWrite="", datahandlerWrite="", kwWrite=None ):
         """ create the model from args """
         return cls( uri=uri, datahandler=datahandler, kw=kw or {}, uriWrite=uriWrite, datahandlerWrite=datahandlerWrite, kwWrite=kwWrite or {} )
 
     def extract( self ):
-        return self._getExtractor().read()
+        reader, handler = self._bindExtract()
+        return handler.read( **reader.kw )
 
     def load( self, data, **kwargs ):
         """ the L in ETL - loads the contents into a system """
-        return self._getLoader().write( data, **kwargs )
+        writer, handler = self._bindLoad()
+        return handler.write( data, **{ **writer.kw, **kwargs } )
 
     def acquireExtract( self ):
-        return self._getExtractor().acquire()
+        return self._bindExtract()[1]
 
     def acquireLoad( self ):
-        return self._getLoader().acquire()
+        return self._bindLoad()[1]
 
     def _getExtractor(self):
-        return IoModel( **self._getExtractKwargs() )
+        return self._bindExtract()[0]
 
     def _getLoader(self):
-        return IoModel( **self._getLoadKwargs() )
+        return self._bindLoad()[0]
+
+    def _bindExtract( self ):
+        """ the reading IoModel and its handler """
+        return self._bind( 'extract', self._getExtractKwargs() )
+
+    def _bindLoad( self ):
+        """ the writing IoModel and its handler """
+        return self._bind( 'load', self._getLoadKwargs() )
+
+    def _bind( self, key, kwargs ):
+        """ the ( IoModel, handler ) of kwargs, built once and again only when kwargs change """
+        binding = self._bindings.get( key )
+        if binding is None or binding[0] != kwargs:
+            model   = IoModel( **kwargs )
+            binding = self._bindings[ key ] = ( _snapshot( kwargs ), model, model.acquire() )
+        return binding[1], binding[2]
 
     def _getExtractKwargs( self ):
         return {
@@ -60,3 +81,8 @@ class IoModel( iohandler.IoHandler ):
             'datahandler' : self.datahandlerWrite or self.datahandler,
             'kw'          : self.kwWrite,
         }
+
+
+def _snapshot( kwargs ):
+    """ a copy of kwargs that in-place changes to its dicts do not reach """
+    return { k: dict( v ) if isinstance( v, dict ) else v for k, v in kwargs.items() }
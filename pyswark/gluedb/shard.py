@@ -0,0 +1,313 @@
+"""
+Sharded GlueDb
+==============
+
+A catalog too large for one ``.gluedb`` file, split across shard files by
+a hash of each record name, or by its first characters.
+
+The shards are the members of a ``Hub``, the index of the catalog, which
+stays small and is itself written to a ``.gluedb`` file. A shard is read
+the first time one of its records is used, and ``flush`` writes only the
+shards changed since, plus the index when a shard was added.
+
+Each shard file is written as ``Db.persistToFile`` writes a ``.gluedb``:
+under its own file lock, and only if no other writer persisted it since it
+was read, or else merged with what they wrote when ``onConflict='merge'``.
+
+The partitioning is fixed when the first record is posted; changing
+``shards``, ``partition`` or ``prefix`` afterwards misplaces records.
+
+Example
+-------
+>>> from pyswark.gluedb import shard
+>>> catalog = shard.ShardedDb( root='file:./catalog', url='file:./catalog/index.gluedb', shards=64 )
+>>> catalog.post( 'file:./prices/JPM.csv', name='JPM' )
+>>> catalog.flush() # writes the shard of JPM and the index
+>>>
+>>> catalog = shard.ShardedDb.connect( 'file:./catalog/index.gluedb' )
+>>> catalog.extract( 'JPM' ) # reads the index and the shard of JPM only
+"""
+import re
+import zlib
+from typing import Literal
+from pydantic import Field, PrivateAttr
+
+from pyswark.lib.pydantic import base
+from pyswark.core.io import api, lock
+from pyswark.core.models.db import MixinName, Conflict
+
+from pyswark.gluedb import db
+from pyswark.gluedb.hub import Hub
+from pyswark.gluedb.models import iomodel
+
+
+_UNSAFE = re.compile( r'\W' ) # characters of a prefix not kept in shard names
+
+
+class ShardedDb( base.BaseModel, MixinName ):
+    """
+    A GlueDb whose records are partitioned across shard GlueDbs.
+
+    Parameters
+    ----------
+    hub : Hub
+        The shards, by shard name; each one a ``.gluedb`` file under root,
+        or inline when root is empty.
+    shards : int
+        Number of shards when partitioning by hash.
+    partition : str
+        ``'hash'`` of the record name, or its ``'prefix'``.
+    prefix : int
+        Characters of the record name that key its shard, when
+        partitioning by prefix.
+    root : str
+        URI of the directory of the shard files.
+    url : str
+        URI of the index file.
+    persist : bool
+        Flush on context exit.
+
+    Example
+    -------
+    >>> with shard.ShardedDb.connect( 'file:./catalog/index.gluedb', persist=True ) as catalog:
+    ...     catalog.put( {'window': 60}, name='config' )
+    ...     # On exit: writes the shard of config
+    """
+    hub         : Hub                         = Field( default_factory=Hub, description="The shards, by shard name" )
+    shards      : int                         = Field( default=16, ge=1, description="Number of shards when partitioning by hash" )
+    partition   : Literal[ 'hash', 'prefix' ] = Field( default='hash', description="Partition records by the hash of their name, or its prefix" )
+    prefix      : int                         = Field( default=2, ge=1, description="Characters of the name keying its shard when partitioning by prefix" )
+    root        : str                         = Field( default='', description="URI to the directory of shard files; shards are inline if empty" )
+    url         : str                         = Field( default='', description="URI to the index file" )
+    datahandler : str                         = Field( default='pjson', description="Datahandler to use for loading and persisting" )
+    persist     : bool                        = Field( default=False, description="Flush on context exit" )
+
+    _loaded     : dict = PrivateAttr( default_factory=dict ) # shard name -> Db, read so far
+    _dirty      : set  = PrivateAttr( default_factory=set )  # shard names changed since read
+    _indexDirty : bool = PrivateAttr( default=False )
+    _onConflict : str  = PrivateAttr( default='fail' )
+
+    @classmethod
+    def connect( cls, url, datahandler='pjson', persist=False, onConflict='fail' ):
+        """
+        Read the index of a sharded GlueDb; no shard is read yet.
+
+        Parameters
+        ----------
+        url : str
+            URI to the index file.
+        persist : bool, optional
+            If True, flush on successful context exit.
+        onConflict : str, optional
+            When a shard file was persisted by another writer since it was
+            read: ``'fail'`` raises ``Conflict``; ``'merge'`` merges.
+        """
+        loaded = api.read( url, datahandler=datahandler )
+
+        if not isinstance( loaded, cls ):
+            raise ValueError( f"Expected type={ cls }, got type={ type(loaded) } from url={ url }" )
+
+        loaded.url         = url
+        loaded.datahandler = datahandler
+        loaded.persist     = persist
+        loaded._onConflict = onConflict
+        return loaded
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None and self.persist:
+            self.flush()
+
+        return False
+
+    def shardOf( self, name ):
+        """ the name of the shard holding the record name """
+        return self._shardOf( self._processName( name ))
+
+    def _shardOf( self, name ):
+        if self.partition == 'prefix':
+            return f"prefix-{ _UNSAFE.sub( '_', name[ :self.prefix ] ) or '_' }"
+
+        width = len( str( self.shards - 1 ))
+        return f"shard-{ zlib.crc32( name.encode() ) % self.shards :0{ width }d}"
+
+    def get( self, name ):
+        """ the record name, or None; reads its shard if not yet read """
+        name = self._processName( name )
+        return self._shard( name ).get( name )
+
+    def extract( self, name ):
+        name = self._processName( name )
+        return self._shard( name ).extract( name )
+
+    def acquire( self, name ):
+        name = self._processName( name )
+        return self._shard( name ).acquire( name )
+
+    def post( self, obj, name=None, **infoKw ):
+        name  = self._processName( _nameOf( obj, name ))
+        shard = self._shard( name, create=True )
+        model = shard.post( obj, name=name, **infoKw )
+        self._dirty.add( self._shardOf( name ))
+        return model
+
+    def put( self, obj, name=None ):
+        name  = self._processName( _nameOf( obj, name ))
+        shard = self._shard( name, create=True )
+        model = shard.put( obj, name=name )
+        self._dirty.add( self._shardOf( name ))
+        return model
+
+    def delete( self, name ):
+        name    = self._processName( name )
+        success = self._shard( name ).delete( name )
+        if success:
+            self._dirty.add( self._shardOf( name ))
+        return success
+
+    def getNames( self ):
+        """ the record names of every shard, shard by shard; reads every shard """
+        self._loadAll()
+        return [ name for key in sorted( self._loaded ) for name in self._loaded[ key ].getNames() ]
+
+    def __contains__( self, name ):
+        return self.get( name ) is not None
+
+    def flush( self, onConflict=None ):
+        """
+        Writes the shards changed since they were read, each under the lock
+        of its file and checked against its version, and the index if a
+        shard was added or an inline shard changed.
+
+        The index is re-read under its lock first: shards added by other
+        writers are kept, and an inline shard changed both here and there
+        raises ``Conflict`` or is merged, as for a shard file.
+
+        Raises
+        ------
+        Conflict
+            If another writer persisted a shard since it was read, and
+            onConflict (by default the one given to ``connect``) is
+            ``'fail'``; the shards written before it stay written.
+        """
+        onConflict = onConflict or self._onConflict
+
+        if self.root:
+            for key in sorted( self._dirty ):
+                self._loaded[ key ].persistToFile( onConflict=onConflict )
+                self._dirty.discard( key )
+
+        if not ( self._dirty or self._indexDirty ):
+            return
+
+        if not self.url:
+            self._putInline()
+        else:
+            with lock.FileLock( self.url ):
+                if api.exists( self.url ):
+                    self._mergeIndex( api.read( self.url, datahandler=self.datahandler ), onConflict )
+                self._putInline()
+                api.write( self, self.url, datahandler=self.datahandler, overwrite=True )
+        self._indexDirty = False
+
+    def _putInline( self ):
+        """ puts the changed inline shards into the hub, as persisted """
+        for key in sorted( self._dirty ):
+            shard = self._loaded[ key ]
+            shard.version += 1
+            shard._base    = tuple( shard.records )
+            self.hub.put( shard, name=key )
+        self._dirty.clear()
+
+    def _mergeIndex( self, current, onConflict ):
+        """ takes in the shards of the index as another writer left it """
+        if not isinstance( current, type( self )):
+            raise Conflict( f"{self.url=} holds type={ type( current ) }, not { type( self ) }" )
+
+        mine = self._shardNames()
+        for key in current.hub.getNames():
+            theirs = current.hub.acquire( key )
+
+            if key not in mine:
+                self.hub.post( theirs, name=key )
+
+            elif self.root:
+                continue # the same shard file
+
+            elif key in self._dirty:
+                ours = self._loaded[ key ]
+                if theirs.version != ours.version:
+                    if onConflict != 'merge':
+                        raise Conflict( f"shard { key !r} of {self.url=} is at version={ theirs.version }, not { ours.version }" )
+                    ours._mergeFrom( theirs )
+                    ours.version = theirs.version
+
+            else:
+                self.hub.put( theirs, name=key )
+                if key in self._loaded:
+                    self._loaded[ key ] = self._bind( theirs, key )
+
+    def _shard( self, name, create=False ):
+        """
+        The shard of the (processed) record name, read on first use. A
+        missing shard is added if create, or else stands in as an empty Db.
+        """
+        key   = self._shardOf( name )
+        shard = self._loaded.get( key )
+        if shard is not None:
+            return shard
+
+        if key in self._shardNames():
+            shard = self._loaded[ key ] = self._bind( self.hub.extract( key ), key )
+        elif create:
+            shard = self._loaded[ key ] = self._addShard( key )
+        else:
+            shard = db.Db()
+
+        return shard
+
+    def _shardUri( self, key ):
+        return f"{ self.root.rstrip( '/' ) }/{ key }.gluedb"
+
+    def _bind( self, shard, key ):
+        """ a shard as read, persisting back to its file if it has one """
+        shard._base = tuple( shard.records )
+        if self.root:
+            shard.url         = self._shardUri( key )
+            shard.datahandler = self.datahandler
+            shard.persist     = True
+        return shard
+
+    def _addShard( self, key ):
+        if self.root:
+            self.hub.post( iomodel.IoModel( uri=self._shardUri( key ), datahandler=self.datahandler, kwWrite={ 'overwrite': True }), name=key )
+        else:
+            self.hub.post( db.Db(), name=key )
+
+        self._dirty.add( key )
+        self._indexDirty = True
+        return self._bind( db.Db(), key )
+
+    def _shardNames( self ):
+        return set( self.hub.getNames() )
+
+    def _loadAll( self ):
+        """ reads every shard not yet read, concurrently """
+        missing = [ key for key in self.hub.getNames() if key not in self._loaded ]
+        for key, shard in self.hub.extractMany( missing ).items():
+            if isinstance( shard, Exception ):
+                raise shard
+            self._loaded[ key ] = self._bind( shard, key )
+
+
+def _nameOf( obj, name=None ):
+    """ name, or else the name of obj """
+    if name is None:
+        name = getattr( obj, 'name', None )
+    if name is None and isinstance( obj, dict ):
+        name = obj.get( 'name' )
+    if name is None:
+        raise ValueError( "a record name is needed, as name= or obj with .name / obj['name']" )
+    return name
@@ -16,6 +16,11 @@ Mixin
 import re
 import enum as _enum
 
+
+_VALID_START = re.compile( r'^[a-zA-Z_]' )
+_INVALID     = re.compile( r'\W|^(?=\d)' )
+
+
 class Mixin:
     """
     Mixin providing utility methods for enum classes.
@@ -122,10 +127,10 @@ class Mixin:
         validName = str(name)
         replacement = '_'
 
-        if not re.match( r'^[a-zA-Z_]', validName ):
+        if not _VALID_START.match( validName ):
             validName = replacement + validName
 
-        validName = re.sub( r'\W|^(?=\d)', replacement, validName )
+        validName = _INVALID.sub( replacement, validName )
 
         while validName.startswith( replacement*2 ):
             validName = validName[1:]
@@ -71,6 +71,10 @@ class Hub( hub.Hub ):
     def mergeToDb(self, otherDb, dbName, overwrite=True):
         return super().mergeToDb(otherDb, dbName, overwrite=overwrite)
 
+    @_resolve_db_name(param="dbName", arg_index=0)
+    def batch(self, dbName, overwrite=True):
+        return super().batch(dbName, overwrite=overwrite)
+
     @_resolve_db_name(param="dbName", arg_index=0)
     def deleteFromDb(self, dbName, name, overwrite=True):
         return super().deleteFromDb(dbName, name, overwrite=overwrite)
@@ -86,3 +90,6 @@ class Hub( hub.Hub ):
     @_resolve_db_name(param="dbName", arg_index=0)
     def acquireFromDb(self, dbName, name):
         return super().acquireFromDb(dbName, name)
+
+    def refresh(self, dbName=None):
+        return super().refresh(None if dbName is None else _resolve_setting_name(dbName))
@@ -31,7 +31,7 @@ Example
 
 import numpy as np
 from typing import Any, Union, List, TypeVar
-from pydantic import model_validator, field_validator, Field
+from pydantic import model_validator, field_validator, field_serializer, Field
 
 from pyswark.core.models import xputs, converter
 
@@ -44,12 +44,18 @@ class Inputs( xputs.BaseInputs ):
     Parameters
     ----------
     data : array-like
-        The array data (list, tuple, or numpy array).
+        The array data (list, tuple, or numpy array). Numpy arrays are
+        copied, and only listed on serialization; memory-mapped ones are
+        kept as-is.
     dtype : str, optional
         The numpy dtype (e.g., 'float64', 'int32').
+    copyData : bool, optional
+        False keeps a numpy array as-is instead of copying it, so changes
+        to the array show in the tensor.
     """
-    data  : Union[ NumpyArray, List ]
-    dtype : Any = Field( None )
+    data     : Union[ NumpyArray, List ]
+    dtype    : Any  = Field( None )
+    copyData : bool = Field( True, exclude=True )
 
     @field_validator( 'dtype', mode='before' )
     def _dtype(cls, dtype):
@@ -60,9 +66,11 @@ class Inputs( xputs.BaseInputs ):
         data  = self.data
         dtype = self.dtype
 
-        if isinstance( data, np.ndarray ) and dtype is None:
-            dtype = self._dtype( data.dtype )
-            data  = data.tolist()
+        if isinstance( data, np.ndarray ):
+            if self.copyData and not isinstance( data, np.memmap ):
+                self.data = np.array( data, copy=True )
+            self.dtype = dtype or self._dtype( data.dtype )
+            return self
 
         if isinstance( data, tuple ):
             data = list( data )
@@ -78,6 +86,10 @@ class Inputs( xputs.BaseInputs ):
 
         return self
 
+    @field_serializer( 'data' )
+    def _serializeData(self, data):
+        return data.tolist() if isinstance( data, np.ndarray ) else data
+
 
 class Tensor( converter.ConverterModel ):
     """
@@ -113,12 +125,41 @@ class Tensor( converter.ConverterModel ):
         """Return the underlying numpy array."""
         return self.outputs
 
+    def __array__(self, dtype=None, copy=None):
+        tensor = self.tensor
+        return tensor if dtype is None else tensor.astype( dtype, copy=False )
+
+    @classmethod
+    def read( cls, uri, mmap_mode=None, **kw ):
+        """
+        Read a tensor from a ``.npy`` uri.
+
+        Parameters
+        ----------
+        uri : str
+            The uri to read from, i.e. ``file:./weights.npy``.
+        mmap_mode : str, optional
+            i.e. ``'r'``: memory-map a local file instead of reading it, so
+            many worker processes can share one array cheaply.
+
+        Example
+        -------
+        >>> m = Matrix.read('file:./weights.npy', mmap_mode='r')
+        """
+        from pyswark.core.io import api
+        return cls( api.read( uri, mmap_mode=mmap_mode, **kw ) )
+
+    def write( self, uri, overwrite=False, **kw ):
+        """Write the tensor to a ``.npy`` uri."""
+        from pyswark.core.io import api
+        return api.write( self.tensor, uri, overwrite=overwrite, **kw )
+
     @classmethod
     def convert( cls, inputs: Inputs ) -> np.ndarray:
         data   = inputs.data
         dtype  = inputs.dtype
-        tensor = np.asarray( data )
-        tensor = tensor.astype( dtype ) if dtype else tensor
+        tensor = np.asanyarray( data )
+        tensor = tensor.astype( dtype, copy=False ) if dtype else tensor
         return cls._validateTensor( tensor )
 
     @staticmethod
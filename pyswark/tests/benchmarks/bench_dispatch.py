@@ -0,0 +1,72 @@
+"""
+Benchmark: uri model dispatch
+=============================
+
+Times ``UriModel._resolve``, which picks the model of a uri, with the
+built-in schemes and again after registering many plugin schemes, for
+
+- uris of a registered scheme, i.e. ``pyswark:/data/df.csv``
+- uris left to the guess, i.e. ``./data/prices.csv``, ``example.com``
+
+Resolution bypasses the model cache, so every call pays for dispatch.
+
+Usage::
+
+    python -m pyswark.tests.benchmarks.bench_dispatch [N] [SCHEMES]
+"""
+import sys
+import time
+from typing import ClassVar
+from pydantic import Field
+
+from pyswark.core.models.uri import interface
+from pyswark.core.models.uri.base import UriModel
+
+
+RUNS = [
+    ( 'registered', [ 'pyswark:/data/df.csv', 'mem://step/prices', 'https://example.com/data.json' ] ),
+    ( 'guessed', [ './data/prices.csv', '/abs/prices.parquet', 'example.com', 'www.example.com/a.json' ] ),
+]
+
+
+def plugin( i ):
+    """ a uri model for the scheme plugin<i> """
+    class Inputs( interface.Inputs ):
+        uri    : str
+        SCHEME : ClassVar = f'plugin{ i }'
+
+    class Model( interface.Model ):
+        inputs  : Inputs
+        outputs : interface.Outputs = Field( default=None, description="" )
+        SCHEME  : ClassVar = Inputs.SCHEME
+
+    return Model
+
+
+def timeit( uris, n ):
+    start = time.perf_counter()
+    for i in range( n ):
+        UriModel._resolve( uris[ i % len( uris ) ] )
+    return ( time.perf_counter() - start ) / n
+
+
+def report( label, n ):
+    for name, uris in RUNS:
+        print( f'{ label:<16} { name:<10} -> { timeit( uris, n ) * 1e6:,.1f} us/resolve' )
+
+
+def main( n=5000, schemes=200 ):
+    report( f'{ len( UriModel._MODELS ) } schemes', n )
+
+    added = [ plugin( i ) for i in range( schemes ) ]
+    for Model in added:
+        UriModel.register( Model )
+    try:
+        report( f'{ len( UriModel._MODELS ) } schemes', n )
+    finally:
+        for Model in added:
+            UriModel._MODELS.pop( Model.SCHEME )
+
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
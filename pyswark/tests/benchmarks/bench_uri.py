@@ -0,0 +1,59 @@
+"""
+Benchmark: uri overhead per api.read
+====================================
+
+Times the uri work that ``api.read`` does before any I/O: guessing the
+handler, building the handler's ``UriModel``, and reading the components
+the handler uses (``fsspec``, ``path``, ``Ext``, ``scheme``), for
+
+- repeated uris, as in a catalog read over and over
+- unique uris, as in timestamped output paths
+
+Usage::
+
+    python -m pyswark.tests.benchmarks.bench_uri [N]
+"""
+import sys
+import time
+
+from pyswark.core.io import guess
+from pyswark.core.models.uri.base import UriModel
+
+
+URIS = [
+    'file:./data/prices.csv',
+    '/abs/path/to/prices.parquet',
+    'pyswark:/data/df.csv',
+    'https://example.com/data.json',
+    'python://pyswark.core.io.api',
+]
+
+
+def overhead( uri ):
+    """ the uri work of one api.read """
+    guess.api( uri )
+    model = UriModel( uri )
+    return model.fsspec, model.path, model.Ext.full, model.scheme
+
+
+def timeit( fn, n ):
+    start = time.perf_counter()
+    fn()
+    return ( time.perf_counter() - start ) / n
+
+
+def main( n=5000 ):
+    repeated = [ URIS[ i % len( URIS ) ] for i in range( n ) ]
+    unique   = [ f'file:./data/{ i }/prices.csv' for i in range( n ) ]
+
+    runs = [
+        ( 'repeated uris', repeated ),
+        ( 'unique uris', unique ),
+    ]
+    for name, uris in runs:
+        seconds = timeit( lambda: [ overhead( uri ) for uri in uris ], n )
+        print( f'{ name:<14} { n } reads -> { seconds * 1e6:,.1f} us/read' )
+
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
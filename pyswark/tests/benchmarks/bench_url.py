@@ -0,0 +1,89 @@
+"""
+Benchmark: Url handler throughput
+=================================
+
+Fetches N urls from a local http server that charges a fixed cost per
+new connection (standing in for a TCP/TLS handshake) and per request
+(standing in for network latency), comparing:
+
+- ``fsspec.open`` per url, serially (the previous ``Url._read`` path)
+- ``pool.fetch`` per url, serially (keep-alive alone)
+- ``pool.fetchAll``, with keep-alive sessions and bounded concurrency
+
+Usage::
+
+    python -m pyswark.tests.benchmarks.bench_url [N]
+"""
+import sys
+import time
+import threading
+import http.server
+
+import fsspec
+
+from pyswark.core.io import pool
+
+
+HANDSHAKE = 0.02
+LATENCY   = 0.005
+BODY      = b'x' * 4096
+
+
+class Handler( http.server.BaseHTTPRequestHandler ):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        time.sleep( HANDSHAKE )
+        super().setup()
+
+    def do_GET(self):
+        time.sleep( LATENCY )
+        self.send_response( 200 )
+        self.send_header( 'Content-Length', str( len( BODY )) )
+        self.end_headers()
+        self.wfile.write( BODY )
+
+    def log_message(self, *args):
+        pass
+
+
+def timeit( fn ):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main( n=200 ):
+    server = http.server.ThreadingHTTPServer( ( '127.0.0.1', 0 ), Handler )
+    threading.Thread( target=server.serve_forever, daemon=True ).start()
+    urls = [ f'http://127.0.0.1:{ server.server_address[1] }/{ i }' for i in range( n ) ]
+
+    def fsspecSerial():
+        for url in urls:
+            with fsspec.open( url, 'rb' ) as fp:
+                fp.read()
+
+    def pooledSerial():
+        for url in urls:
+            pool.fetch( url )
+
+    def pooled():
+        pool.fetchAll( urls )
+
+    try:
+        runs = [
+            ( 'fsspec.open, serial', fsspecSerial ),
+            ( 'pool.fetch, serial', pooledSerial ),
+            ( 'pool.fetchAll', pooled ),
+        ]
+        for name, fn in runs:
+            seconds = timeit( fn )
+            print( f'{ name:<22} { n } urls in { seconds:.3f}s -> { n / seconds:,.0f} urls/s' )
+    finally:
+        pool.close()
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
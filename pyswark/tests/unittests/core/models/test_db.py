@@ -27,11 +27,13 @@ import os
 import shutil
 import tempfile
 import unittest
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 
 from pyswark.lib.pydantic import base
-from pyswark.core.models.db import Db, DbSQLModel
+from pyswark.core.models.db import Db, DbSQLModel, Conflict
 from pyswark.core.models import record, body
-from pyswark.core.io import api
+from pyswark.core.io import api, lock
 
 
 class Ticker(base.BaseModel):
@@ -404,6 +406,134 @@ class TestMixinDbConnect(unittest.TestCase):
         self.assertEqual(rec.body.extract().symbol, 'X')
 
 
+def _postFromProcess(path, symbol):
+    """Connect, post one ticker, and persist, merging with other writers."""
+    with Db.connect(path, datahandler='pjson', persist=True, onConflict='merge') as db:
+        db.post(Ticker(symbol=symbol, longName=symbol, exchange='NYSE'), name=symbol)
+
+
+class TestConcurrentDb(unittest.TestCase):
+    """
+    Tests for sharing a Db between threads, and its file between processes.
+
+    Writes to one instance are serialized by its lock; persisting checks
+    the version of the file and fails, or merges, when another writer
+    persisted first.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.catalog_path = os.path.join(self.temp_dir, 'catalog.pjson')
+
+        db = Db()
+        db.post(Ticker(symbol='AAPL', longName='Apple Inc.', exchange='NASDAQ'), name='AAPL')
+        api.write(db, self.catalog_path, datahandler='pjson')
+
+    def _ticker(self, symbol, longName=None):
+        return Ticker(symbol=symbol, longName=longName or symbol, exchange='NYSE')
+
+    def test_threads_do_not_lose_writes(self):
+        db = Db()
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(lambda i: db.post(self._ticker(f'T{i}'), name=f'T{i}'), range(40)))
+
+        self.assertEqual(len(db.records), 40)
+        self.assertEqual(sorted(rec.id for rec in db.records), list(range(1, 41)))
+
+    def test_persist_bumps_the_version(self):
+        with Db.connect(self.catalog_path, datahandler='pjson', persist=True) as db:
+            db.post(self._ticker('X'), name='X')
+
+        self.assertEqual(db.version, 1)
+        self.assertEqual(api.read(self.catalog_path, datahandler='pjson').version, 1)
+
+    def test_stale_persist_fails(self):
+        first  = Db.connect(self.catalog_path, datahandler='pjson', persist=True)
+        second = Db.connect(self.catalog_path, datahandler='pjson', persist=True)
+
+        first.post(self._ticker('X'), name='X')
+        first.persistToFile()
+
+        second.post(self._ticker('Y'), name='Y')
+        with self.assertRaises(Conflict):
+            second.persistToFile()
+
+        loaded = api.read(self.catalog_path, datahandler='pjson')
+        self.assertIsNotNone(loaded.getByName('X'))
+        self.assertIsNone(loaded.getByName('Y'))
+
+    def test_stale_persist_merges(self):
+        first  = Db.connect(self.catalog_path, datahandler='pjson', persist=True)
+        second = Db.connect(self.catalog_path, datahandler='pjson', persist=True, onConflict='merge')
+
+        first.post(self._ticker('X'), name='X')
+        first.persistToFile()
+
+        second.post(self._ticker('Y'), name='Y')
+        second.deleteByName('AAPL')
+        second.persistToFile()
+
+        loaded = api.read(self.catalog_path, datahandler='pjson')
+        self.assertEqual([rec.info.name for rec in loaded.records], ['X', 'Y'])
+        self.assertEqual([rec.id for rec in loaded.records], [1, 2])
+        self.assertEqual(loaded.version, 2)
+
+    def test_merge_fails_on_a_record_changed_by_both(self):
+        first  = Db.connect(self.catalog_path, datahandler='pjson', persist=True)
+        second = Db.connect(self.catalog_path, datahandler='pjson', persist=True)
+
+        first.put(self._ticker('AAPL', 'Apple'), name='AAPL')
+        first.persistToFile()
+
+        second.put(self._ticker('AAPL', 'Apple Computer'), name='AAPL')
+        with self.assertRaises(Conflict):
+            second.persistToFile(onConflict='merge')
+
+        rec = api.read(self.catalog_path, datahandler='pjson').getByName('AAPL')
+        self.assertEqual(rec.body.extract().longName, 'Apple')
+
+    def test_persist_refuses_a_file_of_another_type(self):
+        db = Db.connect(self.catalog_path, datahandler='pjson', persist=True)
+        api.write(self._ticker('X'), self.catalog_path, datahandler='pjson', overwrite=True)
+
+        with self.assertRaises(Conflict) as ctx:
+            db.persistToFile(onConflict='merge')
+        self.assertNotIn('  ', str(ctx.exception))
+        self.assertIsInstance(api.read(self.catalog_path, datahandler='pjson'), Ticker)
+
+    def test_merge_sees_a_change_to_info(self):
+        first  = Db.connect(self.catalog_path, datahandler='pjson', persist=True)
+        second = Db.connect(self.catalog_path, datahandler='pjson', persist=True)
+
+        rec = first.records[0]
+        first.records[0] = rec.model_copy(update={'info': rec.info.clone(date_created='2020-01-01')})
+        first.persistToFile()
+
+        rec = second.records[0]
+        second.records[0] = rec.model_copy(update={'info': rec.info.clone(date_created='2021-01-01')})
+        with self.assertRaises(Conflict):
+            second.persistToFile(onConflict='merge')
+
+    @unittest.skipUnless(
+        lock.fcntl is not None and 'fork' in multiprocessing.get_all_start_methods(),
+        'needs fork and fcntl file locks'
+    )
+    def test_processes_share_a_file(self):
+        context = multiprocessing.get_context('fork')
+        symbols = [f'P{i}' for i in range(4)]
+        workers = [context.Process(target=_postFromProcess, args=(self.catalog_path, s)) for s in symbols]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        self.assertEqual([w.exitcode for w in workers], [0] * 4)
+        loaded = api.read(self.catalog_path, datahandler='pjson')
+        self.assertEqual(sorted(rec.info.name for rec in loaded.records), ['AAPL', *symbols])
+        self.assertEqual(loaded.version, 4)
+
+
 class TestDbSQLModel(unittest.TestCase):
     """
     Tests for DbSQLModel - SQLite-backed persistence without context manager.
@@ -1,7 +1,11 @@
 import unittest
+from typing import ClassVar
+from pydantic import Field
 
-from pyswark.core.models.uri.base import UriModel
+from pyswark.core.models.uri import interface, generic, file, http, mem
+from pyswark.core.models.uri.base import UriModel, normalize
 from pyswark.core.models.uri.ext import Ext
+from pyswark.core.models.uri.parsed import Uri, Cache
 
 
 class Mixin:
@@ -159,3 +163,117 @@ class ExtTests( unittest.TestCase ):
         e = Ext( 'file.csv.gz' )
         self.assertEqual( e.absolute, 'gz' )
 
+
+
+class ParsedTests( unittest.TestCase ):
+
+    def test_components(self):
+        uri = UriModel.parse( 'https://user@domain.com:8080/a/b.json?q=1#s' )
+        self.assertIsInstance( uri, Uri )
+        self.assertEqual( uri.scheme, 'https' )
+        self.assertEqual( uri.host, 'domain.com' )
+        self.assertEqual( uri.port, '8080' )
+        self.assertEqual( uri.path, '/a/b.json' )
+        self.assertEqual( uri.query, 'q=1' )
+        self.assertEqual( uri.fsspec, 'https://user@domain.com:8080/a/b.json?q=1#s' )
+
+    def test_interned(self):
+        a = UriModel.parse( 'file:./data/a.csv' )
+        b = UriModel.parse( 'file:./data/a.csv' )
+        self.assertIs( a, b )
+        self.assertIs( UriModel( 'file:./data/a.csv' ).parsed, a )
+        self.assertEqual( len({ a, b }), 1 )
+
+    def test_immutable(self):
+        uri = UriModel.parse( 'file:./data/a.csv' )
+        with self.assertRaises( AttributeError ):
+            uri.path = 'other'
+        with self.assertRaises( AttributeError ):
+            uri.other = 1
+
+    def test_bounded(self):
+        interned = Cache( maxsize=2 )
+        for i in range( 3 ):
+            interned.get( str( i ), lambda: Uri( uri=str( i )) )
+        self.assertEqual( len( interned ), 2 )
+
+
+    def test_tryParse(self):
+        self.assertIs( UriModel.tryParse( 'file:./data/a.csv' ), UriModel.parse( 'file:./data/a.csv' ))
+        self.assertIsNone( UriModel.tryParse( '{"a": 1}' ))
+        self.assertIsNone( UriModel.tryParse( None ))
+
+    def test_parseMany(self):
+        parsed = UriModel.parseMany([ 'file:./a.csv', 123, 'file:./a.csv' ])
+        self.assertIsNone( parsed[1] )
+        self.assertIs( parsed[0], parsed[2] )
+
+
+class DispatchTests( unittest.TestCase ):
+
+    def test_scheme_prefix(self):
+        self.assertIsInstance( UriModel._resolve( 'mem://a/b' ), mem.Model )
+        self.assertIsInstance( UriModel._resolve( 'mem' ), file.ModelRelative )
+
+    def test_registered_plugin(self):
+        class Inputs( interface.Inputs ):
+            uri    : str
+            SCHEME : ClassVar = 'plugin'
+
+        class Model( interface.Model ):
+            inputs  : Inputs
+            outputs : interface.Outputs = Field( default=None, description="" )
+            SCHEME  : ClassVar = Inputs.SCHEME
+
+        UriModel.register( Model )
+        try:
+            self.assertIsInstance( UriModel._resolve( 'plugin:///a/b.csv' ), Model )
+        finally:
+            UriModel._MODELS.pop( Model.SCHEME )
+
+    def test_guess(self):
+        self.assertIsInstance( UriModel._resolve( 'a b?c' ), file.ModelRelative )
+        self.assertIsInstance( UriModel._resolve( 'example.com' ), http.ModelHttps )
+        self.assertIsInstance( UriModel._resolve( 'localhost/x' ), http.ModelHttps )
+        self.assertIsInstance( UriModel._resolve( 'host/x.csv' ), file.ModelRelative )
+        self.assertIsInstance( UriModel._resolve( 'user@host/x.csv' ), generic.Model )
+
+
+class CacheTests( unittest.TestCase ):
+
+    def setUp(self):
+        UriModel.cacheClear()
+
+    def tearDown(self):
+        UriModel.cacheConfigure( models=1024 )
+        UriModel.cacheClear()
+
+    def test_equivalent_uris_share_a_model(self):
+        models = [ UriModel._getModel( uri ) for uri in [ 'file:./a.csv', 'file:a.csv', './a.csv' ] ]
+        self.assertIs( models[0], models[1] )
+        self.assertIs( models[0], models[2] )
+
+        info = UriModel.cacheInfo()['models']
+        self.assertEqual(( info.hits, info.misses, info.currsize ), ( 2, 1, 1 ))
+
+    def test_doubled_slash_stays_relative(self):
+        for uri in [ './/x.csv', 'file:.//x.csv' ]:
+            model = UriModel._getModel( uri )
+            self.assertIsInstance( model, file.ModelRelative )
+            self.assertEqual( model.path, 'x.csv' )
+
+        self.assertEqual( normalize( './/x.csv' ), './/x.csv' )
+        self.assertEqual( normalize( '././x.csv' ), 'file:x.csv' )
+
+    def test_bounded(self):
+        UriModel.cacheConfigure( models=2 )
+        for i in range( 5 ):
+            UriModel( f'file:./data/{ i }.csv' ).path
+        self.assertEqual( UriModel.cacheInfo()['models'].currsize, 2 )
+
+    def test_clear(self):
+        UriModel( 'file:./a.csv' ).path
+        UriModel.cacheClear()
+        info = UriModel.cacheInfo()
+        self.assertEqual( info['models'].currsize, 0 )
+        self.assertEqual( info['parsed'].hits, 0 )
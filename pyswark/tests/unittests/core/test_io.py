@@ -2,10 +2,20 @@ import unittest
 import os
 import tempfile
 import shutil
+import numpy
 import pandas
+import time
+import threading
+import http.server
+from importlib import metadata
+from unittest import mock
 
+from pyswark.core import fsspec
 from pyswark.lib.pydantic import base
-from pyswark.core.io import api, datahandler
+from pyswark.core.io import api, guess, datahandler, registry, dataset, pool, filesystems, cas, sql, memory, lock
+from pyswark.core.io.text import Text
+from pyswark.core.io.df import Schema
+from pyswark.core.io.base import CannotOverwrite
 
 
 class TestIsUri( unittest.TestCase ):
@@ -18,6 +28,31 @@ class TestIsUri( unittest.TestCase ):
         self.assertFalse( api.isUri( None ) )
         self.assertFalse( api.isUri( {} ) )
 
+    def test_documents_are_not_uris(self):
+        self.assertFalse( api.isUri( '{"a": 1}' ) )
+        self.assertFalse( api.isUri( 'a: 1\nb: 2' ) )
+        self.assertFalse( api.isUri( '' ) )
+
+    def test_isUriMany(self):
+        uris = [ 'file:./data.csv', '{"a": 1}', None, 'file:./data.csv', 'https://data.csv' ]
+        self.assertEqual( api.isUriMany( uris ), [ api.isUri( uri ) for uri in uris ] )
+
+    def test_text_with_glob_characters_is_not_a_uri(self):
+        for text in [ '[1, 2, 3]', 'a*b', 'hello [world]', 'p/*.xyz' ]:
+            self.assertFalse( api.isUri( text ), text )
+        for uri in [ 'file:*.csv', 'prices/*.csv', 'file:./prices/date=*/part-*.parquet' ]:
+            self.assertTrue( api.isUri( uri ), uri )
+
+    def test_isUriMany_unhashable(self):
+        self.assertEqual( api.isUriMany([ {}, 'file:./data.csv', [ 1 ], {} ]), [ False, True, False, False ] )
+
+    def test_guess_many(self):
+        guesses = guess.many([ 'data.csv', 'data.parquet', '{"a": 1}', 'data.csv' ])
+        self.assertEqual([ g.klass for g in guesses ][:2], [ api.guess( 'data.csv' ), api.guess( 'data.parquet' ) ])
+        self.assertFalse( guesses[2].valid )
+        self.assertIs( guesses[0].parsed, guesses[3].parsed )
+
+
 class TestCaseLocal( unittest.TestCase ):
 
     def setUp(self):
@@ -202,6 +237,86 @@ class TestReadWriteAcquireCsv( TestCaseLocal ):
         self.assertFalse( handler.exists() )
 
 
+class TestCsvSchema( TestCaseLocal ):
+
+    def setUp(self):
+        super().setUp()
+        Schema.clear()
+        self.raw = pandas.DataFrame({
+            'a': [ 1, 2, 3 ],
+            'b': [ 'x', 'y', 'z' ],
+            't': pandas.to_datetime([ '2024-01-01', '2024-01-02', '2024-01-03' ]),
+        })
+
+    def tearDown(self):
+        Schema.clear()
+        super().tearDown()
+
+    def test_engine(self):
+        uri = os.path.join( self.tempdir, 'df.csv.gz' )
+        api.write( self.raw, uri )
+
+        data = api.read( uri, engine='pyarrow' )
+        self.assertListEqual( list( data.columns ), [ 'a', 'b', 't' ] )
+        self.assertListEqual( data['a'].tolist(), [ 1, 2, 3 ] )
+
+    def test_schema_cache(self):
+        uri = os.path.join( self.tempdir, 'df.csv' )
+        api.write( self.raw, uri )
+        api.read( uri, parse_dates=['t'], schema=True )
+
+        with mock.patch( 'pandas.read_csv', wraps=pandas.read_csv ) as read_csv:
+            data = api.read( uri, schema=True )
+
+        kw = read_csv.call_args.kwargs
+        self.assertListEqual( kw['parse_dates'], ['t'] )
+        self.assertEqual( kw['dtype']['a'], 'int64' )
+        self.assertEqual( kw['index_col'], 0 )
+        self.assertTrue( pandas.api.types.is_datetime64_any_dtype( data['t'] ))
+
+    def test_schema_is_limited_to_the_columns_read(self):
+        uri = os.path.join( self.tempdir, 'df.csv' )
+        api.write( self.raw, uri )
+        api.read( uri, parse_dates=['t'], schema=True )
+
+        data = api.read( uri, usecols=['a', 'b'], index_col=None, schema=True )
+        self.assertListEqual( list( data.columns ), [ 'a', 'b' ] )
+
+        data = api.read( uri, usecols=lambda c: c in ( 'a', 't' ), index_col=None, schema=True )
+        self.assertTrue( pandas.api.types.is_datetime64_any_dtype( data['t'] ))
+
+        Schema.clear()
+        api.read( uri, usecols=['a'], index_col=None, schema=True ) # a partial read isn't cached
+        with mock.patch( 'pandas.read_csv', wraps=pandas.read_csv ) as read_csv:
+            api.read( uri, schema=True )
+        self.assertNotIn( 'dtype', read_csv.call_args.kwargs )
+
+    def test_schema_persist(self):
+        uri = os.path.join( self.tempdir, 'df.csv' )
+        api.write( self.raw, uri )
+        api.read( uri, parse_dates=['t'], schema='persist' )
+        self.assertTrue( os.path.exists( os.path.join( self.tempdir, '.df.csv.schema.json' )))
+
+        Schema.clear()
+        data = api.read( uri, schema='persist' )
+        self.assertTrue( pandas.api.types.is_datetime64_any_dtype( data['t'] ))
+
+    def test_schema_follows_the_file(self):
+        uri = os.path.join( self.tempdir, 'df.csv' )
+        api.write( self.raw, uri )
+        api.read( uri, parse_dates=['t'], schema='persist' )
+
+        api.write( pandas.DataFrame({ 'x': [ 1.5, 2.5 ] }), uri, overwrite=True ) # through the handler
+        self.assertFalse( os.path.exists( os.path.join( self.tempdir, '.df.csv.schema.json' )))
+        self.assertListEqual( list( api.read( uri, schema='persist' ).columns ), [ 'x' ] )
+
+        pandas.DataFrame({ 'y': [ 'a' ] }).to_csv( uri ) # behind its back
+        self.assertListEqual( list( api.read( uri, schema=True ).columns ), [ 'y' ] )
+
+    def test_schema_cache_is_bounded(self):
+        self.assertEqual( Schema._CACHE.max_items, 1024 )
+
+
 class TestReadWriteAcquireHtml( TestCaseLocal ):
 
     def test_html_url(self):
@@ -270,3 +385,613 @@ c: 3
 '''
         result = api.read( data, datahandler=datahandler.DataHandler.STRING )
         self.assertListEqual( result, ['a', 'b', {'c': 3}] )
+
+
+class TestRegistry( TestCaseLocal ):
+
+    def setUp(self):
+        super().setUp()
+        self.registry = registry.Registry()
+
+    def test_register_is_lazy_and_cached(self):
+        self.registry.register( 'test.text', 'pyswark.core.io.text.Text', ext='upper' )
+        self.assertDictEqual( self.registry._klasses, {} )
+
+        klass = self.registry.getByExt( 'upper' )
+        self.assertIs( klass, Text )
+        self.assertIs( self.registry.get( 'test.text' ), klass )
+        self.assertIn( 'pyswark.core.io.text.Text', self.registry._klasses )
+
+        with self.assertRaises( ValueError ):
+            self.registry.register( 'test.text', 'pyswark.core.io.text.Text' )
+
+    def test_entry_points(self):
+        eps = {
+            registry.GROUP        : [ metadata.EntryPoint( 'test.ep', 'pyswark.core.io.text:Text', registry.GROUP ) ],
+            registry.GROUP_EXT    : [ metadata.EntryPoint( 'ep', 'pyswark.core.io.text:Text', registry.GROUP_EXT ) ],
+            registry.GROUP_SCHEME : [],
+        }
+        with mock.patch.object( registry, '_entryPoints', side_effect=lambda group: eps[ group ] ):
+            self.assertListEqual( self.registry.names(), [ 'test.ep' ] )
+            self.assertIs( self.registry.getByExt( 'ep' ), Text )
+            self.assertIsNone( self.registry.getByScheme( 'ep' ) )
+
+    def test_conflicts(self):
+        self.registry.register( 'test.text', 'pyswark.core.io.text.Text', ext='upper' )
+        self.registry.register( 'test.same', Text, ext='upper' )
+        with self.assertRaises( ValueError ):
+            self.registry.register( 'test.json', 'pyswark.core.io.json.Json', ext='upper' )
+        self.assertNotIn( 'test.json', self.registry._handlers )
+
+        eps = {
+            registry.GROUP        : [ metadata.EntryPoint( 'test.ep', 'pyswark.core.io.text:Text', registry.GROUP ) ],
+            registry.GROUP_EXT    : [ metadata.EntryPoint( 'upper', 'pyswark.core.io.json:Json', registry.GROUP_EXT ) ],
+            registry.GROUP_SCHEME : [],
+        }
+        with mock.patch.object( registry, '_entryPoints', side_effect=lambda group: eps[ group ] ):
+            with self.assertWarns( RuntimeWarning ):
+                self.assertIs( self.registry.getByExt( 'upper' ), Text )
+
+            eps[ registry.GROUP ] = []
+            self.registry.clear()
+            self.assertListEqual( self.registry.names(), [ 'test.text', 'test.same' ] )
+
+    def test_read_write_through_api(self):
+        with mock.patch.object( registry, 'REGISTRY', self.registry ):
+            registry.register( 'test.text', 'pyswark.core.io.text.Text', ext='upper' )
+
+            uri = os.path.join( self.tempdir, 'data.upper' )
+            api.write( 'HELLO', uri )
+            self.assertEqual( api.read( uri ), 'HELLO' )
+            self.assertEqual( api.read( uri, datahandler='test.text' ), 'HELLO' )
+
+
+class TestFilesystems( TestCaseLocal ):
+
+    def setUp(self):
+        super().setUp()
+        for fn in [ 'a.txt', 'b.txt' ]:
+            api.write( fn, os.path.join( self.tempdir, fn ))
+
+    def test_shared(self):
+        a = api.acquire( os.path.join( self.tempdir, 'a.txt' ))
+        b = api.acquire( f"file:{ os.path.join( self.tempdir, 'b.txt' ) }" )
+        self.assertIs( a.fs, b.fs )
+        self.assertTrue( a.exists() )
+        self.assertEqual( a.stat()['size'], 5 )
+
+    def test_shared_per_storage_options(self):
+        uri = os.path.join( self.tempdir, 'a.txt' )
+        filesystems.clear()
+        filesystems.resolve( uri )
+        filesystems.resolve( uri, auto_mkdir=True )
+        api.acquire( uri ).open( auto_mkdir=True )
+        self.assertListEqual( sorted( filesystems._FILESYSTEMS ), [ ( 'file', None, '' ), ( 'file', None, '{"auto_mkdir": true}' ) ] )
+
+        filesystems.clear( 'mem' )
+        self.assertEqual( len( filesystems._FILESYSTEMS ), 2 )
+        filesystems.clear( 'file' )
+        self.assertDictEqual( filesystems._FILESYSTEMS, {} )
+
+    def test_exists(self):
+        uris = [ os.path.join( self.tempdir, fn ) for fn in [ 'a.txt', 'b.txt', 'c.txt' ] ]
+        fs   = filesystems.resolve( uris[0] )[0]
+
+        with mock.patch.object( fs, 'ls', wraps=fs.ls ) as ls:
+            self.assertListEqual( api.exists( uris ), [ True, True, False ] )
+        ls.assert_called_once()
+
+        self.assertFalse( api.exists( uris[2] ))
+        self.assertIsNone( api.stat( uris )[2] )
+        self.assertEqual( api.stat( uris[1] )['size'], 5 )
+
+    def test_ls(self):
+        uris = api.ls( f'{ self.tempdir }/' )
+        self.assertListEqual([ os.path.basename( uri ) for uri in uris ], [ 'a.txt', 'b.txt' ] )
+        self.assertEqual( api.read( uris[0] ), 'a.txt' )
+
+
+class TestCas( TestCaseLocal ):
+
+    def setUp(self):
+        super().setUp()
+        self.root = cas.STORE.root
+        cas.configure( self.tempdir )
+        self.raw = pandas.DataFrame({ 'a': [ 1, 2, 3 ] })
+
+    def tearDown(self):
+        cas.configure( self.root )
+        super().tearDown()
+
+    def test_write_read(self):
+        uri = api.write( self.raw, 'cas:', ext='parquet' )
+        self.assertRegex( uri, r'^cas://[0-9a-f]{64}\.parquet$' )
+        self.assertTrue( api.exists( uri ))
+        pandas.testing.assert_frame_equal( self.raw, api.read( uri ))
+
+    def test_dedup(self):
+        uri1 = api.write( self.raw, 'cas://.parquet' )
+        uri2 = api.write( self.raw.copy(), 'cas:', ext='parquet' )
+        self.assertEqual( uri1, uri2 )
+
+        blobs = [ f for _, _, files in os.walk( self.tempdir ) for f in files ]
+        self.assertEqual( len( blobs ), 1 )
+
+        uri3 = api.write( self.raw + 1, 'cas:', ext='parquet' )
+        self.assertNotEqual( uri1, uri3 )
+
+    def test_verify(self):
+        uri = api.write({ 'a': 1 }, 'cas:', ext='json' )
+        _, path = api.acquire( uri ).resolve()
+        with open( path, 'w' ) as f:
+            f.write( '{"a": 2}' )
+
+        with self.assertRaises( cas.CorruptBlob ):
+            api.read( uri )
+        self.assertDictEqual( api.read( uri, verify=False ), { 'a': 2 } )
+
+    def test_no_ext(self):
+        with self.assertRaises( ValueError ):
+            api.write( self.raw, 'cas:' )
+
+
+class TestSql( TestCaseLocal ):
+
+    def setUp(self):
+        super().setUp()
+        self.uri = f"sqlite:///{ os.path.join( self.tempdir, 'prices.db' ) }?table=ohlc"
+        self.raw = pandas.DataFrame({
+            'date'  : [ '2024-01-01', '2024-01-02', '2024-01-03' ],
+            'close' : [ 1., 2., 3. ],
+        })
+        api.write( self.raw, self.uri )
+
+    def tearDown(self):
+        sql.dispose()
+        super().tearDown()
+
+    def test_read(self):
+        self.assertIsInstance( api.acquire( self.uri ), sql.Sql )
+        pandas.testing.assert_frame_equal( self.raw, api.read( self.uri ))
+
+    def test_pushdown(self):
+        df = api.read( self.uri, columns=['close'], where=[ ('date', '>=', '2024-01-02') ] )
+        self.assertListEqual( df.columns.tolist(), ['close'] )
+        self.assertListEqual( df['close'].tolist(), [ 2., 3. ] )
+
+        df = api.read( self.uri, where='close < :c', params={ 'c': 2.5 }, order_by='close', limit=1 )
+        self.assertListEqual( df['date'].tolist(), [ '2024-01-01' ] )
+
+        base = self.uri.partition( '?' )[0]
+        df   = api.read( base, sql='select count(*) as n from ohlc' )
+        self.assertEqual( df['n'][0], 3 )
+
+    def test_chunks(self):
+        chunks = list( api.read( self.uri, chunksize=2 ))
+        self.assertListEqual([ len( c ) for c in chunks ], [ 2, 1 ] )
+
+    def test_write(self):
+        with self.assertRaises( CannotOverwrite ):
+            api.write( self.raw, self.uri )
+
+        api.write( self.raw, self.uri, append=True )
+        self.assertEqual( len( api.read( self.uri )), 6 )
+
+        api.write( self.raw, self.uri, overwrite=True )
+        self.assertEqual( len( api.read( self.uri )), 3 )
+
+        handler = api.acquire( self.uri )
+        handler.rm()
+        self.assertFalse( handler.exists() )
+
+    def test_no_table(self):
+        handler = api.acquire( self.uri.partition( '?' )[0] )
+        with self.assertRaises( ValueError ):
+            handler.rm()
+        with self.assertRaises( TypeError ):
+            api.readBytes( self.uri )
+
+
+class TestMemory( unittest.TestCase ):
+
+    def setUp(self):
+        memory.clear()
+        self.raw = pandas.DataFrame({ 'a': [ 1, 2, 3 ] })
+
+    def tearDown(self):
+        memory.configure( max_items=None, max_bytes=None )
+        memory.clear()
+
+    def test_object(self):
+        uri = 'mem://step1/prices'
+        self.assertIsInstance( api.acquire( uri ), memory.Mem )
+        self.assertFalse( api.exists( uri ))
+
+        api.write( self.raw, uri )
+        self.assertIs( api.read( uri ), self.raw )
+        self.assertTrue( api.exists( uri ))
+
+        with self.assertRaises( CannotOverwrite ):
+            api.write( self.raw, uri )
+
+        api.acquire( uri ).rm()
+        with self.assertRaises( FileNotFoundError ):
+            api.read( uri )
+
+    def test_serialized(self):
+        uri = 'mem://step1/prices.csv'
+        api.write( self.raw, uri )
+
+        df = api.read( uri )
+        self.assertIsNot( df, self.raw )
+        pandas.testing.assert_frame_equal( self.raw, df )
+        self.assertListEqual( api.ls( 'mem://step1/' ), [ 'mem:///step1/prices.csv' ] )
+
+        api.write( self.raw, uri, datahandler='mem' )
+        self.assertIs( api.read( uri, datahandler='mem' ), self.raw )
+
+    def test_lru(self):
+        memory.configure( max_items=2 )
+        for i in range( 3 ):
+            api.write( i, f'mem://x{ i }' )
+        api.read( 'mem://x1' )
+        api.write( 3, 'mem://x3' )
+        self.assertListEqual( list( memory.OBJECTS ), [ '/x1', '/x3' ] )
+
+    def test_max_bytes(self):
+        memory.configure( max_bytes=1000 )
+        for i in range( 3 ):
+            api.write( numpy.zeros( 100 ), f'mem://x{ i }' )
+        self.assertListEqual( list( memory.OBJECTS ), [ '/x2' ] )
+        self.assertEqual( memory.OBJECTS.nbytes, 800 )
+
+    def test_configure_none_removes_a_bound(self):
+        memory.configure( max_items=2, max_bytes=1000 )
+        memory.configure( max_items=None )
+        self.assertIsNone( memory.OBJECTS.max_items )
+        self.assertEqual( memory.OBJECTS.max_bytes, 1000 )
+
+        for i in range( 3 ):
+            api.write( i, f'mem://x{ i }' )
+        self.assertEqual( len( memory.OBJECTS ), 3 )
+
+
+class TestDataset( TestCaseLocal ):
+
+    def setUp(self):
+        super().setUp()
+        self.dates = [ '2024-01-01', '2024-01-02', '2024-01-03' ]
+        for date in self.dates:
+            api.write( pandas.DataFrame({ 'a': [1, 2] }), os.path.join( self.tempdir, f'date={ date }', 'part-0.parquet' ))
+            api.write( pandas.DataFrame({ 'a': [3] }), os.path.join( self.tempdir, f'date={ date }', 'part-1.csv.gz' ))
+        api.write( '', os.path.join( self.tempdir, '_SUCCESS.txt' ))
+
+    def test_guess(self):
+        self.assertIs( api.guess( f'{ self.tempdir }/date=*/*.parquet' ), dataset.Dataset )
+        self.assertIs( api.guess( f'{ self.tempdir }/' ), dataset.Dataset )
+        self.assertIsNot( api.guess( f'{ self.tempdir }/date=2024-01-01/part-0.parquet' ), dataset.Dataset )
+
+    def test_read_glob(self):
+        df = api.read( f'{ self.tempdir }/date=*/part-*.parquet' )
+        self.assertListEqual( df['a'].tolist(), [1, 2] * 3 )
+        self.assertListEqual( df['date'].tolist(), sorted( self.dates * 2 ) )
+
+    def test_read_directory(self):
+        df = api.read( f'file:{ self.tempdir }/' )
+        self.assertEqual( len( df ), 9 )
+        self.assertSetEqual( set( df['date'] ), set( self.dates ) )
+
+    def test_read_with_filters(self):
+        df = api.read( f'{ self.tempdir }/', filters=[ ('date', '>=', '2024-01-02') ] )
+        self.assertSetEqual( set( df['date'] ), { '2024-01-02', '2024-01-03' } )
+
+        df = api.read( f'{ self.tempdir }/*/*.csv.gz', filters=[ ('date', 'in', ['2024-01-01']) ] )
+        self.assertListEqual( df['a'].tolist(), [3] )
+
+        df = api.read( f'{ self.tempdir }/', filters=[ ('date', '==', '1999-01-01') ] )
+        self.assertTrue( df.empty )
+
+    def test_read_with_filters_on_columns(self):
+        df = api.read( f'{ self.tempdir }/', filters=[ ('date', '>=', '2024-01-02'), ('a', '>', 1) ] )
+        self.assertListEqual( sorted( df['a'].tolist() ), [2, 2, 3, 3] )
+
+        df = api.read( f'{ self.tempdir }/', filters=[ ('a', 'not in', [1, 2]) ] )
+        self.assertListEqual( df['a'].tolist(), [3] * 3 )
+
+        with self.assertRaises( ValueError ):
+            api.read( f'{ self.tempdir }/', filters=[ ('nothing', '==', 1) ] )
+
+    def test_partitions(self):
+        partitions = dataset.partitions( '/root/year=2024/region=us/part-0.parquet', '/root' )
+        self.assertDictEqual( partitions, { 'year': '2024', 'region': 'us' } )
+        self.assertTrue( dataset._keep( partitions, [ ('year', '>', 999) ] ) )
+        self.assertFalse( dataset._keep( partitions, [ ('year', '<', 999) ] ) )
+
+    def test_shares_its_filesystem(self):
+        uri = f'{ self.tempdir }/date=*/part-*.parquet'
+        self.assertIs( api.acquire( uri ).fs, filesystems.resolve( f'{ self.tempdir }/' )[0] )
+
+    def test_exists(self):
+        self.assertTrue( api.acquire( f'{ self.tempdir }/' ).exists() )
+        self.assertFalse( api.acquire( f'{ self.tempdir }/nothing/*.csv' ).exists() )
+
+    def test_write_partitioned(self):
+        raw = pandas.DataFrame({
+            'date'   : [ '2024-01-01', '2024-01-02', '2024-01-01', None ],
+            'region' : [ 'us', 'eu', 'eu', 'us' ],
+            'a'      : [ 1, 2, 3, 4 ],
+        })
+        uri = f'{ self.tempdir }/out/'
+
+        written = api.write( raw, uri, partition_by=[ 'date', 'region' ], max_workers=2 )
+        self.assertEqual( len( written ), 4 )
+        self.assertTrue( any( 'date=2024-01-01/region=eu/part-0.parquet' in w for w in written ) )
+
+        with self.assertRaises( CannotOverwrite ):
+            api.write( raw, uri, partition_by='date' )
+
+        df = api.read( uri, filters=[ ('region', '==', 'eu') ] )
+        self.assertListEqual( sorted( df['a'].tolist() ), [2, 3] )
+
+        api.write( raw, uri, partition_by='date', ext='csv', overwrite=True )
+        df = api.read( uri ).sort_values( 'a' )
+        self.assertListEqual( df['a'].tolist(), [1, 2, 3, 4] )
+        self.assertTrue( pandas.isna( df['date'].iloc[-1] ) )
+
+
+class TestLock( TestCaseLocal ):
+
+    def test_rwlock_readers_share_and_writers_exclude(self):
+        rw      = lock.RWLock()
+        inside  = []
+        entered = threading.Event()
+        leave   = threading.Event()
+
+        def read():
+            with rw.read():
+                entered.set()
+                leave.wait( 1 )
+
+        def write():
+            with rw.write():
+                inside.append( 'w' )
+
+        with rw.read():
+            reader = threading.Thread( target=read )
+            reader.start()
+            self.assertTrue( entered.wait( 1 )) # another reader gets in
+
+        writer = threading.Thread( target=write )
+        writer.start()
+        time.sleep( 0.05 )
+        self.assertEqual( inside, [] ) # while a reader is in
+
+        leave.set()
+        reader.join( 1 )
+        writer.join( 1 )
+        self.assertEqual( inside, [ 'w' ])
+
+    def test_rwlock_waiting_writer_goes_before_new_readers(self):
+        rw    = lock.RWLock()
+        order = []
+
+        def write():
+            with rw.write():
+                order.append( 'w' )
+
+        def read():
+            with rw.read():
+                order.append( 'r' )
+
+        with rw.read():
+            writer = threading.Thread( target=write )
+            writer.start()
+            while not rw._waiting:
+                time.sleep( 0.01 )
+
+            reader = threading.Thread( target=read )
+            reader.start()
+            time.sleep( 0.05 )
+            self.assertEqual( order, [] ) # the new reader waits behind the writer
+
+            with rw.read(): # but a thread already reading does not
+                order.append( 'nested' )
+
+        writer.join( 1 )
+        reader.join( 1 )
+        self.assertListEqual( order, [ 'nested', 'w', 'r' ] )
+
+    def test_rwlock_writer_reenters(self):
+        rw = lock.RWLock()
+        with rw.write():
+            with rw.write():
+                with rw.read():
+                    pass
+        self.assertIsNone( rw._writer )
+
+    def test_filelock_exclusive_and_shared(self):
+        uri = f'file://{ self.tempdir }/catalog.gluedb'
+
+        with lock.FileLock( uri ):
+            self.assertTrue( os.path.exists( f'{ self.tempdir }/catalog.gluedb.lock' ))
+            with self.assertRaises( TimeoutError ):
+                lock.FileLock( uri, shared=True, timeout=0.05 ).acquire()
+
+        with lock.FileLock( uri, shared=True ), lock.FileLock( uri, shared=True, timeout=0.05 ):
+            with self.assertRaises( TimeoutError ):
+                lock.FileLock( uri, timeout=0.05 ).acquire()
+
+    def test_filelock_skips_other_filesystems(self):
+        with lock.FileLock( 'mem://catalog.gluedb' ) as held:
+            self.assertIsNone( held.path )
+            self.assertIsNone( held._fd )
+
+
+class RangeRequestHandler( http.server.BaseHTTPRequestHandler ):
+    """ serves BODY, honouring 'Range: bytes=a-b' and 'Range: bytes=-n', or the STATUS of a path """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    BODY    = b'0123456789' * 10
+    RANGES  = []
+    CLIENTS = set()
+    HEADERS = []
+    STATUS  = { '/missing.txt': 404, '/private.txt': 403 }
+
+    def do_HEAD(self):
+        self.send_response( 200 )
+        self.send_header( 'Content-Length', str( len( self.BODY )) )
+        self.end_headers()
+
+    def do_GET(self):
+        body, rng = self.BODY, self.headers.get( 'Range' )
+        self.RANGES.append( rng )
+        self.CLIENTS.add( self.client_address )
+        self.HEADERS.append( dict( self.headers ))
+
+        if self.path in self.STATUS:
+            self.send_response( self.STATUS[ self.path ] )
+            self.send_header( 'Content-Length', '0' )
+            self.end_headers()
+            return
+
+        if rng:
+            start, end = rng.replace( 'bytes=', '' ).split( '-' )
+            if not start:
+                body = body[ -int( end ): ]
+            else:
+                body = body[ int( start ): int( end ) + 1 if end else None ]
+            self.send_response( 206 )
+        else:
+            self.send_response( 200 )
+
+        self.send_header( 'Content-Length', str( len( body )) )
+        self.end_headers()
+        self.wfile.write( body )
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpServer( TestCaseLocal ):
+    HANDLER = RangeRequestHandler
+
+    def setUp(self):
+        super().setUp()
+        self.server = http.server.ThreadingHTTPServer( ( '127.0.0.1', 0 ), self.HANDLER )
+        self.thread = threading.Thread( target=self.server.serve_forever, daemon=True )
+        self.thread.start()
+        self.url = f'http://127.0.0.1:{ self.server.server_address[1] }'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+
+class TestByteRange( TestHttpServer ):
+
+    def setUp(self):
+        super().setUp()
+        self.HANDLER.RANGES.clear()
+        self.uri = os.path.join( self.tempdir, 'data.txt' )
+        api.write( 'header\nline 1\nline 2\n', self.uri )
+
+    def test_text_range(self):
+        self.assertEqual( api.read( self.uri, end=6 ), 'header' )
+        self.assertEqual( api.read( self.uri, start=7, end=13 ), 'line 1' )
+        self.assertEqual( api.read( self.uri ), 'header\nline 1\nline 2\n' )
+
+    def test_text_tail(self):
+        self.assertEqual( api.readTail( self.uri, 7 ), 'line 2\n' )
+
+    def test_read_bytes(self):
+        self.assertEqual( api.readBytes( self.uri, start=-7, end=-1 ), b'line 2' )
+
+    def test_url_range(self):
+        uri = f'{ self.url }/data.txt'
+        self.assertEqual( api.read( uri, start=10, end=15 ), '01234' )
+        self.assertEqual( api.readTail( uri, 3 ), '789' )
+        self.assertListEqual( self.HANDLER.RANGES, [ 'bytes=10-14', 'bytes=-3' ] )
+
+    def test_url_errors(self):
+        with self.assertRaises( FileNotFoundError ):
+            api.read( f'{ self.url }/missing.txt' )
+        with self.assertRaises( PermissionError ):
+            api.read( f'{ self.url }/private.txt' )
+
+    def test_url_storage_options(self):
+        handler = api.acquire( f'{ self.url }/data.txt' )
+        handler._resolved = ( fsspec.filesystem( 'http', headers={ 'X-Token': 'abc' }, client_kwargs={ 'auth': ( 'user', 'pass' ) }), handler.uri.fsspec )
+
+        self.HANDLER.HEADERS.clear()
+        self.assertEqual( handler.read( headers={ 'X-Trace': '1' } ), self.HANDLER.BODY.decode() )
+        headers = self.HANDLER.HEADERS[-1]
+        self.assertEqual( headers[ 'X-Token' ], 'abc' )
+        self.assertEqual( headers[ 'X-Trace' ], '1' )
+        self.assertTrue( headers[ 'Authorization' ].startswith( 'Basic ' ))
+
+
+class TestNumpy( TestCaseLocal ):
+
+    def setUp(self):
+        super().setUp()
+        self.raw = numpy.arange( 12. ).reshape( 3, 4 )
+
+    def test_npy(self):
+        uri = os.path.join( self.tempdir, 'data.npy' )
+        api.write( self.raw, uri )
+
+        data = api.read( uri )
+        self.assertNotIsInstance( data, numpy.memmap )
+        numpy.testing.assert_array_equal( self.raw, data )
+
+        data = api.read( uri, mmap_mode='r' )
+        self.assertIsInstance( data, numpy.memmap )
+        numpy.testing.assert_array_equal( self.raw, data )
+
+    def test_npz(self):
+        uri = os.path.join( self.tempdir, 'data.npz' )
+        api.write({ 'a': self.raw, 'b': [1, 2] }, uri, compressed=True )
+
+        data = api.read( uri )
+        self.assertListEqual( sorted( data ), [ 'a', 'b' ] )
+        numpy.testing.assert_array_equal( self.raw, data['a'] )
+
+
+class TestSessionPool( TestHttpServer ):
+
+    def setUp(self):
+        super().setUp()
+        self.HANDLER.CLIENTS.clear()
+        self.pool = pool.SessionPool( timeout=5, max_per_host=2 )
+
+    def tearDown(self):
+        self.pool.close()
+        super().tearDown()
+
+    def test_fetch_reuses_connections(self):
+        urls   = [ f'{ self.url }/{ i }.txt' for i in range( 20 ) ]
+        bodies = self.pool.fetchAll( urls, max_workers=8 )
+
+        self.assertListEqual( bodies, [ self.HANDLER.BODY ] * 20 )
+        self.assertLessEqual( len( self.HANDLER.CLIENTS ), 2 )
+
+    def test_session_per_host(self):
+        session, semaphore = self.pool.session( f'{ self.url }/a' )
+        self.assertIs( self.pool.session( f'{ self.url }/b' )[0], session )
+        self.assertIsNot( self.pool.session( 'http://localhost:1/a' )[0], session )
+
+        self.pool.configure( max_per_host=4 )
+        self.assertIsNot( self.pool.session( f'{ self.url }/a' )[0], session )
+
+    def test_range(self):
+        self.assertEqual( pool._range( 10, 15 ), 'bytes=10-14' )
+        self.assertEqual( pool._range( -3, None ), 'bytes=-3' )
+        self.assertEqual( pool._range( None, 5 ), 'bytes=0-4' )
+        self.assertIsNone( pool._range( 2, -2 ) )
+        self.assertEqual( self.pool.fetch( f'{ self.url }/a', start=2, end=-2 ), self.HANDLER.BODY[ 2:-2 ] )
+
+    def test_read_many(self):
+        uris = [ f'{ self.url }/{ i }.txt' for i in range( 5 ) ]
+        self.assertListEqual( api.readMany( uris ), [ self.HANDLER.BODY.decode() ] * 5 )
@@ -1,4 +1,5 @@
 import unittest
+import asyncio
 import tempfile
 import pathlib
 import shutil
@@ -10,6 +11,7 @@ from pyswark.core.models import primitive, collection, infer
 from pyswark.core.io import api
 
 from pyswark.gluedb import db as db_module
+from pyswark.gluedb import cache
 from pyswark.gluedb.models import iomodel
 from pyswark.gluedb.db import Db
 from pyswark.gluedb.models.iomodel import IoModel
@@ -159,6 +161,43 @@ class TestCRUD( unittest.TestCase ):
         self.assertDictEqual( old, {'d': 4, 'e': 5, 'f': 6} )
         self.assertDictEqual( new, {'g': 7, 'h': 8, 'i': 9} )
 
+    def test_MERGE_duplicate_names_leaves_the_db_unchanged(self):
+        db = buildDB_1()
+        other = buildDB_2()
+        other.post( collection.Dict({'z': 0}), name='a' )
+
+        with self.assertRaises( ValueError ) as ctx:
+            db.merge( other )
+        self.assertIn( "'a'", str( ctx.exception ))
+        self.assertListEqual( db.getNames(), ['a', 'b'] )
+
+    def test_MERGE_many(self):
+        db = db_module.Db().mergeAll([ buildDB_1(), buildDB_2() ])
+        self.assertListEqual( db.getNames(), ['a', 'b', 'c', 'd'] )
+        self.assertListEqual([ rec.id for rec in db.records ], [1, 2, 3, 4] )
+        self.assertDictEqual( db.extract( 'd' ), {'g': 7, 'h': 8, 'i': 9} )
+
+    def test_POST_a_json_list(self):
+        db = db_module.Db()
+        db.post( '["file:./a.csv"]', name='a' )
+        self.assertEqual( db.get( 'a' ).acquire().uri, 'file:./a.csv' )
+
+    def test_POST_many_classifies_uris_at_once(self):
+        objs = [ 'file:./a.csv', pathlib.Path( 'a/b.csv' ), {}, '{"uri": "file:./c.csv", "name": "c"}' ]
+        self.assertListEqual( Db._classifyUris( objs ), [ {'uri': 'file:./a.csv'}, {'uri': 'a/b.csv'}, {}, objs[-1] ] )
+
+    def test_enum_is_cached_until_the_names_change(self):
+        db = buildDB_1()
+        Enum = db.enum
+        self.assertIs( db.enum, Enum )
+
+        db.post( collection.Dict({'x': 1}), name='x' )
+        self.assertIsNot( db.enum, Enum )
+        self.assertListEqual([ m.value for m in db.enum ], ['a', 'b', 'x'] )
+
+        db.delete( 'x' )
+        self.assertListEqual([ m.value for m in db.enum ], ['a', 'b'] )
+
     @staticmethod
     def makeTestDb():
         db_1 = buildDB_1()
@@ -235,6 +274,174 @@ class TestLoad( unittest.TestCase ):
         pandas.testing.assert_frame_equal( DF, expected )
 
 
+class TestExtractCache( unittest.TestCase ):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.uri = str( pathlib.Path( self.tempdir ) / 'jpm.csv' )
+        pandas.DataFrame({'a': [1,2,3]}).to_csv( self.uri, index=False )
+
+        self.db = db_module.Db()
+        self.db.post( self.uri, name='JPM' )
+        self.db.post( collection.Dict({'window': 60}), name='config' )
+        self.db.enableCache()
+
+    def tearDown(self):
+        shutil.rmtree( self.tempdir )
+
+    def test_repeated_extracts_are_cached(self):
+        first = self.db.extract( 'JPM' )
+        self.assertIs( self.db.extract( 'JPM' ), first )
+        self.assertDictEqual( self.db.extract( 'config' ), {'window': 60} )
+
+        info = self.db.cacheInfo()
+        self.assertEqual(( info.hits, info.misses, info.currsize ), ( 1, 2, 1 ))
+
+    def test_source_change_invalidates(self):
+        self.db.extract( 'JPM' )
+        pandas.DataFrame({'a': [4,5,6,7]}).to_csv( self.uri, index=False )
+
+        self.assertEqual( len( self.db.extract( 'JPM' )), 4 )
+        self.assertEqual( self.db.cacheInfo().invalidations, 1 )
+
+    def test_mutation_invalidates(self):
+        self.db.extract( 'JPM' )
+        self.db.put( collection.Dict({'x': 1}), name='JPM' )
+        self.assertDictEqual( self.db.extract( 'JPM' ), {'x': 1} )
+
+        self.db.delete( 'JPM' )
+        self.assertEqual( self.db.cacheInfo().currsize, 0 )
+
+    def test_lru_eviction(self):
+        other = str( pathlib.Path( self.tempdir ) / 'bac.csv' )
+        pandas.DataFrame({'b': [1]}).to_csv( other, index=False )
+        self.db.post( other, name='BAC' )
+        self.db.enableCache( max_items=1 )
+
+        self.db.extract( 'JPM' )
+        self.db.extract( 'BAC' )
+
+        info = self.db.cacheInfo()
+        self.assertEqual(( info.evictions, info.currsize ), ( 1, 1 ))
+
+    def test_disabled_by_default(self):
+        self.assertIsNone( db_module.Db().cacheInfo() )
+
+
+class TestExtractMany( unittest.TestCase ):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.db = db_module.Db()
+        for name in ['JPM', 'BAC']:
+            uri = str( pathlib.Path( self.tempdir ) / f'{ name }.csv' )
+            pandas.DataFrame({'a': [1,2,3]}).to_csv( uri, index=False )
+            self.db.post( uri, name=name )
+        self.db.post( collection.Dict({'window': 60}), name='config' )
+        self.db.post( str( pathlib.Path( self.tempdir ) / 'gone.csv' ), name='gone' )
+
+    def tearDown(self):
+        shutil.rmtree( self.tempdir )
+
+    def test_extractMany(self):
+        results = self.db.extractMany([ 'JPM', 'config', 'BAC' ])
+        self.assertListEqual( list( results ), ['JPM', 'config', 'BAC'] )
+        pandas.testing.assert_frame_equal( results['JPM'], self.db.extract( 'JPM' ))
+        self.assertDictEqual( results['config'], {'window': 60} )
+
+    def test_errors_are_captured(self):
+        results = self.db.extractMany([ 'JPM', 'gone', 'unknown' ])
+        self.assertIsInstance( results['gone'], FileNotFoundError )
+        self.assertIsInstance( results['unknown'], KeyError )
+        self.assertEqual( len( results['JPM'] ), 3 )
+
+    def test_getManyByName(self):
+        records = self.db.getManyByName([ 'BAC', 'unknown', 'config' ])
+        self.assertCountEqual( records, ['BAC', 'config'] )
+
+    def test_uses_the_extract_cache(self):
+        self.db.enableCache()
+        first = self.db.extractMany([ 'JPM' ])['JPM']
+        self.assertIs( self.db.extractMany([ 'JPM' ])['JPM'], first )
+        self.assertEqual( self.db.cacheInfo().hits, 1 )
+
+
+class TestPrefetch( unittest.TestCase ):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.db = db_module.Db()
+        for name in ['JPM', 'BAC', 'C']:
+            uri = str( pathlib.Path( self.tempdir ) / f'{ name }.csv' )
+            pandas.DataFrame({'a': [1,2,3]}).to_csv( uri, index=False )
+            self.db.post( uri, name=name )
+        self.db.post( str( pathlib.Path( self.tempdir ) / 'gone.csv' ), name='gone' )
+
+    def tearDown(self):
+        shutil.rmtree( self.tempdir )
+
+    def test_prefetch_warms_the_cache(self):
+        warmup = self.db.prefetch([ 'JPM', 'BAC', 'gone' ])
+        self.assertTrue( warmup.wait( timeout=30 ))
+        self.assertTrue( warmup.done() )
+        self.assertEqual( warmup.progress, 1.0 )
+        self.assertCountEqual( warmup.loaded, ['JPM', 'BAC'] )
+        self.assertIsInstance( warmup.failed['gone'], FileNotFoundError )
+
+        self.db.extract( 'JPM' )
+        self.assertEqual( self.db.cacheInfo().hits, 1 )
+
+    def test_prefetch_by_predicate(self):
+        warmup = self.db.prefetch( lambda rec: rec.info.name != 'gone' )
+        warmup.wait( timeout=30 )
+        self.assertCountEqual( warmup.loaded, ['JPM', 'BAC', 'C'] )
+
+    def test_prefetch_respects_the_budget(self):
+        self.db.enableCache( max_items=2 )
+        warmup = self.db.prefetch([ 'JPM', 'BAC', 'C' ], max_workers=3 )
+        warmup.wait( timeout=30 )
+        self.assertEqual(( len( warmup.loaded ), len( warmup.skipped )), ( 2, 1 ))
+        self.assertEqual( self.db.cacheInfo().evictions, 0 )
+
+    def test_a_put_gives_back_its_reservation(self):
+        extracts = cache.ExtractCache( max_items=2 )
+        handler  = api.acquire( str( pathlib.Path( self.tempdir ) / 'JPM.csv' ))
+        sig      = cache.signature( handler )
+
+        self.assertTrue( extracts.reserve() )
+        extracts.put( 'JPM', 1, handler, sig, reserved=True ) # read done, counted once
+        self.assertTrue( extracts.reserve() )
+        self.assertFalse( extracts.reserve() )
+
+        extracts.release()
+        self.assertTrue( extracts.reserve() )
+
+    def test_a_read_from_before_an_invalidation_is_not_cached(self):
+        extracts = cache.ExtractCache()
+        handler  = api.acquire( str( pathlib.Path( self.tempdir ) / 'JPM.csv' ))
+        sig      = cache.signature( handler )
+
+        version = extracts.version( 'JPM' )
+        extracts.invalidate( 'JPM' ) # i.e. a put while the old record was read
+        extracts.put( 'JPM', 'stale', handler, sig, version=version )
+        self.assertIs( extracts.get( 'JPM' ), cache.MISSING )
+
+        version = extracts.version( 'JPM' )
+        extracts.put( 'JPM', 'fresh', handler, sig, version=version )
+        self.assertEqual( extracts.get( 'JPM' ), 'fresh' )
+
+        extracts.clear()
+        extracts.put( 'JPM', 'stale', handler, sig, version=version )
+        self.assertIs( extracts.get( 'JPM' ), cache.MISSING )
+
+    def test_await(self):
+        async def warm():
+            return await self.db.prefetch([ 'C' ])
+
+        warmup = asyncio.run( warm() )
+        self.assertListEqual( warmup.loaded, ['C'] )
+
+
 class TestDbTypeSafe(unittest.TestCase):
     """
     Tests for the Db class - type-safe GlueDb database.
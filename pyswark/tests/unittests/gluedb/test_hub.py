@@ -2,11 +2,13 @@ import unittest
 import tempfile
 import pathlib
 import shutil
+from unittest import mock
 
 from pyswark.lib.pydantic import ser_des
 
 from pyswark.core.models import collection
 from pyswark.core.io import api
+from pyswark.core.models.db import Conflict
 
 from pyswark.gluedb import db as db_module
 from pyswark.gluedb import hub as hub_module
@@ -163,6 +165,16 @@ class TestDbHelpers( unittest.TestCase ):
         acq_via_hub = hub.acquireFromDb( 'db_1', 'a' )
         self.assertEqual( type( acq_direct ), type( acq_via_hub ) )
 
+    def test_extractManyFromDb(self):
+        results = self.hub.extractManyFromDb( 'db_1', ['a', 'b', 'missing'] )
+        self.assertListEqual( list( results ), ['a', 'b', 'missing'] )
+        self.assertDictEqual( results['a'], self.hub.extractFromDb( 'db_1', 'a' ) )
+        self.assertIsInstance( results['missing'], KeyError )
+
+    def test_extractMany_databases(self):
+        results = self.hub.extractMany([ 'db_1', 'db_2' ])
+        self.assertTrue( all( isinstance( gluedb, db_module.Db ) for gluedb in results.values() ))
+
     def test_putToDb_and_deleteFromDb_persist_to_uri(self):
         """putToDb and deleteFromDb modify the URI-backed GlueDb and persist changes."""
         tempdir = tempfile.mkdtemp()
@@ -214,6 +226,125 @@ class TestDbHelpers( unittest.TestCase ):
             shutil.rmtree( tempdir )
 
 
+class TestMemberCache( unittest.TestCase ):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.uri = f'file://{ pathlib.Path( self.tempdir ) / "db_1.gluedb" }'
+        api.write( buildDB_1(), self.uri )
+
+        self.hub = hub_module.Hub()
+        self.hub.post( self.uri, name='db_1' )
+        self.hub.post( buildDB_2(), name='db_2' )
+
+    def tearDown(self):
+        shutil.rmtree( self.tempdir )
+
+    def member(self, dbName):
+        return self.hub._get_db_and_contents( dbName )[1]
+
+    def test_members_are_resolved_once(self):
+        self.assertIs( self.member( 'db_1' ), self.member( 'db_1' ))
+        self.assertIs( self.member( 'db_2' ), self.member( 'db_2' ))
+
+    def test_file_change_invalidates(self):
+        first = self.member( 'db_1' )
+        api.write( buildDB_2(), self.uri, overwrite=True )
+        self.assertIsNot( self.member( 'db_1' ), first )
+        self.assertDictEqual( self.hub.extractFromDb( 'db_1', 'c' ), {'d': 4, 'e': 5, 'f': 6} )
+
+    def test_write_through_invalidates(self):
+        first = self.member( 'db_1' )
+        self.hub.postToDb( collection.Dict({'x': 1}), 'db_1', name='x' )
+        self.assertIsNot( self.member( 'db_1' ), first )
+        self.assertDictEqual( self.hub.extractFromDb( 'db_1', 'x' ), {'x': 1} )
+
+    def test_hub_mutation_invalidates(self):
+        first = self.member( 'db_2' )
+        self.hub.put( buildDB_1(), name='db_2' )
+        self.assertListEqual( self.member( 'db_2' ).getNames(), ['a', 'b'] )
+        self.assertIsNot( self.member( 'db_2' ), first )
+
+    def test_refresh(self):
+        first = self.member( 'db_1' )
+        self.hub.refresh( 'db_1' )
+        self.assertIsNot( self.member( 'db_1' ), first )
+
+        second = self.member( 'db_1' )
+        self.hub.refresh()
+        self.assertIsNot( self.member( 'db_1' ), second )
+
+
+class TestBatch( unittest.TestCase ):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.uri = f'file://{ pathlib.Path( self.tempdir ) / "db_1.gluedb" }'
+        api.write( buildDB_1(), self.uri )
+
+        self.hub = hub_module.Hub()
+        self.hub.post( self.uri, name='db_1' )
+        self.hub.post( buildDB_2(), name='db_2' )
+
+    def tearDown(self):
+        shutil.rmtree( self.tempdir )
+
+    def test_batch_persists_once(self):
+        with mock.patch.object( db_module.Db, 'persistToFile', autospec=True, side_effect=db_module.Db.persistToFile ) as persist:
+            with self.hub.batch( 'db_1' ) as db:
+                for i in range( 5 ):
+                    db.post( collection.Dict({'i': i}), name=f'x{ i }' )
+                db.put( collection.Dict({'a': 100}), name='a' )
+                db.deleteByName( 'b' )
+
+        self.assertEqual( persist.call_count, 1 )
+        stored = api.read( self.uri )
+        self.assertListEqual( stored.getNames(), ['x0', 'x1', 'x2', 'x3', 'x4', 'a'] )
+        self.assertDictEqual( self.hub.extractFromDb( 'db_1', 'a' ), {'a': 100} )
+
+    def test_writes_through_are_version_checked(self):
+        other = db_module.Db.connect( self.uri, persist=True )
+
+        self.hub.postToDb( collection.Dict({'x': 1}), 'db_1', name='x' )
+        self.assertEqual( api.read( self.uri ).version, 1 )
+
+        other.post( collection.Dict({'y': 2}), name='y' )
+        with self.assertRaises( Conflict ):
+            other.persistToFile()
+        other.persistToFile( onConflict='merge' )
+
+        self.hub.deleteFromDb( 'db_1', 'a' )
+        stored = api.read( self.uri )
+        self.assertListEqual( stored.getNames(), ['b', 'x', 'y'] )
+        self.assertEqual( stored.version, 3 )
+
+    def test_batch_rolls_back(self):
+        with self.assertRaises( RuntimeError ):
+            with self.hub.batch( 'db_1' ) as db:
+                db.post( collection.Dict({'x': 1}), name='x' )
+                raise RuntimeError( 'abort' )
+
+        self.assertListEqual( api.read( self.uri ).getNames(), ['a', 'b'] )
+        self.assertListEqual( self.hub.extract( 'db_1' ).getNames(), ['a', 'b'] )
+
+    def test_batch_disposes_its_engine(self):
+        engines = []
+        def persist( target, **kw ):
+            engines.append( sqlModel.engine )
+
+        with mock.patch.object( db_module.Db, 'persistToFile', autospec=True, side_effect=persist ):
+            with self.hub.batch( 'db_1' ) as sqlModel:
+                sqlModel.post( collection.Dict({'x': 1}), name='x' )
+
+        self.assertListEqual( engines, [ None ] )
+
+    def test_batch_inline_db(self):
+        with self.hub.batch( 'db_2' ) as db:
+            db.post( collection.Dict({'x': 1}), name='x' )
+
+        self.assertDictEqual( self.hub.extractFromDb( 'db_2', 'x' ), {'x': 1} )
+
+
 class TestHubGuards( unittest.TestCase ):
     """Type-guard branches that reject invalid inputs."""
 
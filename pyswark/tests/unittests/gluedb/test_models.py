@@ -131,6 +131,38 @@ class TestIoModel(unittest.TestCase):
             written = json.load(f)
         self.assertEqual(written, data_dict)
 
+    def test_handler_bindings_are_memoized_until_a_field_changes(self):
+        """
+        IoModel resolves its read and write handlers once per instance.
+
+        Repeated extracts and loads reuse them; assigning a field, or
+        editing kw in place, rebinds on the next call.
+        """
+        first  = pathlib.Path(self.tempdir) / 'first.json'
+        second = pathlib.Path(self.tempdir) / 'second.json'
+        first.write_text(json.dumps({'a': 1}))
+        second.write_text(json.dumps({'a': 2}))
+
+        model  = IoModel.fromArgs(str(first), kwWrite={'overwrite': True})
+        reader = model.acquireExtract()
+        self.assertIs(model.acquireExtract(), reader)
+        self.assertIs(model._getExtractor(), model._getExtractor())
+        self.assertIs(model.acquireLoad(), model.acquireLoad())
+        self.assertEqual(model.extract(), {'a': 1})
+
+        model.uri = str(second)
+        self.assertIsNot(model.acquireExtract(), reader)
+        self.assertEqual(model.extract(), {'a': 2})
+
+        writer = model.acquireLoad()
+        model.kwWrite['overwrite'] = False
+        self.assertIsNot(model.acquireLoad(), writer)
+        self.assertEqual(model._getLoader().kw, {'overwrite': False})
+
+        copied = model.model_copy(update={'uri': str(first)})
+        self.assertEqual(copied.extract(), {'a': 1})
+        self.assertEqual(model.extract(), {'a': 2})
+
 
 if __name__ == '__main__':
     unittest.main()
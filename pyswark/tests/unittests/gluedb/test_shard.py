@@ -0,0 +1,180 @@
+import os
+import time
+import unittest
+import tempfile
+import shutil
+from typing import Any
+
+from pyswark.lib import enum
+from pyswark.lib.pydantic import base
+from pyswark.core.models import collection
+from pyswark.core.models.db import Conflict
+from pyswark.core.io import api
+
+from pyswark.gluedb import shard
+
+
+class Named( base.BaseModel ):
+    name : Any
+    i    : int
+
+
+class TestShardedDb( unittest.TestCase ):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.addCleanup( shutil.rmtree, self.tempdir )
+
+        self.url     = f'file://{ self.tempdir }/index.gluedb'
+        self.catalog = shard.ShardedDb( root=f'file://{ self.tempdir }', url=self.url, shards=4 )
+        for i in range( 20 ):
+            self.catalog.post( collection.Dict({ 'i': i }), name=f'n{ i }' )
+        self.catalog.flush()
+
+    def _files(self):
+        return sorted( f for f in os.listdir( self.tempdir ) if not f.endswith( '.lock' ))
+
+    def _mtimes(self):
+        return { f: os.stat( os.path.join( self.tempdir, f )).st_mtime_ns for f in self._files() }
+
+    def test_records_are_partitioned_across_shard_files(self):
+        self.assertEqual( self._files(), [ 'index.gluedb', 'shard-0.gluedb', 'shard-1.gluedb', 'shard-2.gluedb', 'shard-3.gluedb' ])
+
+        for i in range( 20 ):
+            key = self.catalog.shardOf( f'n{ i }' )
+            self.assertIn( f'n{ i }', api.read( f'file://{ self.tempdir }/{ key }.gluedb' ).getNames() )
+
+    def test_shards_are_read_lazily(self):
+        catalog = shard.ShardedDb.connect( self.url )
+        self.assertEqual( catalog._loaded, {} )
+
+        self.assertEqual( catalog.extract( 'n3' ), { 'i': 3 })
+        self.assertEqual( list( catalog._loaded ), [ catalog.shardOf( 'n3' ) ])
+
+        self.assertIsNone( catalog.get( 'missing' ))
+        self.assertNotIn( 'missing', catalog )
+        self.assertEqual( sorted( catalog.getNames() ), sorted( f'n{ i }' for i in range( 20 )))
+
+    def test_only_dirty_shards_are_written(self):
+        catalog = shard.ShardedDb.connect( self.url )
+        catalog.put( collection.Dict({ 'i': 99 }), name='n5' )
+        self.assertEqual( catalog._dirty, { catalog.shardOf( 'n5' ) })
+
+        before = self._mtimes()
+        time.sleep( 0.01 )
+        catalog.flush()
+        changed = [ f for f, mtime in self._mtimes().items() if mtime != before[ f ] ]
+        self.assertEqual( changed, [ f"{ catalog.shardOf( 'n5' ) }.gluedb" ])
+
+        self.assertEqual( shard.ShardedDb.connect( self.url ).extract( 'n5' ), { 'i': 99 })
+
+    def test_delete(self):
+        with shard.ShardedDb.connect( self.url, persist=True ) as catalog:
+            self.assertTrue( catalog.delete( 'n7' ))
+            self.assertFalse( catalog.delete( 'n7' ))
+            self.assertFalse( catalog.delete( 'missing' ))
+
+        self.assertIsNone( shard.ShardedDb.connect( self.url ).get( 'n7' ))
+
+    def test_shards_read_together_are_persisted(self):
+        other = shard.ShardedDb.connect( self.url )
+        other.get( 'n5' )
+
+        catalog = shard.ShardedDb.connect( self.url, onConflict='merge' )
+        catalog.getNames()
+        self.assertTrue( catalog.delete( 'n5' ))
+
+        other.delete( 'n7' ) # n7 shares the shard of n5
+        other.flush()
+        catalog.flush()
+
+        names = shard.ShardedDb.connect( self.url ).getNames()
+        self.assertNotIn( 'n5', names )
+        self.assertNotIn( 'n7', names )
+        self.assertEqual( len( names ), 18 )
+
+    def test_stale_shard_fails_or_merges(self):
+        first  = shard.ShardedDb.connect( self.url )
+        second = shard.ShardedDb.connect( self.url )
+        third  = shard.ShardedDb.connect( self.url, onConflict='merge' )
+        for catalog in [ first, second, third ]:
+            catalog.get( 'n5' )
+
+        first.put( collection.Dict({ 'i': 99 }), name='n5' )
+        first.flush()
+
+        second.put( collection.Dict({ 'i': 98 }), name='n5' )
+        with self.assertRaises( Conflict ):
+            second.flush()
+
+        third.put( collection.Dict({ 'i': 97 }), name='n7' ) # n7 shares the shard of n5
+        third.flush()
+
+        catalog = shard.ShardedDb.connect( self.url )
+        self.assertEqual( catalog.extract( 'n5' ), { 'i': 99 })
+        self.assertEqual( catalog.extract( 'n7' ), { 'i': 97 })
+
+    def test_shards_added_by_two_writers_are_both_indexed(self):
+        url     = f'file://{ self.tempdir }/prefixed.gluedb'
+        catalog = shard.ShardedDb( root=f'file://{ self.tempdir }/prefixed', url=url, partition='prefix' )
+        catalog.post( collection.Dict({ 'i': 0 }), name='AA' )
+        catalog.flush()
+
+        first, second = shard.ShardedDb.connect( url ), shard.ShardedDb.connect( url )
+        first.post( collection.Dict({ 'i': 1 }), name='BB' )
+        second.post( collection.Dict({ 'i': 2 }), name='CC' )
+        first.flush()
+        second.flush()
+
+        catalog = shard.ShardedDb.connect( url )
+        self.assertEqual( sorted( catalog.hub.getNames() ), [ 'prefix-AA', 'prefix-BB', 'prefix-CC' ])
+        self.assertEqual( catalog.extract( 'BB' ), { 'i': 1 })
+
+    def test_inline_shards_are_version_checked(self):
+        url = f'file://{ self.tempdir }/inline.gluedb'
+        catalog = shard.ShardedDb( url=url, shards=1 )
+        catalog.post( collection.Dict({ 'i': 0 }), name='a' )
+        catalog.flush()
+
+        first  = shard.ShardedDb.connect( url )
+        second = shard.ShardedDb.connect( url )
+        third  = shard.ShardedDb.connect( url, onConflict='merge' )
+        for catalog in [ first, second, third ]:
+            catalog.get( 'a' )
+
+        first.post( collection.Dict({ 'i': 1 }), name='b' )
+        first.flush()
+
+        second.post( collection.Dict({ 'i': 2 }), name='c' )
+        with self.assertRaises( Conflict ):
+            second.flush()
+
+        third.post( collection.Dict({ 'i': 3 }), name='d' )
+        third.flush()
+        self.assertEqual( sorted( shard.ShardedDb.connect( url ).getNames() ), [ 'a', 'b', 'd' ])
+
+    def test_names_from_obj_are_processed(self):
+        Name = enum.Enum.createDynamically({ 'n21': 'n21' })
+        self.catalog.post( Named( name=Name.n21, i=21 ))
+        self.assertEqual( self.catalog.get( 'n21' ).info.name, 'n21' )
+        self.assertEqual( self.catalog._dirty, { self.catalog.shardOf( 'n21' ) })
+
+    def test_post_needs_a_name(self):
+        with self.assertRaises( ValueError ):
+            self.catalog.post( collection.Dict({ 'i': 0 }))
+
+    def test_inline_shards_partitioned_by_prefix(self):
+        catalog = shard.ShardedDb( partition='prefix', prefix=2 )
+        catalog.post( collection.Dict({ 'a': 1 }), name='AB/x' )
+        catalog.post( collection.Dict({ 'a': 2 }), name='AB/y' )
+        catalog.post( collection.Dict({ 'a': 3 }), name='CD/x' )
+        catalog.flush()
+
+        self.assertEqual( catalog.shardOf( 'AB/x' ), 'prefix-AB' )
+        self.assertEqual( catalog.hub.getNames(), [ 'prefix-AB', 'prefix-CD' ])
+        self.assertEqual( catalog.hub.extract( 'prefix-AB' ).getNames(), [ 'AB/x', 'AB/y' ])
+        self.assertEqual( catalog.extract( 'CD/x' ), { 'a': 3 })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,10 @@
 import unittest
+import os
+import shutil
+import tempfile
 import numpy as np
 
-from pyswark.tensor.tensor import Tensor, Vector, Matrix
+from pyswark.tensor.tensor import Tensor, Vector, Matrix, Inputs
 from pyswark.lib.pydantic import ser_des
 
 
@@ -54,3 +57,45 @@ class MatrixTestCases(unittest.TestCase):
         with self.assertRaises( ValueError ):
             Matrix([1, 2, 3])
 
+    def test_ndarray_is_copied(self):
+        x = np.zeros(( 2, 2 ))
+        model = Matrix( x )
+        x[0, 0] = 99
+        self.assertEqual( model.matrix[0, 0], 0.0 )
+
+    def test_ndarray_is_shared_on_request(self):
+        x = np.zeros(( 2, 2 ))
+        model = Matrix( Inputs( data=x, copyData=False ))
+        x[0, 0] = 99
+        self.assertEqual( model.matrix[0, 0], 99.0 )
+        self.assertNotIn( 'copyData', ser_des.toJson( model ))
+
+
+class NpyTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.uri     = os.path.join( self.tempdir, 'matrix.npy' )
+
+    def tearDown(self):
+        shutil.rmtree( self.tempdir )
+
+    def test_write_read(self):
+        model = Matrix( np.arange( 6 ).reshape( 2, 3 ) )
+        model.write( self.uri )
+
+        des = Matrix.read( self.uri )
+        np.testing.assert_array_equal( model.matrix, des.matrix )
+
+    def test_read_mmap(self):
+        Matrix( np.arange( 6 ).reshape( 2, 3 ) ).write( self.uri )
+
+        model = Matrix.read( self.uri, mmap_mode='r' )
+        self.assertIsInstance( model.matrix, np.memmap )
+        self.assertTupleEqual( model.shape, (2, 3) )
+
+        des = ser_des.fromJson( ser_des.toJson( model ) )
+        np.testing.assert_array_equal( model.matrix, des.matrix )
+
+        with self.assertRaises( ValueError ):
+            Vector.read( self.uri, mmap_mode='r' )